@@ -1,10 +1,13 @@
+from rest_framework import serializers
+
 from core.choices import *
-from core.models import Job
+from core.models import Job, JobLogEntry
 from netbox.api.fields import ChoiceField, ContentTypeField
 from netbox.api.serializers import BaseModelSerializer
 from users.api.serializers_.users import UserSerializer
 
 __all__ = (
+    'JobLogEntrySerializer',
     'JobSerializer',
 )
 
@@ -23,6 +26,15 @@ class JobSerializer(BaseModelSerializer):
         model = Job
         fields = [
             'id', 'url', 'display_url', 'display', 'object_type', 'object_id', 'name', 'status', 'created', 'scheduled',
-            'interval', 'started', 'completed', 'user', 'data', 'error', 'job_id',
+            'interval', 'started', 'completed', 'user', 'data', 'error', 'job_id', 'parent',
         ]
         brief_fields = ('url', 'created', 'completed', 'user', 'status')
+
+
+class JobLogEntrySerializer(serializers.ModelSerializer):
+
+    class Meta:
+        model = JobLogEntry
+        fields = [
+            'id', 'time', 'level', 'message', 'object_repr', 'url',
+        ]
@@ -8,7 +8,7 @@ from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema
 from rest_framework import viewsets
 from rest_framework.decorators import action
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
 from rest_framework.routers import APIRootView
@@ -71,6 +71,27 @@ class JobViewSet(ReadOnlyModelViewSet):
     serializer_class = serializers.JobSerializer
     filterset_class = filtersets.JobFilterSet
 
+    @extend_schema(responses={200: serializers.JobLogEntrySerializer(many=True)})
+    @action(detail=True)
+    def log(self, request, pk):
+        """
+        Retrieve the log entries recorded by a job. Specify the ID of a log entry as `after` to retrieve only entries
+        recorded subsequently (e.g. to poll for new entries while the job is running).
+        """
+        job = get_object_or_404(self.get_queryset(), pk=pk)
+        log_entries = job.log_entries.all()
+
+        if after := request.GET.get('after'):
+            try:
+                log_entries = log_entries.filter(pk__gt=int(after))
+            except ValueError:
+                raise ValidationError({'after': _("Must be an integer.")})
+
+        page = self.paginate_queryset(log_entries)
+        serializer = serializers.JobLogEntrySerializer(page, many=True)
+
+        return self.get_paginated_response(serializer.data)
+
 
 class ObjectChangeViewSet(ReadOnlyModelViewSet):
     """
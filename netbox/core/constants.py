@@ -4,9 +4,37 @@ from django.utils.translation import gettext_lazy as _
 from rq.job import JobStatus
 
 __all__ = (
+    'CHANGELOG_PARTITION_BATCH_SIZE',
+    'CHANGELOG_PARTITIONS_AHEAD',
+    'DATA_SYNC_BATCH_SIZE',
+    'DATA_SYNC_WORKERS',
+    'HOUSEKEEPING_BATCH_PAUSE',
+    'JOB_LOG_BATCH_SIZE',
+    'JOB_LOG_FLUSH_INTERVAL',
     'RQ_TASK_STATUSES',
 )
 
+# The number of changelog records to copy at a time when partitioning the changelog table
+CHANGELOG_PARTITION_BATCH_SIZE = 10000
+
+# The number of months in advance for which changelog partitions are created
+CHANGELOG_PARTITIONS_AHEAD = 3
+
+# The number of DataFiles to read from disk & write to the database at a time during synchronization
+DATA_SYNC_BATCH_SIZE = 100
+
+# The number of threads among which files are read & hashed during synchronization
+DATA_SYNC_WORKERS = 8
+
+# The number of seconds to wait between batches of expired records deleted during housekeeping
+HOUSEKEEPING_BATCH_PAUSE = 0.5
+
+# The maximum number of job log entries to write to the database at a time
+JOB_LOG_BATCH_SIZE = 1000
+
+# The maximum number of seconds for which job log entries are buffered before being written to the database
+JOB_LOG_FLUSH_INTERVAL = 2
+
 
 @dataclass
 class Status:
@@ -1,12 +1,19 @@
+import fcntl
+import hashlib
+import json
 import logging
 import os
 import re
+import shutil
+import stat
 import tempfile
-from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
 from urllib.parse import urlparse
 
 from django import forms
+from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from django.utils.translation import gettext as _
 
@@ -15,6 +22,7 @@ from netbox.utils import register_data_backend
 from utilities.constants import HTTP_PROXY_SUPPORTED_SCHEMAS, HTTP_PROXY_SUPPORTED_SOCK_SCHEMAS
 from utilities.proxy import resolve_proxies
 from utilities.socks import ProxyPoolManager
+from .constants import DATA_SYNC_WORKERS
 from .exceptions import SyncError
 
 __all__ = (
@@ -26,6 +34,14 @@ __all__ = (
 logger = logging.getLogger('netbox.data_backends')
 
 
+def get_cache_path(prefix, *components):
+    """
+    Return the path within DATA_SOURCE_CACHE_PATH at which a backend may persist data, unique to the given components.
+    """
+    digest = hashlib.sha256(json.dumps([str(c) for c in components]).encode()).hexdigest()
+    return Path(settings.DATA_SOURCE_CACHE_PATH) / f'{prefix}-{digest}'
+
+
 @register_data_backend()
 class LocalBackend(DataBackend):
     name = 'local'
@@ -65,6 +81,9 @@ class GitBackend(DataBackend):
     }
     sensitive_parameters = ['password']
 
+    # The ref within a mirror which records the commit reflected by its working tree
+    MIRROR_TREE_REF = b'refs/netbox/tree'
+
     def init_config(self):
         from dulwich.config import ConfigDict
 
@@ -85,30 +104,46 @@ class GitBackend(DataBackend):
 
         return config
 
-    @contextmanager
-    def fetch(self):
-        from dulwich import porcelain
-
-        local_path = tempfile.TemporaryDirectory()
-
-        clone_args = {
-            "branch": self.params.get('branch'),
+    def get_client_args(self):
+        """
+        Return the keyword arguments for establishing a connection to the remote repository.
+        """
+        client_args = {
             "config": self.config,
-            "errstream": porcelain.NoneStream(),
         }
 
         # check if using socks for proxy - if so need to use custom pool_manager
         if self.socks_proxy:
-            clone_args['pool_manager'] = ProxyPoolManager(self.socks_proxy)
+            client_args['pool_manager'] = ProxyPoolManager(self.socks_proxy)
 
         if self.url_scheme in ('http', 'https'):
             if self.params.get('username'):
-                clone_args.update(
+                client_args.update(
                     {
                         "username": self.params.get('username'),
                         "password": self.params.get('password'),
                     }
                 )
+
+        return client_args
+
+    @contextmanager
+    def fetch(self):
+        # Maintain a persistent mirror of the repository, if enabled
+        if settings.DATA_SOURCE_CACHE_PATH and self.cache_key is not None:
+            with self.fetch_mirror() as local_path:
+                yield local_path
+            return
+
+        from dulwich import porcelain
+
+        local_path = tempfile.TemporaryDirectory()
+
+        clone_args = {
+            "branch": self.params.get('branch'),
+            "errstream": porcelain.NoneStream(),
+            **self.get_client_args(),
+        }
         if self.url_scheme:
             clone_args["quiet"] = True
             clone_args["depth"] = 1
@@ -123,6 +158,143 @@ class GitBackend(DataBackend):
 
         local_path.cleanup()
 
+    @contextmanager
+    def fetch_mirror(self):
+        """
+        Incrementally fetch the latest commit of the branch into a persistent bare repository, and update the working
+        tree maintained alongside it. The fetched commit is recorded as `revision`. If the previously synchronized
+        commit (`synced_revision`) is present in the repository, the paths which have changed since are recorded as
+        `changed_paths`; otherwise, this is None and the working tree must be scanned in its entirety.
+        """
+        from dulwich.client import get_transport_and_path
+        from dulwich.repo import Repo
+
+        mirror_path = get_cache_path('git', self.cache_key, self.url, self.params.get('branch'))
+        repo_path = mirror_path / 'repo'
+        tree_path = mirror_path / 'tree'
+        mirror_path.mkdir(parents=True, exist_ok=True)
+
+        # Hold an exclusive lock on the mirror until the sync has completed, to prevent concurrent modification
+        with open(mirror_path / 'lock', 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+            if repo_path.exists():
+                repo = Repo(str(repo_path))
+            else:
+                repo_path.mkdir()
+                repo = Repo.init_bare(str(repo_path))
+
+            try:
+                if branch := self.params.get('branch'):
+                    ref = f'refs/heads/{branch}'.encode()
+                else:
+                    ref = b'HEAD'
+                wanted = {}
+
+                def determine_wants(refs, depth=None):
+                    if ref not in refs:
+                        raise SyncError(_("Branch not found in remote repository: {ref}").format(ref=ref.decode()))
+                    wanted['commit'] = refs[ref]
+                    return [] if refs[ref] in repo.object_store else [refs[ref]]
+
+                logger.debug(f"Fetching git repo: {self.url} (mirror at {mirror_path})")
+                try:
+                    client, path = get_transport_and_path(self.url, **self.get_client_args())
+                    client.fetch(path, repo, determine_wants=determine_wants, depth=1 if self.url_scheme else None)
+                except SyncError:
+                    raise
+                except BaseException as e:
+                    raise SyncError(
+                        _("Fetching remote data failed ({name}): {error}").format(name=type(e).__name__, error=e)
+                    )
+
+                commit = repo[wanted['commit']]
+                self._update_mirror_tree(repo, tree_path, commit)
+                self.revision = commit.id.decode()
+                self.changed_paths = self._get_changed_paths(repo, self.synced_revision, commit)
+                logger.debug(f"Updated working tree to commit {self.revision}")
+
+                yield str(tree_path)
+            finally:
+                repo.close()
+
+    @staticmethod
+    def _get_commit(repo, sha):
+        """
+        Return the commit with the given ID from the repository, or None if it is not present.
+        """
+        try:
+            commit = repo[sha]
+        except (KeyError, ValueError):
+            return None
+        return commit if commit.type_name == b'commit' else None
+
+    def _update_mirror_tree(self, repo, tree_path, commit):
+        """
+        Bring the mirror's working tree up to date with the given commit. The working tree is rebuilt from scratch if
+        the commit which it reflects is unknown (e.g. because a previous update failed).
+        """
+        try:
+            tree_commit = self._get_commit(repo, repo.refs[self.MIRROR_TREE_REF])
+        except KeyError:
+            tree_commit = None
+        if tree_commit is not None and tree_commit.id == commit.id:
+            return
+
+        # Invalidate the working tree until it has been updated successfully
+        if tree_commit is not None:
+            repo.refs.remove_if_equals(self.MIRROR_TREE_REF, None)
+        else:
+            shutil.rmtree(tree_path, ignore_errors=True)
+            tree_path.mkdir()
+        self._update_working_tree(repo, tree_path, tree_commit.tree if tree_commit else None, commit.tree)
+        repo.refs[self.MIRROR_TREE_REF] = commit.id
+
+    def _get_changed_paths(self, repo, synced_revision, commit):
+        """
+        Return the set of paths which differ between the previously synchronized commit and the given commit, or None
+        if the previously synchronized commit is unknown.
+        """
+        from dulwich.diff_tree import tree_changes
+
+        if not synced_revision or (synced_commit := self._get_commit(repo, synced_revision.encode())) is None:
+            return None
+
+        changed_paths = set()
+        for change in tree_changes(repo.object_store, synced_commit.tree, commit.tree):
+            for entry in (change.old, change.new):
+                if path := getattr(entry, 'path', None):
+                    changed_paths.add(os.fsdecode(path))
+
+        return changed_paths
+
+    @staticmethod
+    def _update_working_tree(repo, tree_path, old_tree, new_tree):
+        """
+        Apply the changes between two trees to the working tree.
+        """
+        from dulwich.diff_tree import tree_changes
+        from dulwich.objects import S_ISGITLINK
+
+        for change in tree_changes(repo.object_store, old_tree, new_tree):
+            # Removed entries are represented as None (or as an entry with a null path in older releases of dulwich)
+            if old_path := getattr(change.old, 'path', None):
+                try:
+                    os.remove(tree_path / os.fsdecode(old_path))
+                except FileNotFoundError:
+                    pass
+            if new_path := getattr(change.new, 'path', None):
+                # Skip submodules
+                if S_ISGITLINK(change.new.mode):
+                    continue
+                file_path = tree_path / os.fsdecode(new_path)
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                data = repo[change.new.sha].as_raw_string()
+                if stat.S_ISLNK(change.new.mode):
+                    os.symlink(os.fsdecode(data), file_path)
+                else:
+                    file_path.write_bytes(data)
+
 
 @register_data_backend()
 class S3Backend(DataBackend):
@@ -152,33 +324,103 @@ class S3Backend(DataBackend):
 
     @contextmanager
     def fetch(self):
+        """
+        Download the bucket's contents. If a persistent copy is maintained, only objects which have been added or
+        modified since they were last downloaded are fetched. The digest of the bucket's manifest (the ETag & size of
+        each object) is recorded as `revision`. If the manifest as of the previous successful sync matches
+        `synced_revision`, the paths which have changed since are recorded as `changed_paths`.
+        """
         import boto3
 
-        local_path = tempfile.TemporaryDirectory()
-
-        # Initialize the S3 resource and bucket
-        aws_access_key_id = self.params.get('aws_access_key_id')
-        aws_secret_access_key = self.params.get('aws_secret_access_key')
-        s3 = boto3.resource(
-            's3',
-            region_name=self._region_name,
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key,
-            config=self.config,
-            endpoint_url=self._endpoint_url
-        )
-        bucket = s3.Bucket(self._bucket_name)
-
-        # Download all files within the specified path
-        for obj in bucket.objects.filter(Prefix=self._remote_path):
-            local_filename = os.path.join(local_path.name, obj.key)
-            # Build local path
-            Path(os.path.dirname(local_filename)).mkdir(parents=True, exist_ok=True)
-            bucket.download_file(obj.key, local_filename)
-
-        yield local_path.name
-
-        local_path.cleanup()
+        with ExitStack() as stack:
+            # Maintain a persistent copy of the bucket's contents, if enabled
+            if settings.DATA_SOURCE_CACHE_PATH and self.cache_key is not None:
+                local_path = get_cache_path('s3', self.cache_key, self.url)
+                manifest_path = local_path.with_suffix('.json')
+                local_path.mkdir(parents=True, exist_ok=True)
+
+                # Hold an exclusive lock on the local copy until the sync has completed, to prevent concurrent
+                # modification
+                lock_file = stack.enter_context(open(local_path.with_suffix('.lock'), 'w'))
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            else:
+                local_path = Path(stack.enter_context(tempfile.TemporaryDirectory()))
+                manifest_path = None
+
+            # The manifest records the ETag & size of each object downloaded, as well as of each object as of the last
+            # successful sync
+            manifest = {}
+            if manifest_path and manifest_path.exists():
+                manifest = json.loads(manifest_path.read_text())
+            downloaded = manifest.get('objects', {})
+            synced = manifest.get('synced')
+
+            # Initialize the S3 resource and bucket
+            aws_access_key_id = self.params.get('aws_access_key_id')
+            aws_secret_access_key = self.params.get('aws_secret_access_key')
+            s3 = boto3.resource(
+                's3',
+                region_name=self._region_name,
+                aws_access_key_id=aws_access_key_id,
+                aws_secret_access_key=aws_secret_access_key,
+                config=self.config,
+                endpoint_url=self._endpoint_url
+            )
+            bucket = s3.Bucket(self._bucket_name)
+
+            # List all files within the specified path
+            objects = {
+                obj.key: [obj.e_tag, obj.size]
+                for obj in bucket.objects.filter(Prefix=self._remote_path)
+                if not obj.key.endswith('/')
+            }
+
+            # Delete any local files which no longer exist in the bucket
+            for key in downloaded.keys() - objects.keys():
+                try:
+                    os.remove(local_path / key)
+                except FileNotFoundError:
+                    pass
+
+            # Download any files which have been added or modified (per their ETag & size) since they were last
+            # downloaded
+            def download(key):
+                local_filename = local_path / key
+                local_filename.parent.mkdir(parents=True, exist_ok=True)
+                # The S3 client (unlike the resource) is thread-safe
+                s3.meta.client.download_file(self._bucket_name, key, str(local_filename))
+
+            keys = [
+                key for key, meta in objects.items()
+                if downloaded.get(key) != meta or not (local_path / key).is_file()
+            ]
+            logger.debug(f"Downloading {len(keys)} of {len(objects)} files")
+            with ThreadPoolExecutor(max_workers=DATA_SYNC_WORKERS) as executor:
+                # Consume the results to propagate any exceptions
+                list(executor.map(download, keys))
+            if manifest_path:
+                manifest_path.write_text(json.dumps({'objects': objects, 'synced': synced}))
+
+            # Determine which files have changed since the last successful sync. The manifest recorded locally can be
+            # relied upon only if it reflects the state of the bucket as of the consumer's last sync.
+            self.revision = self._get_manifest_digest(objects)
+            if synced is not None and self.synced_revision == self._get_manifest_digest(synced):
+                self.changed_paths = {
+                    key for key in objects.keys() | synced.keys() if objects.get(key) != synced.get(key)
+                }
+
+            yield str(local_path)
+
+            # Record the state of the bucket as of this (successful) sync
+            if manifest_path:
+                manifest_path.write_text(json.dumps({'objects': objects, 'synced': objects}))
+
+    @staticmethod
+    def _get_manifest_digest(objects):
+        """
+        Return a digest of the given mapping of object keys to their ETags & sizes.
+        """
+        return hashlib.sha256(json.dumps(objects, sort_keys=True).encode()).hexdigest()
 
     @property
     def _region_name(self):
@@ -120,6 +120,10 @@ class JobFilterSet(BaseFilterSet):
         choices=JobStatusChoices,
         null_value=None
     )
+    parent_id = django_filters.ModelMultipleChoiceFilter(
+        queryset=Job.objects.all(),
+        label=_('Parent job (ID)'),
+    )
 
     class Meta:
         model = Job
@@ -18,7 +18,7 @@ __all__ = (
 
 @strawberry_django.type(
     models.DataFile,
-    exclude=['data',],
+    exclude=['data', 'blob'],
     filters=DataFileFilter,
     pagination=True
 )
@@ -1,14 +1,37 @@
+import io
 import logging
+import re
 import requests
 import sys
+import tempfile
+import threading
+from contextlib import ExitStack
+from datetime import timedelta
+from importlib import import_module
+from itertools import islice
 
 from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db import connections, router, transaction
+from django.forms import ValidationError
+from django.utils import timezone
+from netbox.config import Config
+from netbox.context import events_queue
 from netbox.jobs import JobRunner, system_job
+from netbox.registry import registry
 from netbox.search.backends import search_backend
+from extras.events import flush_events
+from utilities.bulk import bulk_delete
+from utilities.constants import BULK_DELETE_BATCH_SIZE, IMPORT_CHUNK_SIZE
+from utilities.exceptions import AbortTransaction
+from utilities.forms.bulk_import import iter_import_records
 from utilities.proxy import resolve_proxies
 from .choices import DataSourceStatusChoices, JobIntervalChoices
-from .exceptions import SyncError
-from .models import DataSource
+from .constants import HOUSEKEEPING_BATCH_PAUSE
+from .exceptions import JobFailed, SyncError
+from .models import DataBlob, DataSource, Job, JobLogEntry, ObjectChange
+from .partitioning import create_partitions, drop_expired_partitions, is_partitioned
 
 logger = logging.getLogger(__name__)
 
@@ -36,10 +59,10 @@ class SyncDataSourceJob(JobRunner):
         datasource = DataSource.objects.get(pk=self.job.object_id)
 
         try:
-            datasource.sync()
+            changed_files = datasource.sync()
 
-            # Update the search cache for DataFiles belonging to this source
-            search_backend.cache(datasource.datafiles.iterator())
+            # Update the search cache for any DataFiles which have changed
+            search_backend.cache(datasource.datafiles.filter(path__in=changed_files).defer('data').iterator())
 
         except Exception as e:
             DataSource.objects.filter(pk=datasource.pk).update(status=DataSourceStatusChoices.FAILED)
@@ -48,6 +71,159 @@ class SyncDataSourceJob(JobRunner):
             raise e
 
 
+class ExportObjectsJob(JobRunner):
+    """
+    Perform an export from an object list view in the background, and save the result to the default storage backend
+    for later download.
+    """
+
+    class Meta:
+        name = 'Export Objects'
+
+    def run(self, view, request, *args, **kwargs):
+        """
+        Args:
+            view: The ObjectListView class which handles the export
+            request: A copy of the request which initiated the export
+        """
+        view = view()
+        view.setup(request)
+        view.queryset = view.get_queryset(request).restrict(request.user, 'view')
+        response = view.get(request)
+        if response.status_code != 200:
+            raise JobFailed()
+
+        # Determine the file name from the response (if given)
+        filename = 'export'
+        if match := re.search(r'filename="(.+)"', response.get('Content-Disposition', '')):
+            filename = match.group(1)
+
+        # Spool the (potentially streamed) content to a temporary file before saving it to storage
+        content = response.streaming_content if response.streaming else [response.content]
+        with tempfile.TemporaryFile() as f:
+            for chunk in content:
+                f.write(chunk)
+            size = f.tell()
+            path = default_storage.save(f'exports/{self.job.job_id}/{filename}', File(f, name=filename))
+
+        self.job.data = {
+            'export_file': path,
+            'filename': filename,
+            'content_type': response.get('Content-Type'),
+            'size': size,
+        }
+
+
+class ImportObjectsJob(JobRunner):
+    """
+    Import objects in the background from data saved to the default storage backend. Records are parsed incrementally
+    and imported in chunks, with progress and any errors recorded in the job's data.
+    """
+
+    class Meta:
+        name = 'Import Objects'
+
+    def run(self, view, request, path, format, csv_delimiter=None, chunk_size=None, *args, **kwargs):
+        """
+        Args:
+            view: The view class which handles the import (a BulkImportView or an API viewset)
+            request: A copy of the request which initiated the import
+            path: The path to the import data within the default storage backend
+            format: The format of the import data (CSV, JSON, or YAML)
+            csv_delimiter: The CSV delimiter (if applicable)
+            chunk_size: The number of records to commit at a time. If None, all records are imported within a single
+                transaction (i.e. all or nothing).
+        """
+        view = view()
+        view.setup(request)
+        view.queryset = view.queryset.restrict(request.user, 'add')
+        model = view.queryset.model
+
+        # If the Job has been committed, progress can be recorded independently of the import's transaction(s)
+        self.isolate_progress = not transaction.get_connection(router.db_for_write(Job)).in_atomic_block
+
+        self.job.data = {
+            'processed': 0,
+            'imported': 0,
+            'errors': [],
+        }
+
+        try:
+            with ExitStack() as stack:
+                # Record changes & queue events as they would be for the original request
+                for request_processor in registry['request_processors']:
+                    stack.enter_context(request_processor(request))
+
+                with default_storage.open(path, 'rb') as f:
+                    stream = io.TextIOWrapper(f, encoding='utf-8-sig', newline='')
+                    if chunk_size:
+                        self.import_chunks(view, request, stream, format, csv_delimiter, chunk_size, commit=True)
+                    else:
+                        try:
+                            with transaction.atomic(using=router.db_for_write(model)):
+                                self.import_chunks(
+                                    view, request, stream, format, csv_delimiter, IMPORT_CHUNK_SIZE, commit=False
+                                )
+                                if self.job.data['errors']:
+                                    raise AbortTransaction()
+                        except AbortTransaction:
+                            self.job.data['imported'] = 0
+                            events_queue.set({})
+        finally:
+            default_storage.delete(path)
+
+        if self.job.data['errors']:
+            raise JobFailed()
+
+    def import_chunks(self, view, request, stream, format, csv_delimiter, chunk_size, commit):
+        """
+        Import records from the stream in chunks, each within its own transaction (or savepoint, if commit is False). A
+        chunk in which any record fails is rolled back in its entirety, and its errors are recorded.
+        """
+        try:
+            headers, records = iter_import_records(stream, format, csv_delimiter)
+            while chunk := list(islice(records, chunk_size)):
+                start = self.job.data['processed'] + 1
+                objects, errors = view.import_records(chunk, request, headers=headers, start=start)
+                self.job.data['processed'] += len(chunk)
+                if errors:
+                    self.job.data['errors'].extend(errors)
+                else:
+                    self.job.data['imported'] += len(objects)
+
+                # Once a chunk has been committed (or rolled back), process (or discard) any events queued for it
+                if commit:
+                    if not errors and (events := list(events_queue.get().values())):
+                        flush_events(events)
+                    events_queue.set({})
+                self.save_progress()
+        except ValidationError as e:
+            # Invalid data (e.g. malformed CSV/JSON/YAML)
+            self.job.data['errors'].extend(e.messages)
+
+    def save_progress(self):
+        """
+        Save the job's current data. While the import is running within a transaction (i.e. an all-or-nothing import),
+        the data is written by a separate thread using its own database connection (as with JobLogWriter), so that
+        progress is visible to other sessions immediately.
+        """
+        using = router.db_for_write(Job)
+        if not self.isolate_progress or not transaction.get_connection(using).in_atomic_block:
+            Job.objects.using(using).filter(pk=self.job.pk).update(data=self.job.data)
+            return
+
+        def _write():
+            try:
+                Job.objects.using(using).filter(pk=self.job.pk).update(data=self.job.data)
+            finally:
+                # Close the database connection opened by this thread
+                connections.close_all()
+
+        thread = threading.Thread(target=_write, daemon=True)
+        thread.start()
+        thread.join()
+
+
 @system_job(interval=JobIntervalChoices.INTERVAL_DAILY)
 class SystemHousekeepingJob(JobRunner):
     """
@@ -61,9 +237,91 @@ class SystemHousekeepingJob(JobRunner):
         if settings.DEBUG or 'test' in sys.argv:
             return
 
-        # TODO: Migrate other housekeeping functions from the `housekeeping` management command.
+        config = Config()
+        self.clear_expired_sessions()
+        if is_partitioned():
+            create_partitions()
+        if config.CHANGELOG_RETENTION:
+            cutoff = timezone.now() - timedelta(days=config.CHANGELOG_RETENTION)
+            self.delete_expired_changes(
+                cutoff,
+                callback=lambda count: logger.info(f"Deleted {count} expired changelog records")
+            )
+        if config.JOB_RETENTION:
+            cutoff = timezone.now() - timedelta(days=config.JOB_RETENTION)
+            self.delete_expired_jobs(
+                cutoff,
+                callback=lambda count: logger.info(f"Deleted {count} expired jobs")
+            )
+        DataBlob.delete_orphans()
+        # TODO: Migrate the release check from the `housekeeping` management command.
         self.send_census_report()
 
+    @staticmethod
+    def clear_expired_sessions():
+        """
+        Clear expired authentication sessions (if supported by the configured session engine).
+        """
+        engine = import_module(settings.SESSION_ENGINE)
+        try:
+            engine.SessionStore.clear_expired()
+        except NotImplementedError:
+            pass
+
+    @staticmethod
+    def delete_expired_changes(cutoff, batch_size=BULK_DELETE_BATCH_SIZE, pause=HOUSEKEEPING_BATCH_PAUSE,
+                               callback=None):
+        """
+        Delete all changelog records created prior to the cutoff time in batches. If the changelog table has been
+        partitioned, any partitions which hold only expired records are dropped first. Returns the number of records
+        deleted.
+        """
+        deleted_count = drop_expired_partitions(cutoff) if is_partitioned() else 0
+        if deleted_count and callback:
+            callback(deleted_count)
+
+        def _callback(count):
+            if callback:
+                callback(deleted_count + count)
+
+        return deleted_count + bulk_delete(
+            ObjectChange.objects.filter(time__lt=cutoff),
+            batch_size=batch_size,
+            pause=pause,
+            callback=_callback
+        )
+
+    @staticmethod
+    def delete_expired_jobs(cutoff, batch_size=BULK_DELETE_BATCH_SIZE, pause=HOUSEKEEPING_BATCH_PAUSE,
+                            callback=None):
+        """
+        Delete all jobs created prior to the cutoff time in batches. Returns the number of jobs deleted.
+        """
+        expired_jobs = Job.objects.filter(created__lt=cutoff)
+
+        # Delete the jobs' log entries first, so that they need not be collected for deletion along with each job
+        bulk_delete(JobLogEntry.objects.filter(job__created__lt=cutoff), batch_size=batch_size, pause=pause)
+
+        # Jobs which have produced a file are deleted normally, so that the file is removed from storage
+        deleted_count = bulk_delete(
+            expired_jobs.filter(data__has_key='export_file'),
+            batch_size=batch_size,
+            pause=pause,
+            raw=False,
+            callback=callback
+        )
+
+        def _callback(count):
+            if callback:
+                callback(deleted_count + count)
+
+        return deleted_count + bulk_delete(
+            expired_jobs,
+            batch_size=batch_size,
+            pause=pause,
+            callback=_callback
+        )
+
     @staticmethod
     def send_census_report():
         """
@@ -0,0 +1,43 @@
+from itertools import islice
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django_pglocks import advisory_lock
+
+from core.constants import DATA_SYNC_BATCH_SIZE
+from core.models import DataBlob, DataFile
+from netbox.constants import ADVISORY_LOCK_KEYS
+
+
+class Command(BaseCommand):
+    help = "Move the content of existing data files to the store designated by DATA_FILE_STORE"
+
+    def handle(self, *args, **options):
+
+        # Find DataFiles whose content is not held in the configured store
+        if settings.DATA_FILE_STORE:
+            datafiles = DataFile.objects.filter(blob__isnull=True)
+        else:
+            datafiles = DataFile.objects.filter(blob__isnull=False)
+        datafile_ids = list(datafiles.values_list('pk', flat=True))
+        self.stdout.write(f"Moving the content of {len(datafile_ids)} data files...")
+
+        moved_count = 0
+        datafile_ids = iter(datafile_ids)
+        while batch := list(islice(datafile_ids, DATA_SYNC_BATCH_SIZE)):
+            datafiles = list(DataFile.objects.filter(pk__in=batch).select_related('blob'))
+            for datafile in datafiles:
+                datafile.data = datafile.read_data()
+                datafile.blob = None
+            with advisory_lock(ADVISORY_LOCK_KEYS['data-blobs'], shared=True):
+                if settings.DATA_FILE_STORE:
+                    DataBlob.store(datafiles)
+                moved_count += DataFile.objects.bulk_update(datafiles, ('data', 'blob'))
+            self.stdout.write(f"  Moved {moved_count} data files")
+            self.stdout.flush()
+
+        # Delete any stored content which is no longer referenced
+        deleted_count = DataBlob.delete_orphans()
+        self.stdout.write(f"Deleted {deleted_count} unreferenced blobs")
+
+        self.stdout.write("Finished.")
@@ -0,0 +1,54 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.constants import CHANGELOG_PARTITION_BATCH_SIZE, CHANGELOG_PARTITIONS_AHEAD
+from core.models import ObjectChange
+from core.partitioning import get_partitions, is_partitioned, partition_changelog
+
+
+class Command(BaseCommand):
+    help = "Convert the changelog table to a table partitioned by month"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=CHANGELOG_PARTITION_BATCH_SIZE,
+            help="The number of changelog records to copy at a time"
+        )
+        parser.add_argument(
+            '--months-ahead', type=int, default=CHANGELOG_PARTITIONS_AHEAD,
+            help="The number of months in advance for which partitions are created"
+        )
+        parser.add_argument(
+            '--no-input', action='store_false', dest='interactive',
+            help="Do not prompt for confirmation"
+        )
+
+    def handle(self, *args, **options):
+        if is_partitioned():
+            raise CommandError("The changelog table has already been partitioned.")
+
+        total = ObjectChange.objects.count()
+        if options['interactive']:
+            self.stdout.write(
+                f"This will copy {total} changelog records to a new partitioned table and drop the original table. "
+                f"Writes to the changelog will be blocked briefly while waiting for transactions in progress to "
+                f"complete and while the tables are swapped.",
+                self.style.WARNING
+            )
+            confirm = input("Type yes to proceed: ")
+            if confirm != 'yes':
+                raise CommandError("Aborted.")
+
+        def callback(count):
+            self.stdout.write(f"\tCopied {count}/{total} records")
+            self.stdout.flush()
+
+        copied_count = partition_changelog(
+            months_ahead=options['months_ahead'],
+            batch_size=options['batch_size'],
+            callback=callback if options['verbosity'] else None
+        )
+        partitions = get_partitions()
+        self.stdout.write(
+            f"Copied {copied_count} records to {len(partitions)} monthly partitions.",
+            self.style.SUCCESS
+        )
@@ -0,0 +1,42 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0015_remove_redundant_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DataBlob',
+            fields=[
+                ('hash', models.CharField(editable=False, max_length=64, primary_key=True, serialize=False)),
+                ('size', models.PositiveIntegerField(editable=False)),
+                ('data', models.BinaryField(blank=True, null=True)),
+                ('created', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'data blob',
+                'verbose_name_plural': 'data blobs',
+            },
+        ),
+        migrations.AlterField(
+            model_name='datafile',
+            name='data',
+            field=models.BinaryField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='datafile',
+            name='blob',
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name='datafiles',
+                to='core.datablob',
+            ),
+        ),
+    ]
@@ -0,0 +1,38 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0016_datablob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobLogEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False)),
+                ('time', models.DateTimeField()),
+                ('level', models.CharField(max_length=30)),
+                ('message', models.TextField()),
+                ('object_repr', models.TextField(blank=True)),
+                ('url', models.CharField(blank=True, max_length=200)),
+                (
+                    'job',
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='log_entries',
+                        to='core.job',
+                    ),
+                ),
+            ],
+            options={
+                'verbose_name': 'job log entry',
+                'verbose_name_plural': 'job log entries',
+                'ordering': ('job', 'pk'),
+                'indexes': [models.Index(fields=['job', 'id'], name='core_joblog_job_id_8548a3_idx')],
+            },
+        ),
+    ]
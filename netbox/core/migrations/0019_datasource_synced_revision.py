@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0018_job_parent'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='datasource',
+            name='synced_revision',
+            field=models.CharField(blank=True, editable=False, max_length=100),
+        ),
+    ]
@@ -1,29 +1,37 @@
 import hashlib
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone as dt_timezone
 from fnmatch import fnmatchcase
+from itertools import islice
 from urllib.parse import urlparse
 
 import yaml
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.core.exceptions import ValidationError
+from django.core.files.base import ContentFile
+from django.core.files.storage import storages
 from django.core.validators import RegexValidator
 from django.db import models
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.translation import gettext as _
+from django_pglocks import advisory_lock
 
-from netbox.constants import CENSOR_TOKEN, CENSOR_TOKEN_CHANGED
+from netbox.constants import ADVISORY_LOCK_KEYS, CENSOR_TOKEN, CENSOR_TOKEN_CHANGED
 from netbox.models import PrimaryModel
 from netbox.models.features import JobsMixin
 from netbox.registry import registry
 from utilities.querysets import RestrictedQuerySet
 from ..choices import *
+from ..constants import DATA_SYNC_BATCH_SIZE, DATA_SYNC_WORKERS
 from ..exceptions import SyncError
 
 __all__ = (
     'AutoSyncRecord',
+    'DataBlob',
     'DataFile',
     'DataSource',
 )
@@ -81,6 +89,13 @@ class DataSource(JobsMixin, PrimaryModel):
         null=True,
         editable=False
     )
+    synced_revision = models.CharField(
+        verbose_name=_('synced revision'),
+        max_length=100,
+        blank=True,
+        editable=False,
+        help_text=_("The revision of the source data (e.g. a git commit) as of the last successful sync")
+    )
 
     class Meta:
         ordering = ('name',)
@@ -153,13 +168,27 @@ class DataSource(JobsMixin, PrimaryModel):
 
         return objectchange
 
+    def save(self, *args, **kwargs):
+        # Changing the ignore rules necessitates a full resync (files previously ignored may now be included)
+        if self.pk and self.synced_revision:
+            ignore_rules = DataSource.objects.filter(pk=self.pk).values_list('ignore_rules', flat=True).first()
+            if ignore_rules != self.ignore_rules:
+                self.synced_revision = ''
+
+        super().save(*args, **kwargs)
+
     def get_backend(self):
         backend_params = self.parameters or {}
-        return self.backend_class(self.source_url, **backend_params)
+        backend = self.backend_class(self.source_url, **backend_params)
+        # Any persistent cache maintained by the backend must be invalidated if the ignore rules are changed
+        backend.cache_key = f'{self.pk}:{self.ignore_rules}'
+        backend.synced_revision = self.synced_revision or None
+        return backend
 
     def sync(self):
         """
-        Create/update/delete child DataFiles as necessary to synchronize with the remote source.
+        Create/update/delete child DataFiles as necessary to synchronize with the remote source. Returns the set of
+        paths which were created, updated, or deleted.
         """
         from core.signals import post_sync, pre_sync
 
@@ -182,53 +211,112 @@ class DataSource(JobsMixin, PrimaryModel):
         with backend.fetch() as local_path:
 
             logger.debug(f'Syncing files from source root {local_path}')
-            data_files = self.datafiles.all()
-            known_paths = {df.path for df in data_files}
-            logger.debug(f'Starting with {len(known_paths)} known files')
-
-            # Check for any updated/deleted files
-            updated_files = []
+            # Defer loading file data; only the metadata of known files is needed to detect changes
+            data_files = self.datafiles.defer('data')
+            # If the backend reports which paths have changed since the last sync, only those need to be considered
+            if (changed_paths := backend.changed_paths) is not None:
+                logger.debug(f'Backend reported {len(changed_paths)} changed paths')
+                data_files = data_files.filter(path__in=changed_paths)
+            known_files = {df.path: df for df in data_files}
+            logger.debug(f'Starting with {len(known_files)} known files')
+
+            # Check for any modified/deleted files. Files whose size is unchanged and which have not been modified
+            # since they were last updated are skipped without being read.
+            modified_files = []
             deleted_file_ids = []
-            for datafile in data_files:
-
+            changed_files = set()
+            for datafile in known_files.values():
                 try:
-                    if datafile.refresh_from_disk(source_root=local_path):
-                        updated_files.append(datafile)
+                    if datafile.is_modified_on_disk(source_root=local_path):
+                        modified_files.append(datafile)
                 except FileNotFoundError:
                     # File no longer exists
                     deleted_file_ids.append(datafile.pk)
-                    continue
+                    changed_files.add(datafile.path)
+            logger.debug(f"Found {len(modified_files)} potentially modified files")
 
-            # Bulk update modified files
-            updated_count = DataFile.objects.bulk_update(updated_files, ('last_updated', 'size', 'hash', 'data'))
-            logger.debug(f"Updated {updated_count} files")
+            # Walk the local replication to find new files
+            if changed_paths is not None:
+                new_paths = {
+                    path for path in changed_paths - set(known_files)
+                    if self._include(path) and os.path.isfile(os.path.join(local_path, path))
+                }
+            else:
+                new_paths = self._walk(local_path) - set(known_files)
+            new_datafiles = [DataFile(source=self, path=path) for path in sorted(new_paths)]
+
+            updated_count = created_count = 0
+            with ThreadPoolExecutor(max_workers=DATA_SYNC_WORKERS) as executor:
+
+                # Read & hash modified files, and bulk update those which have changed
+                for batch in self._read_files(executor, modified_files, local_path):
+                    updated_files = [datafile for datafile, is_modified in batch if is_modified]
+                    # Prevent any stored blobs from being deleted as orphans until they are referenced
+                    with advisory_lock(ADVISORY_LOCK_KEYS['data-blobs'], shared=True):
+                        if settings.DATA_FILE_STORE:
+                            DataBlob.store(updated_files)
+                        updated_count += DataFile.objects.bulk_update(
+                            updated_files, ('last_updated', 'size', 'hash', 'data', 'blob')
+                        )
+                    # Record that files whose content is unchanged have been checked, so that they are not read again
+                    if unchanged_files := [datafile for datafile, is_modified in batch if not is_modified]:
+                        DataFile.objects.bulk_update(unchanged_files, ('last_updated',))
+                    changed_files.update(datafile.path for datafile in updated_files)
+                logger.debug(f"Updated {updated_count} files")
+
+                # Read new files and bulk create them
+                for batch in self._read_files(executor, new_datafiles, local_path):
+                    datafiles = [datafile for datafile, __ in batch]
+                    with advisory_lock(ADVISORY_LOCK_KEYS['data-blobs'], shared=True):
+                        if settings.DATA_FILE_STORE:
+                            DataBlob.store(datafiles)
+                        for datafile in datafiles:
+                            datafile.full_clean(exclude=('blob',))
+                        created_count += len(DataFile.objects.bulk_create(datafiles))
+                    changed_files.update(datafile.path for datafile in datafiles)
+                logger.debug(f"Created {created_count} data files")
 
             # Bulk delete deleted files
             deleted_count, __ = DataFile.objects.filter(pk__in=deleted_file_ids).delete()
             logger.debug(f"Deleted {deleted_count} files")
 
-            # Walk the local replication to find new files
-            new_paths = self._walk(local_path) - known_paths
-
-            # Bulk create new files
-            new_datafiles = []
-            for path in new_paths:
-                datafile = DataFile(source=self, path=path)
-                datafile.refresh_from_disk(source_root=local_path)
-                datafile.full_clean()
-                new_datafiles.append(datafile)
-            created_count = len(DataFile.objects.bulk_create(new_datafiles, batch_size=100))
-            logger.debug(f"Created {created_count} data files")
-
-        # Update status & last_synced time
+            # Delete any stored content which is no longer referenced
+            if updated_count or deleted_count:
+                DataBlob.delete_orphans()
+
+        # Update status & last_synced time, and record the revision synchronized
         self.status = DataSourceStatusChoices.COMPLETED
         self.last_synced = timezone.now()
-        DataSource.objects.filter(pk=self.pk).update(status=self.status, last_synced=self.last_synced)
+        self.synced_revision = backend.revision or ''
+        DataSource.objects.filter(pk=self.pk).update(
+            status=self.status,
+            last_synced=self.last_synced,
+            synced_revision=self.synced_revision
+        )
 
         # Emit the post_sync signal
-        post_sync.send(sender=self.__class__, instance=self)
+        post_sync.send(sender=self.__class__, instance=self, changed_files=changed_files)
+
+        return changed_files
     sync.alters_data = True
 
+    @staticmethod
+    def _read_files(executor, datafiles, source_root):
+        """
+        Refresh DataFiles from disk in batches, distributing the reading & hashing of files among the executor's
+        threads. Yields a list of (datafile, is_modified) tuples for each batch, so that file data is held in memory
+        only one batch at a time.
+        """
+        def refresh(datafile):
+            return datafile, datafile.refresh_from_disk(source_root=source_root)
+
+        datafiles = iter(datafiles)
+        while batch := list(islice(datafiles, DATA_SYNC_BATCH_SIZE)):
+            yield list(executor.map(refresh, batch))
+            # Release the file data once the batch has been saved
+            for datafile in batch:
+                datafile.data = None
+
     def _walk(self, root):
         """
         Return a set of all non-excluded files within the root path.
@@ -247,6 +335,12 @@ class DataSource(JobsMixin, PrimaryModel):
         logger.debug(f"Found {len(paths)} files")
         return paths
 
+    def _include(self, path):
+        """
+        Returns a boolean indicating whether the file at the given relative path would be included by _walk().
+        """
+        return not os.path.dirname(path).startswith('.') and not self._ignore(os.path.basename(path))
+
     def _ignore(self, filename):
         """
         Returns a boolean indicating whether the file should be ignored per the DataSource's configured
@@ -298,7 +392,18 @@ class DataFile(models.Model):
         ],
         help_text=_('SHA256 hash of the file data')
     )
-    data = models.BinaryField()
+    data = models.BinaryField(
+        blank=True,
+        null=True
+    )
+    blob = models.ForeignKey(
+        to='core.DataBlob',
+        on_delete=models.PROTECT,
+        related_name='datafiles',
+        editable=False,
+        blank=True,
+        null=True
+    )
 
     objects = RestrictedQuerySet.as_manager()
 
@@ -321,13 +426,21 @@ class DataFile(models.Model):
 
     @property
     def data_as_string(self):
-        if not self.data:
+        if not (data := self.read_data()):
             return None
         try:
-            return self.data.decode('utf-8')
+            return bytes(data).decode('utf-8')
         except UnicodeDecodeError:
             return None
 
+    def read_data(self):
+        """
+        Return the file's content, retrieving it from the blob store if it is not stored inline.
+        """
+        if self.blob_id:
+            return self.blob.read()
+        return self.data
+
     def get_data(self):
         """
         Attempt to read the file data as JSON/YAML and return a native Python object.
@@ -335,26 +448,136 @@ class DataFile(models.Model):
         # TODO: Something more robust
         return yaml.safe_load(self.data_as_string)
 
+    def is_modified_on_disk(self, source_root):
+        """
+        Return True if the file on disk may have been modified since the instance was last updated, judging by its
+        size and modification time. (The file must be read to determine whether its content has actually changed.)
+        Raises FileNotFoundError if the file no longer exists.
+        """
+        stat = os.stat(os.path.join(source_root, self.path))
+        if stat.st_size != self.size:
+            return True
+        return datetime.fromtimestamp(stat.st_mtime, tz=dt_timezone.utc) >= self.last_updated
+
     def refresh_from_disk(self, source_root):
         """
-        Update instance attributes from the file on disk. Returns True if any attribute
-        has changed.
+        Update instance attributes from the file on disk. Returns True if the file's content
+        has changed. (last_updated is advanced regardless, so that a file which has been
+        touched but not modified is not read again by subsequent syncs.)
         """
         file_path = os.path.join(source_root, self.path)
+        # Record the time prior to reading the file, so that any later modification is detected by the next sync
+        self.last_updated = timezone.now()
         with open(file_path, 'rb') as f:
-            file_hash = hashlib.sha256(f.read()).hexdigest()
+            data = f.read()
+        file_hash = hashlib.sha256(data).hexdigest()
 
         # Update instance file attributes & data
         if is_modified := file_hash != self.hash:
-            self.last_updated = timezone.now()
-            self.size = os.path.getsize(file_path)
+            self.size = len(data)
             self.hash = file_hash
-            with open(file_path, 'rb') as f:
-                self.data = f.read()
+            self.data = data
+            self.blob = None
 
         return is_modified
 
 
+class DataBlob(models.Model):
+    """
+    The content of one or more DataFiles, addressed by its SHA256 hash. Content is held either in the database or (if
+    data is null) in the "datafiles" storage backend.
+    """
+    hash = models.CharField(
+        verbose_name=_('hash'),
+        max_length=64,
+        primary_key=True,
+        editable=False
+    )
+    size = models.PositiveIntegerField(
+        editable=False,
+        verbose_name=_('size')
+    )
+    data = models.BinaryField(
+        blank=True,
+        null=True
+    )
+    created = models.DateTimeField(
+        verbose_name=_('created'),
+        auto_now_add=True
+    )
+
+    _netbox_private = True
+
+    class Meta:
+        verbose_name = _('data blob')
+        verbose_name_plural = _('data blobs')
+
+    def __str__(self):
+        return self.hash
+
+    @staticmethod
+    def get_storage_path(file_hash):
+        return f'{file_hash[:2]}/{file_hash}'
+
+    def read(self):
+        """
+        Return the blob's content.
+        """
+        if self.data is not None:
+            return bytes(self.data)
+        with storages['datafiles'].open(self.get_storage_path(self.hash), 'rb') as f:
+            return f.read()
+
+    @classmethod
+    def store(cls, datafiles):
+        """
+        Move the content of the given DataFiles (which must be held in memory) to the store designated by
+        DATA_FILE_STORE. A blob is written only for content which has not already been stored. The DataFiles are
+        modified in place, but not saved.
+
+        The caller must hold the shared "data-blobs" advisory lock until the DataFiles have been saved; otherwise, a
+        blob which already exists may be deleted by delete_orphans() before it is referenced.
+        """
+        datafiles = [datafile for datafile in datafiles if datafile.data is not None]
+        existing_hashes = set(
+            cls.objects.filter(hash__in={df.hash for df in datafiles}).values_list('hash', flat=True)
+        )
+
+        blobs = {}
+        for datafile in datafiles:
+            if datafile.hash not in existing_hashes and datafile.hash not in blobs:
+                data = bytes(datafile.data)
+                if settings.DATA_FILE_STORE == 'storage':
+                    storage = storages['datafiles']
+                    path = cls.get_storage_path(datafile.hash)
+                    if not storage.exists(path):
+                        storage.save(path, ContentFile(data))
+                    data = None
+                blobs[datafile.hash] = cls(hash=datafile.hash, size=datafile.size, data=data)
+            datafile.blob_id = datafile.hash
+            datafile.data = None
+        cls.objects.bulk_create(blobs.values(), ignore_conflicts=True)
+
+    @classmethod
+    @advisory_lock(ADVISORY_LOCK_KEYS['data-blobs'])
+    def delete_orphans(cls):
+        """
+        Delete all blobs which are no longer referenced by any DataFile. Returns the number of blobs deleted. An
+        exclusive advisory lock is held for the duration, to avoid deleting blobs which are being stored concurrently.
+        """
+        orphans = cls.objects.filter(datafiles__isnull=True)
+        file_hashes = list(orphans.filter(data__isnull=True).values_list('hash', flat=True))
+        deleted_count, __ = orphans.delete()
+
+        # Delete any orphaned content held in storage
+        if file_hashes:
+            storage = storages['datafiles']
+            for file_hash in file_hashes:
+                storage.delete(cls.get_storage_path(file_hash))
+
+        return deleted_count
+
+
 class AutoSyncRecord(models.Model):
     """
     Maps a DataFile to a synced object for efficient automatic updating.
@@ -92,7 +92,7 @@ class ManagedFile(SyncedDataMixin, models.Model):
             storage = self.storage
 
             with storage.open(self.full_path, 'wb+') as new_file:
-                new_file.write(self.data_file.data)
+                new_file.write(self.data_file.read_data())
 
     @cached_property
     def storage(self):
@@ -21,6 +21,7 @@ from utilities.rqworker import get_queue_for_model
 
 __all__ = (
     'Job',
+    'JobLogEntry',
 )
 
 
@@ -104,6 +105,14 @@ class Job(models.Model):
         verbose_name=_('job ID'),
         unique=True
     )
+    parent = models.ForeignKey(
+        to='core.Job',
+        on_delete=models.CASCADE,
+        related_name='children',
+        blank=True,
+        null=True,
+        help_text=_('The job which dispatched this job (if any)')
+    )
 
     objects = RestrictedQuerySet.as_manager()
 
@@ -155,6 +164,14 @@ class Job(models.Model):
         return f"{int(minutes)} minutes, {seconds:.2f} seconds"
 
     def delete(self, *args, **kwargs):
+        # Delete any child jobs individually to ensure their background tasks are cancelled
+        for child in self.children.all():
+            child.delete()
+
+        # Call _raw_delete() on the log entries to avoid first loading them into memory
+        log_entries = JobLogEntry.objects.filter(job=self)
+        log_entries._raw_delete(using=log_entries.db)
+
         super().delete(*args, **kwargs)
 
         rq_queue_name = get_queue_for_model(self.object_type.model if self.object_type else None)
@@ -204,6 +221,35 @@ class Job(models.Model):
         # Send signal
         job_end.send(self)
 
+        # If this is the last of its parent's child jobs to finish, terminate the parent as well
+        if self.parent_id:
+            self._terminate_parent()
+
+    def _terminate_parent(self):
+        """
+        Terminate the parent job once all of its child jobs have finished. Its status reflects the worst outcome among
+        its children (errored, then failed).
+        """
+        with transaction.atomic():
+            # Lock the parent to ensure it is terminated only once when several children finish concurrently
+            parent = Job.objects.select_for_update().get(pk=self.parent_id)
+            if parent.status in JobStatusChoices.TERMINAL_STATE_CHOICES:
+                return
+            statuses = list(parent.children.values_list('status', flat=True))
+            if any(status not in JobStatusChoices.TERMINAL_STATE_CHOICES for status in statuses):
+                return
+
+            errored_count = statuses.count(JobStatusChoices.STATUS_ERRORED)
+            if errored_count:
+                parent.terminate(
+                    status=JobStatusChoices.STATUS_ERRORED,
+                    error=f"{errored_count} of {len(statuses)} child jobs errored"
+                )
+            elif JobStatusChoices.STATUS_FAILED in statuses:
+                parent.terminate(status=JobStatusChoices.STATUS_FAILED)
+            else:
+                parent.terminate()
+
     @classmethod
     def enqueue(
             cls,
@@ -215,6 +261,7 @@ class Job(models.Model):
             interval=None,
             immediate=False,
             queue_name=None,
+            parent=None,
             **kwargs
     ):
         """
@@ -229,6 +276,8 @@ class Job(models.Model):
             interval: Recurrence interval (in minutes)
             immediate: Run the job immediately without scheduling it in the background. Should be used for interactive
                 management commands only.
+            queue_name: The name of the queue to which the job is assigned (optional)
+            parent: The job which has dispatched this job (optional)
         """
         if schedule_at and immediate:
             raise ValueError(_("enqueue() cannot be called with values for both schedule_at and immediate."))
@@ -249,7 +298,8 @@ class Job(models.Model):
             scheduled=schedule_at,
             interval=interval,
             user=user,
-            job_id=uuid.uuid4()
+            job_id=uuid.uuid4(),
+            parent=parent
         )
         job.full_clean()
         job.save()
@@ -270,3 +320,48 @@ class Job(models.Model):
             transaction.on_commit(callback)
 
         return job
+
+
+class JobLogEntry(models.Model):
+    """
+    A message logged during the execution of a Job. Log entries are stored separately from the Job so that they can be
+    written incrementally while the job is running and retrieved in pages.
+    """
+    job = models.ForeignKey(
+        to='core.Job',
+        on_delete=models.CASCADE,
+        related_name='log_entries',
+        db_index=False
+    )
+    time = models.DateTimeField(
+        verbose_name=_('time')
+    )
+    level = models.CharField(
+        verbose_name=_('level'),
+        max_length=30
+    )
+    message = models.TextField(
+        verbose_name=_('message')
+    )
+    object_repr = models.TextField(
+        verbose_name=_('object'),
+        blank=True
+    )
+    url = models.CharField(
+        verbose_name=_('URL'),
+        max_length=200,
+        blank=True
+    )
+
+    _netbox_private = True
+
+    class Meta:
+        ordering = ('job', 'pk')
+        indexes = (
+            models.Index(fields=('job', 'id')),
+        )
+        verbose_name = _('job log entry')
+        verbose_name_plural = _('job log entries')
+
+    def __str__(self):
+        return self.message
@@ -0,0 +1,311 @@
+import logging
+import re
+from datetime import datetime, timezone as dt_timezone
+
+from django.db import connections, router, transaction
+from django.utils import timezone
+
+from .constants import CHANGELOG_PARTITION_BATCH_SIZE, CHANGELOG_PARTITIONS_AHEAD
+from .models import ObjectChange
+
+__all__ = (
+    'create_partitions',
+    'drop_expired_partitions',
+    'get_partitions',
+    'is_partitioned',
+    'partition_changelog',
+)
+
+logger = logging.getLogger('netbox.core.partitioning')
+
+# Partitions are named after the table and the month they hold (e.g. core_objectchange_p202601)
+PARTITION_SUFFIX = '_p{:%Y%m}'
+DEFAULT_PARTITION_SUFFIX = '_default'
+
+
+#
+# Helpers
+#
+
+def _get_connection(using=None):
+    return connections[using or router.db_for_write(ObjectChange)]
+
+
+def _month_start(dt):
+    dt = dt.astimezone(dt_timezone.utc)
+    return datetime(dt.year, dt.month, 1, tzinfo=dt_timezone.utc)
+
+
+def _next_month(dt):
+    return datetime(dt.year + dt.month // 12, dt.month % 12 + 1, 1, tzinfo=dt_timezone.utc)
+
+
+def _create_partition(cursor, connection, table, parent, month):
+    """
+    Create the partition of the parent table holding all records within the given month.
+    """
+    qn = connection.ops.quote_name
+    cursor.execute(
+        f"CREATE TABLE IF NOT EXISTS {qn(table + PARTITION_SUFFIX.format(month))} PARTITION OF {qn(parent)} "
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_next_month(month).isoformat()}')"
+    )
+
+
+def _create_partition_from_default(cursor, connection, table, default_partition, month):
+    """
+    Create the partition of the table holding all records within the given month, moving any such records out of its
+    default partition. (A partition cannot be created while the default partition holds records within its range.)
+    """
+    qn = connection.ops.quote_name
+    time_range = [month, _next_month(month)]
+    cursor.execute(
+        f"SELECT EXISTS (SELECT 1 FROM {qn(default_partition)} WHERE {qn('time')} >= %s AND {qn('time')} < %s)",
+        time_range
+    )
+    if not cursor.fetchone()[0]:
+        _create_partition(cursor, connection, table, table, month)
+        return
+
+    # Detach the default partition while the new partition is created and the records are moved into it
+    cursor.execute(f"ALTER TABLE {qn(table)} DETACH PARTITION {qn(default_partition)}")
+    _create_partition(cursor, connection, table, table, month)
+    cursor.execute(
+        f"WITH moved AS ("
+        f"DELETE FROM {qn(default_partition)} WHERE {qn('time')} >= %s AND {qn('time')} < %s RETURNING *"
+        f") INSERT INTO {qn(table)} SELECT * FROM moved",
+        time_range
+    )
+    logger.info(f"Moved {cursor.rowcount} changelog records from the default partition for {month:%Y-%m}")
+    cursor.execute(f"ALTER TABLE {qn(table)} ATTACH PARTITION {qn(default_partition)} DEFAULT")
+
+
+def _wait_for_writers(cursor, connection, table):
+    """
+    Wait for any transactions which have written to the table to complete, and return the greatest ID in the table.
+    Writes are blocked only until these transactions complete. Any records subsequently created are assigned greater
+    IDs.
+    """
+    qn = connection.ops.quote_name
+    with transaction.atomic(using=connection.alias):
+        cursor.execute(f"LOCK TABLE {qn(table)} IN SHARE MODE")
+        cursor.execute(f"SELECT COALESCE(MAX(id), 0) FROM {qn(table)}")
+        return cursor.fetchone()[0]
+
+
+#
+# Partition management
+#
+
+def is_partitioned(using=None):
+    """
+    Return True if the ObjectChange table has been partitioned by time.
+    """
+    connection = _get_connection(using)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = %s::regclass)",
+            [ObjectChange._meta.db_table]
+        )
+        return cursor.fetchone()[0]
+
+
+def get_partitions(using=None):
+    """
+    Return a dictionary mapping the first day of each month for which a partition of the ObjectChange table exists to
+    the name of that partition.
+    """
+    table = ObjectChange._meta.db_table
+    pattern = re.compile(rf'^{re.escape(table)}_p(\d{{4}})(\d{{2}})$')
+    connection = _get_connection(using)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = %s::regclass",
+            [table]
+        )
+        partitions = {}
+        for name, in cursor.fetchall():
+            if match := pattern.match(name):
+                month = datetime(int(match.group(1)), int(match.group(2)), 1, tzinfo=dt_timezone.utc)
+                partitions[month] = name
+
+    return dict(sorted(partitions.items()))
+
+
+def create_partitions(months_ahead=CHANGELOG_PARTITIONS_AHEAD, using=None):
+    """
+    Create any missing partitions of the ObjectChange table from the current month through the specified number of
+    months ahead. Any records within these months are moved out of the default partition. Returns the number of
+    partitions created.
+    """
+    table = ObjectChange._meta.db_table
+    existing = get_partitions(using)
+    month = _month_start(timezone.now())
+    months = []
+    for __ in range(months_ahead + 1):
+        if month not in existing:
+            months.append(month)
+        month = _next_month(month)
+
+    connection = _get_connection(using)
+    default_partition = table + DEFAULT_PARTITION_SUFFIX
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT to_regclass(%s) IS NOT NULL", [default_partition])
+        has_default = cursor.fetchone()[0]
+        for month in months:
+            with transaction.atomic(using=connection.alias):
+                if has_default:
+                    _create_partition_from_default(cursor, connection, table, default_partition, month)
+                else:
+                    _create_partition(cursor, connection, table, table, month)
+            logger.info(f"Created changelog partition for {month:%Y-%m}")
+
+    return len(months)
+
+
+def drop_expired_partitions(cutoff, using=None):
+    """
+    Drop all partitions of the ObjectChange table which hold only records created prior to the cutoff time. Returns
+    the number of records deleted.
+    """
+    connection = _get_connection(using)
+    qn = connection.ops.quote_name
+    deleted_count = 0
+    with connection.cursor() as cursor:
+        for month, name in get_partitions(using).items():
+            if _next_month(month) > cutoff:
+                break
+            with transaction.atomic(using=connection.alias):
+                cursor.execute(f"SELECT COUNT(*) FROM {qn(name)}")
+                deleted_count += cursor.fetchone()[0]
+                cursor.execute(f"DROP TABLE {qn(name)}")
+            logger.info(f"Dropped changelog partition for {month:%Y-%m}")
+
+    return deleted_count
+
+
+#
+# Conversion
+#
+
+def partition_changelog(months_ahead=CHANGELOG_PARTITIONS_AHEAD, batch_size=CHANGELOG_PARTITION_BATCH_SIZE,
+                        callback=None, using=None):
+    """
+    Convert the ObjectChange table into a table partitioned by month on its time column. Existing records are copied to
+    the new table in batches while the original table remains in use. Writes are blocked only while waiting for any
+    transactions in progress to complete prior to each pass, and while the records created since the last pass are
+    copied and the tables are swapped. The original table is then dropped.
+
+    Args:
+        months_ahead: The number of months in advance for which partitions are created
+        batch_size: The number of records to copy at a time
+        callback: A function to be called with the cumulative number of records copied after each batch
+        using: The database alias
+    """
+    connection = _get_connection(using)
+    qn = connection.ops.quote_name
+    table = ObjectChange._meta.db_table
+    new_table = f'{table}_partitioned'
+    sequence = f'{new_table}_id_seq'
+
+    with connection.cursor() as cursor:
+
+        # Create the partitioned table, replicating the columns and check constraints of the original table. Because
+        # the primary key of a partitioned table must include the partition key, IDs are now guaranteed to be unique
+        # only by the sequence from which they are drawn.
+        with transaction.atomic(using=connection.alias):
+            cursor.execute(
+                f"CREATE TABLE {qn(new_table)} (LIKE {qn(table)} INCLUDING CONSTRAINTS) "
+                f"PARTITION BY RANGE ({qn('time')})"
+            )
+            cursor.execute(f"CREATE SEQUENCE {qn(sequence)} OWNED BY {qn(new_table)}.id")
+            cursor.execute(f"ALTER TABLE {qn(new_table)} ALTER COLUMN id SET DEFAULT nextval('{sequence}')")
+            cursor.execute(f"ALTER TABLE {qn(new_table)} ADD PRIMARY KEY (id, {qn('time')})")
+
+            # Replicate the original table's indexes (other than its primary key) under temporary names
+            cursor.execute(
+                "SELECT indexname, indexdef FROM pg_indexes WHERE tablename = %s AND indexname NOT IN ("
+                "SELECT conname FROM pg_constraint WHERE conrelid = %s::regclass AND contype IN ('p', 'u'))",
+                [table, table]
+            )
+            renames = []
+            for i, (name, definition) in enumerate(cursor.fetchall()):
+                temp_name = f'{new_table}_idx{i}'
+                definition = definition.replace(f'INDEX {name} ON', f'INDEX {temp_name} ON', 1)
+                definition = re.sub(rf' ON (\S+\.)?{re.escape(table)} ', f' ON {qn(new_table)} ', definition, count=1)
+                cursor.execute(definition)
+                renames.append(f"ALTER INDEX {qn(temp_name)} RENAME TO {qn(name)}")
+
+            # Replicate the original table's foreign keys under temporary names
+            cursor.execute(
+                "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+                "WHERE conrelid = %s::regclass AND contype = 'f'",
+                [table]
+            )
+            for i, (name, definition) in enumerate(cursor.fetchall()):
+                temp_name = f'{new_table}_fk{i}'
+                cursor.execute(f"ALTER TABLE {qn(new_table)} ADD CONSTRAINT {qn(temp_name)} {definition}")
+                renames.append(f"ALTER TABLE {qn(table)} RENAME CONSTRAINT {qn(temp_name)} TO {qn(name)}")
+
+            # Create a partition for each month from that of the oldest record through the specified number of months
+            # ahead, and a default partition for any records outside that range
+            cursor.execute(f"SELECT MIN({qn('time')}) FROM {qn(table)}")
+            month = _month_start(cursor.fetchone()[0] or timezone.now())
+            last_month = _month_start(timezone.now())
+            for __ in range(months_ahead):
+                last_month = _next_month(last_month)
+            while month <= last_month:
+                _create_partition(cursor, connection, table, new_table, month)
+                month = _next_month(month)
+            cursor.execute(
+                f"CREATE TABLE {qn(table + DEFAULT_PARTITION_SUFFIX)} PARTITION OF {qn(new_table)} DEFAULT"
+            )
+
+        # Copy existing records in batches, followed by any records created in the meantime. Each pass first waits
+        # for transactions writing to the original table to complete, so that no record with an ID lower than the last
+        # one found can be committed subsequently.
+        copy_sql = (
+            f"WITH batch AS (SELECT * FROM {qn(table)} WHERE id > %s AND id <= %s ORDER BY id LIMIT %s), "
+            f"copied AS (INSERT INTO {qn(new_table)} SELECT * FROM batch) "
+            f"SELECT MAX(id), COUNT(*) FROM batch"
+        )
+        last_id = 0
+        copied_count = 0
+        for __ in range(2):
+            max_id = _wait_for_writers(cursor, connection, table)
+            while last_id < max_id:
+                with transaction.atomic(using=connection.alias):
+                    cursor.execute(copy_sql, [last_id, max_id, batch_size])
+                    batch_last_id, count = cursor.fetchone()
+                if not count:
+                    break
+                last_id = batch_last_id
+                copied_count += count
+                if callback:
+                    callback(copied_count)
+            last_id = max(last_id, max_id)
+
+        # Block writes to the original table while copying any records created since the last pass (all of which
+        # have greater IDs), then swap the tables
+        with transaction.atomic(using=connection.alias):
+            cursor.execute(f"LOCK TABLE {qn(table)} IN EXCLUSIVE MODE")
+            cursor.execute(f"INSERT INTO {qn(new_table)} SELECT * FROM {qn(table)} WHERE id > %s", [last_id])
+            copied_count += cursor.rowcount
+            cursor.execute(
+                f"SELECT setval(%s::regclass, GREATEST("
+                f"(SELECT COALESCE(MAX(id), 0) FROM {qn(new_table)}), "
+                f"COALESCE(pg_sequence_last_value(pg_get_serial_sequence(%s, 'id')::regclass), 0), "
+                f"1))",
+                [sequence, table]
+            )
+            cursor.execute(f"DROP TABLE {qn(table)}")
+            cursor.execute(f"ALTER TABLE {qn(new_table)} RENAME TO {qn(table)}")
+            cursor.execute(
+                f"ALTER TABLE {qn(table)} RENAME CONSTRAINT {qn(new_table + '_pkey')} TO {qn(table + '_pkey')}"
+            )
+            for sql in renames:
+                cursor.execute(sql)
+        if callback:
+            callback(copied_count)
+
+    return copied_count
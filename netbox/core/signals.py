@@ -1,7 +1,9 @@
 import logging
+from collections import defaultdict
 from threading import local
 
 from django.contrib.contenttypes.models import ContentType
+from django.core.files.storage import default_storage
 from django.core.exceptions import ValidationError
 from django.db.models.fields.reverse_related import ManyToManyRel, ManyToOneRel
 from django.db.models.signals import m2m_changed, post_save, pre_delete
@@ -16,7 +18,10 @@ from extras.events import enqueue_event
 from extras.utils import run_validators
 from netbox.config import get_config
 from netbox.context import current_request, events_queue
+from netbox.graphql.extensions import invalidate_query_cache
 from netbox.models.features import ChangeLoggingMixin
+from netbox.signals import post_bulk_update
+from utilities.bulk import bulk_save
 from utilities.exceptions import AbortRequest
 from .models import ConfigRevision, DataSource, ObjectChange
 
@@ -58,6 +63,13 @@ def handle_changed_object(sender, instance, **kwargs):
     if not hasattr(instance, 'to_objectchange'):
         return
 
+    # Objects updated in bulk are handled by handle_bulk_updated_objects()
+    if kwargs.get('bulk'):
+        return
+
+    # Invalidate any cached GraphQL query results
+    invalidate_query_cache(kwargs.get('using'))
+
     # Get the current request, or bail if not set
     request = current_request.get()
     if request is None:
@@ -114,6 +126,43 @@ def handle_changed_object(sender, instance, **kwargs):
         model_updates.labels(instance._meta.model_name).inc()
 
 
+@receiver(post_bulk_update)
+def handle_bulk_updated_objects(sender, instances, **kwargs):
+    """
+    Fires when a set of objects has been updated in bulk. Records the ObjectChanges for all objects in a single query.
+    """
+    if not hasattr(sender, 'to_objectchange'):
+        return
+
+    # Invalidate any cached GraphQL query results
+    invalidate_query_cache(kwargs.get('using'))
+
+    # Get the current request, or bail if not set
+    request = current_request.get()
+    if request is None:
+        return
+
+    objectchanges = []
+    queue = events_queue.get()
+    for instance in instances:
+        objectchange = instance.to_objectchange(ObjectChangeActionChoices.ACTION_UPDATE)
+        if objectchange and objectchange.has_changes:
+            # Populate the fields normally set by ObjectChange.save(), which is not called by bulk_create()
+            objectchange.user = request.user
+            objectchange.user_name = request.user.username
+            objectchange.request_id = request.id
+            objectchanges.append(objectchange)
+
+        # Enqueue the object for event processing
+        enqueue_event(queue, instance, request.user, request.id, OBJECT_UPDATED)
+    events_queue.set(queue)
+
+    ObjectChange.objects.bulk_create(objectchanges)
+
+    # Increment metric counters
+    model_updates.labels(sender._meta.model_name).inc(len(instances))
+
+
 @receiver(pre_delete)
 def handle_deleted_object(sender, instance, **kwargs):
     """
@@ -131,6 +180,10 @@ def handle_deleted_object(sender, instance, **kwargs):
             _("Deletion is prevented by a protection rule: {message}").format(message=e)
         )
 
+    # Invalidate any cached GraphQL query results
+    if hasattr(instance, 'to_objectchange'):
+        invalidate_query_cache(kwargs.get('using'))
+
     # Get the current request, or bail if not set
     request = current_request.get()
     if request is None:
@@ -213,6 +266,19 @@ def clear_events_queue(sender, **kwargs):
     events_queue.set({})
 
 
+#
+# Job handlers
+#
+
+@receiver(pre_delete, sender='core.Job')
+def delete_job_file(instance, **kwargs):
+    """
+    Delete any file produced by a job (e.g. a background export) from storage when the job is deleted.
+    """
+    if isinstance(instance.data, dict) and (path := instance.data.get('export_file')):
+        default_storage.delete(path)
+
+
 #
 # DataSource handlers
 #
@@ -237,14 +303,29 @@ def enqueue_sync_job(instance, created, **kwargs):
 
 
 @receiver(post_sync)
-def auto_sync(instance, **kwargs):
+def auto_sync(instance, changed_files=None, **kwargs):
     """
-    Automatically synchronize any DataFiles with AutoSyncRecords after synchronizing a DataSource.
+    Automatically synchronize any DataFiles with AutoSyncRecords after synchronizing a DataSource. If the set of
+    changed files is known, only objects synchronized from those files are updated.
     """
     from .models import AutoSyncRecord
 
-    for autosync in AutoSyncRecord.objects.filter(datafile__source=instance).prefetch_related('object'):
-        autosync.object.sync(save=True)
+    autosyncs = AutoSyncRecord.objects.filter(datafile__source=instance)
+    if changed_files is not None:
+        autosyncs = autosyncs.filter(datafile__path__in=changed_files)
+
+    # Group the synced objects by model, so that each model's objects can be saved collectively
+    synced_objects = defaultdict(list)
+    for autosync in autosyncs.select_related('datafile').prefetch_related('object'):
+        if (obj := autosync.object) is None:
+            continue
+        obj.data_file = autosync.datafile
+        obj.sync(save=False)
+        synced_objects[type(obj)].append(obj)
+
+    for model, objects in synced_objects.items():
+        update_fields = [field.attname for field in model._meta.concrete_fields if not field.primary_key]
+        bulk_save(model, objects, update_fields=update_fields)
 
 
 @receiver(post_save, sender=ConfigRevision)
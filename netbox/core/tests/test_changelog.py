@@ -178,6 +178,41 @@ class ChangeLogViewTest(ModelViewTestCase):
         self.assertEqual(objectchange.postchange_data['status'], form_data['status'])
         self.assertEqual(objectchange.postchange_data['description'], form_data['description'])
 
+    def test_bulk_update_objects_custom_fields(self):
+        sites = (
+            Site(name='Site 1', slug='site-1', custom_field_data={'cf1': 'ABC'}),
+            Site(name='Site 2', slug='site-2', custom_field_data={'cf1': 'ABC'}),
+            Site(name='Site 3', slug='site-3', custom_field_data={'cf1': 'ABC'}),
+        )
+        Site.objects.bulk_create(sites)
+
+        form_data = {
+            'pk': [site.pk for site in sites],
+            '_apply': True,
+            'cf_cf1': 'DEF',
+        }
+
+        request = {
+            'path': self._get_url('bulk_edit'),
+            'data': post_data(form_data),
+        }
+        self.add_permissions('dcim.view_site', 'dcim.change_site')
+        response = self.client.post(**request)
+        self.assertHttpStatus(response, 302)
+
+        objectchanges = ObjectChange.objects.filter(
+            changed_object_type=ContentType.objects.get_for_model(Site),
+            changed_object_id__in=[site.pk for site in sites]
+        )
+        self.assertEqual(objectchanges.count(), len(sites))
+        for objectchange in objectchanges:
+            self.assertEqual(objectchange.action, ObjectChangeActionChoices.ACTION_UPDATE)
+            self.assertEqual(objectchange.user_name, self.user.username)
+            self.assertEqual(objectchange.prechange_data['custom_fields']['cf1'], 'ABC')
+            self.assertEqual(objectchange.postchange_data['custom_fields']['cf1'], 'DEF')
+        for site in Site.objects.filter(pk__in=[site.pk for site in sites]):
+            self.assertEqual(site.cf['cf1'], 'DEF')
+
     def test_bulk_delete_objects(self):
         sites = (
             Site(name='Site 1', slug='site-1', status=SiteStatusChoices.STATUS_ACTIVE),
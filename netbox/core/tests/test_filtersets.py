@@ -84,7 +84,7 @@ class DataSourceTestCase(TestCase, ChangeLoggedFilterSetTests):
 class DataFileTestCase(TestCase, ChangeLoggedFilterSetTests):
     queryset = DataFile.objects.all()
     filterset = DataFileFilterSet
-    ignore_fields = ('data',)
+    ignore_fields = ('data', 'blob')
 
     @classmethod
     def setUpTestData(cls):
@@ -1,7 +1,19 @@
-from django.test import TestCase
+import hashlib
+import os
+import sys
+import tempfile
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
-from core.models import DataSource
+from django.db.models import F
+from django.test import TestCase, override_settings
+
+from core.data_backends import GitBackend, S3Backend, get_cache_path
+from core.models import DataBlob, DataFile, DataSource
 from core.choices import ObjectChangeActionChoices
+from core.signals import post_sync
+from extras.models import ConfigTemplate
 from netbox.constants import CENSOR_TOKEN, CENSOR_TOKEN_CHANGED
 
 
@@ -120,3 +132,341 @@ class DataSourceChangeLoggingTestCase(TestCase):
         self.assertEqual(objectchange.prechange_data['parameters']['password'], CENSOR_TOKEN)
         self.assertEqual(objectchange.postchange_data['parameters']['username'], 'username2')
         self.assertEqual(objectchange.postchange_data['parameters']['password'], CENSOR_TOKEN)
+
+
+class DataSourceSyncTestCase(TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.datasource = DataSource.objects.create(
+            name='Data Source 1',
+            type='local',
+            source_url=self.temp_dir.name
+        )
+
+        self.changed_files = None
+
+        def receiver(instance, changed_files, **kwargs):
+            self.changed_files = changed_files
+        post_sync.connect(receiver)
+        self.addCleanup(post_sync.disconnect, receiver)
+
+    def write_file(self, path, content):
+        with open(os.path.join(self.temp_dir.name, path), 'w') as f:
+            f.write(content)
+
+    def test_sync(self):
+        self.write_file('file1.txt', 'foo')
+        self.write_file('file2.txt', 'bar')
+        self.datasource.sync()
+        self.assertEqual(self.changed_files, {'file1.txt', 'file2.txt'})
+        self.assertEqual(bytes(self.datasource.datafiles.get(path='file1.txt').data), b'foo')
+
+        # Modify one file and delete the other
+        self.write_file('file1.txt', 'foobar')
+        os.remove(os.path.join(self.temp_dir.name, 'file2.txt'))
+        self.datasource.sync()
+        self.assertEqual(self.changed_files, {'file1.txt', 'file2.txt'})
+        self.assertEqual(self.datasource.datafiles.count(), 1)
+        datafile = self.datasource.datafiles.get()
+        self.assertEqual(bytes(datafile.data), b'foobar')
+        self.assertEqual(datafile.size, 6)
+
+        # Resync without any changes
+        self.datasource.sync()
+        self.assertEqual(self.changed_files, set())
+
+    def test_sync_touched_file(self):
+        self.write_file('file1.txt', 'foo')
+        self.datasource.sync()
+
+        # Simulate the file having been touched since it was last updated
+        self.datasource.datafiles.update(last_updated=F('last_updated') - timedelta(minutes=1))
+        refresh_from_disk = DataFile.refresh_from_disk
+        with patch.object(DataFile, 'refresh_from_disk', autospec=True, side_effect=refresh_from_disk) as mock:
+            self.datasource.sync()
+            self.assertEqual(mock.call_count, 1)
+            self.assertEqual(self.changed_files, set())
+
+            # The unchanged file should not be read again
+            self.datasource.sync()
+            self.assertEqual(mock.call_count, 1)
+        self.assertEqual(bytes(self.datasource.datafiles.get().data), b'foo')
+
+    @override_settings(DATA_FILE_STORE='database')
+    def test_sync_blob_store(self):
+        self.write_file('file1.txt', 'foo')
+        self.write_file('file2.txt', 'foo')
+        self.datasource.sync()
+
+        # Identical files should share a single blob
+        self.assertEqual(DataBlob.objects.count(), 1)
+        for datafile in self.datasource.datafiles.all():
+            self.assertIsNone(datafile.data)
+            self.assertEqual(datafile.data_as_string, 'foo')
+
+        # Blobs which are no longer referenced should be deleted
+        self.write_file('file1.txt', 'bar')
+        self.write_file('file2.txt', 'bar')
+        self.datasource.sync()
+        self.assertEqual(DataBlob.objects.count(), 1)
+        self.assertEqual(self.datasource.datafiles.get(path='file1.txt').data_as_string, 'bar')
+
+    def test_auto_sync(self):
+        self.write_file('template1.j2', 'foo')
+        self.write_file('template2.j2', 'bar')
+        self.datasource.sync()
+
+        config_templates = []
+        for datafile in self.datasource.datafiles.order_by('path'):
+            config_template = ConfigTemplate(name=datafile.path, data_file=datafile, auto_sync_enabled=True)
+            config_template.full_clean()
+            config_template.save()
+            config_templates.append(config_template)
+        data_synced = config_templates[1].data_synced
+
+        # Only the object synced from the modified file should be updated
+        self.write_file('template1.j2', 'foobar')
+        self.datasource.sync()
+        for config_template in config_templates:
+            config_template.refresh_from_db()
+        self.assertEqual(config_templates[0].template_code, 'foobar')
+        self.assertEqual(config_templates[1].template_code, 'bar')
+        self.assertEqual(config_templates[1].data_synced, data_synced)
+
+
+class GitMirrorSyncTestCase(TestCase):
+    """
+    Test the incremental synchronization of a git DataSource from a persistent mirror.
+    """
+    def setUp(self):
+        from dulwich.repo import Repo
+
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        cache_path = override_settings(DATA_SOURCE_CACHE_PATH=os.path.join(temp_dir.name, 'cache'))
+        cache_path.enable()
+        self.addCleanup(cache_path.disable)
+
+        # Create a bare repository from which to sync
+        source_path = os.path.join(temp_dir.name, 'source.git')
+        os.mkdir(source_path)
+        self.source = Repo.init_bare(source_path)
+        self.addCleanup(self.source.close)
+
+        self.datasource = DataSource.objects.create(
+            name='Data Source 1',
+            type='git',
+            source_url=source_path,
+            parameters={'branch': 'main'}
+        )
+
+    def commit(self, files):
+        """
+        Commit the given files (a mapping of paths to content) to the source repository, replacing its contents.
+        """
+        from dulwich.index import commit_tree
+        from dulwich.objects import Blob
+
+        entries = []
+        for path, content in files.items():
+            blob = Blob.from_string(content.encode())
+            self.source.object_store.add_object(blob)
+            entries.append((path.encode(), blob.id, 0o100644))
+        commit_id = self.source.do_commit(
+            message=b'Update files',
+            committer=b'Test <test@example.com>',
+            tree=commit_tree(self.source.object_store, entries),
+            ref=b'refs/heads/main'
+        )
+        return commit_id.decode()
+
+    def get_mirror(self):
+        """
+        Return the mirror's repository and the path to its working tree.
+        """
+        from dulwich.repo import Repo
+
+        backend = self.datasource.get_backend()
+        mirror_path = get_cache_path('git', backend.cache_key, backend.url, 'main')
+        repo = Repo(str(mirror_path / 'repo'))
+        self.addCleanup(repo.close)
+        return repo, mirror_path / 'tree'
+
+    def get_datafiles(self):
+        return {
+            datafile.path: datafile.data_as_string for datafile in self.datasource.datafiles.all()
+        }
+
+    def test_sync_incremental(self):
+        commit1 = self.commit({'file1.txt': 'foo', 'file2.txt': 'bar'})
+        self.assertEqual(self.datasource.sync(), {'file1.txt', 'file2.txt'})
+        self.datasource.refresh_from_db()
+        self.assertEqual(self.datasource.synced_revision, commit1)
+
+        # Modify one file, delete another, and add a third
+        commit2 = self.commit({'file1.txt': 'foobar', 'dir/file3.txt': 'baz'})
+        backend = self.datasource.get_backend()
+        with backend.fetch() as local_path:
+            self.assertEqual(backend.revision, commit2)
+            self.assertEqual(backend.changed_paths, {'file1.txt', 'file2.txt', 'dir/file3.txt'})
+            self.assertFalse(os.path.exists(os.path.join(local_path, 'file2.txt')))
+            with open(os.path.join(local_path, 'dir', 'file3.txt')) as f:
+                self.assertEqual(f.read(), 'baz')
+
+        # Changes are determined relative to the last synchronized commit, even if the mirror is already up to date
+        self.assertEqual(self.datasource.sync(), {'file1.txt', 'file2.txt', 'dir/file3.txt'})
+        self.assertEqual(self.get_datafiles(), {'file1.txt': 'foobar', 'dir/file3.txt': 'baz'})
+        self.datasource.refresh_from_db()
+        self.assertEqual(self.datasource.synced_revision, commit2)
+
+        # Resync without any changes
+        self.assertEqual(self.datasource.sync(), set())
+
+    def test_sync_unknown_revision(self):
+        self.commit({'file1.txt': 'foo'})
+        self.datasource.sync()
+
+        # If the last synchronized commit is unknown, the working tree must be scanned in its entirety
+        self.datasource.synced_revision = '0' * 40
+        backend = self.datasource.get_backend()
+        with backend.fetch():
+            self.assertIsNone(backend.changed_paths)
+
+    def test_ignore_rules_changed(self):
+        self.commit({'file1.txt': 'foo', 'file2.log': 'bar'})
+        self.datasource.ignore_rules = '*.log'
+        self.datasource.save()
+        self.datasource.sync()
+        self.assertEqual(self.get_datafiles(), {'file1.txt': 'foo'})
+
+        # Changing the ignore rules should force a full resync
+        self.datasource.ignore_rules = ''
+        self.datasource.save()
+        self.assertEqual(self.datasource.synced_revision, '')
+        self.assertEqual(self.datasource.sync(), {'file2.log'})
+        self.assertEqual(self.get_datafiles(), {'file1.txt': 'foo', 'file2.log': 'bar'})
+
+    def test_rebuild_working_tree(self):
+        self.commit({'file1.txt': 'foo', 'file2.txt': 'bar'})
+        self.datasource.sync()
+
+        # Fail to update the working tree to a new commit
+        self.commit({'file1.txt': 'foobar'})
+        backend = self.datasource.get_backend()
+        with patch.object(GitBackend, '_update_working_tree', side_effect=OSError):
+            with self.assertRaises(OSError):
+                with backend.fetch():
+                    pass
+        repo, tree_path = self.get_mirror()
+        self.assertNotIn(GitBackend.MIRROR_TREE_REF, repo.refs)
+
+        # The working tree should be rebuilt from scratch on the next sync
+        (tree_path / 'stale.txt').write_text('stale')
+        self.assertEqual(self.datasource.sync(), {'file1.txt', 'file2.txt'})
+        self.assertFalse((tree_path / 'stale.txt').exists())
+        self.assertEqual(self.get_datafiles(), {'file1.txt': 'foobar'})
+
+
+class S3SyncTestCase(TestCase):
+    """
+    Test the incremental synchronization of an S3 DataSource from a persistent local copy, with boto3 mocked.
+    """
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        cache_path = override_settings(DATA_SOURCE_CACHE_PATH=temp_dir.name)
+        cache_path.enable()
+        self.addCleanup(cache_path.disable)
+
+        # Mock the contents of the bucket (a mapping of keys to content), and record each object downloaded
+        self.objects = {}
+        self.downloaded = []
+
+        def list_objects(Prefix):
+            return [
+                SimpleNamespace(key=key, e_tag=f'"{hashlib.md5(content.encode()).hexdigest()}"', size=len(content))
+                for key, content in self.objects.items()
+            ]
+
+        def download_file(bucket_name, key, filename):
+            self.downloaded.append(key)
+            with open(filename, 'w') as f:
+                f.write(self.objects[key])
+
+        boto3 = MagicMock()
+        s3 = boto3.resource.return_value
+        s3.Bucket.return_value.objects.filter.side_effect = list_objects
+        s3.meta.client.download_file.side_effect = download_file
+        for patcher in (
+            patch.dict(sys.modules, {'boto3': boto3}),
+            patch.object(S3Backend, 'init_config', return_value=None),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.datasource = DataSource.objects.create(
+            name='Data Source 1',
+            type='amazon-s3',
+            source_url='https://s3.us-east-1.amazonaws.com/bucket'
+        )
+
+    def sync(self):
+        """
+        Sync the DataSource, returning the backend used.
+        """
+        backends = []
+        get_backend = DataSource.get_backend
+
+        def capture_backend(datasource):
+            backends.append(get_backend(datasource))
+            return backends[-1]
+
+        self.downloaded = []
+        with patch.object(DataSource, 'get_backend', autospec=True, side_effect=capture_backend):
+            self.datasource.sync()
+        self.datasource.refresh_from_db()
+        return backends[0]
+
+    def get_datafiles(self):
+        return {
+            datafile.path: datafile.data_as_string for datafile in self.datasource.datafiles.all()
+        }
+
+    def test_sync_incremental(self):
+        self.objects = {'file1.txt': 'foo', 'file2.txt': 'bar'}
+        backend = self.sync()
+        self.assertIsNone(backend.changed_paths)
+        self.assertEqual(sorted(self.downloaded), ['file1.txt', 'file2.txt'])
+        self.assertEqual(self.get_datafiles(), {'file1.txt': 'foo', 'file2.txt': 'bar'})
+        self.assertEqual(self.datasource.synced_revision, backend.revision)
+        revision1 = backend.revision
+
+        # Modify, delete, and add an object
+        self.objects = {'file1.txt': 'foobar', 'file3.txt': 'baz'}
+        backend = self.sync()
+        self.assertEqual(backend.synced_revision, revision1)
+        self.assertEqual(backend.changed_paths, {'file1.txt', 'file2.txt', 'file3.txt'})
+        self.assertEqual(sorted(self.downloaded), ['file1.txt', 'file3.txt'])
+        self.assertEqual(self.get_datafiles(), {'file1.txt': 'foobar', 'file3.txt': 'baz'})
+        self.assertNotEqual(self.datasource.synced_revision, revision1)
+
+        # Resync without any changes
+        backend = self.sync()
+        self.assertEqual(backend.changed_paths, set())
+        self.assertEqual(self.downloaded, [])
+
+    def test_sync_unknown_revision(self):
+        self.objects = {'file1.txt': 'foo'}
+        self.sync()
+
+        # If the local manifest does not reflect the last sync, all files must be considered
+        DataSource.objects.filter(pk=self.datasource.pk).update(synced_revision='unknown')
+        self.datasource.refresh_from_db()
+        self.objects['file2.txt'] = 'bar'
+        backend = self.sync()
+        self.assertIsNone(backend.changed_paths)
+        self.assertEqual(self.downloaded, ['file2.txt'])
+        self.assertEqual(self.get_datafiles(), {'file1.txt': 'foo', 'file2.txt': 'bar'})
+        self.assertEqual(self.datasource.synced_revision, backend.revision)
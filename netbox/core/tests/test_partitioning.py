@@ -0,0 +1,96 @@
+import uuid
+from datetime import timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+
+from core.choices import ObjectChangeActionChoices
+from core.models import ObjectChange
+from core.partitioning import (
+    DEFAULT_PARTITION_SUFFIX, create_partitions, drop_expired_partitions, get_partitions, is_partitioned,
+    partition_changelog,
+)
+from dcim.models import Site
+
+
+class ChangelogPartitioningTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        site = Site.objects.create(name='Site 1', slug='site-1')
+        object_changes = ObjectChange.objects.bulk_create([
+            ObjectChange(
+                user_name='user1',
+                request_id=uuid.uuid4(),
+                action=ObjectChangeActionChoices.ACTION_UPDATE,
+                changed_object=site,
+                object_repr=str(site)
+            ) for __ in range(3)
+        ])
+        ObjectChange.objects.filter(pk=object_changes[0].pk).update(time=timezone.now() - timedelta(days=365))
+
+    def test_partition_changelog(self):
+        max_id = ObjectChange.objects.order_by('-pk').first().pk
+        oldest = ObjectChange.objects.order_by('time').first().time
+        self.assertFalse(is_partitioned())
+
+        copied_count = partition_changelog(months_ahead=2, batch_size=2)
+        self.assertTrue(is_partitioned())
+        self.assertEqual(copied_count, 3)
+        self.assertEqual(ObjectChange.objects.count(), 3)
+        # A partition should exist for each month from that of the oldest record through two months ahead
+        months = list(get_partitions())
+        self.assertEqual((months[0].year, months[0].month), (oldest.year, oldest.month))
+        self.assertEqual(len(months), (months[-1].year - months[0].year) * 12 + months[-1].month - months[0].month + 1)
+        now = timezone.now()
+        self.assertEqual(
+            (months[-1].year, months[-1].month),
+            (now.year + (now.month + 1) // 12, (now.month + 1) % 12 + 1)
+        )
+
+        # IDs assigned to new records should follow those of existing records
+        site = Site.objects.get()
+        object_change = ObjectChange.objects.create(
+            user_name='user1',
+            request_id=uuid.uuid4(),
+            action=ObjectChangeActionChoices.ACTION_UPDATE,
+            changed_object=site
+        )
+        self.assertGreater(object_change.pk, max_id)
+
+        # Dropping expired partitions should delete only the oldest record
+        deleted_count = drop_expired_partitions(timezone.now() - timedelta(days=180))
+        self.assertEqual(deleted_count, 1)
+        self.assertEqual(ObjectChange.objects.count(), 3)
+
+    def test_create_partitions(self):
+        partition_changelog(months_ahead=0)
+        months = list(get_partitions())
+
+        # Records beyond the last partition are held by the default partition
+        site = Site.objects.get()
+        future = timezone.now() + timedelta(days=45)
+        object_change = ObjectChange.objects.create(
+            user_name='user1',
+            request_id=uuid.uuid4(),
+            action=ObjectChangeActionChoices.ACTION_UPDATE,
+            changed_object=site
+        )
+        ObjectChange.objects.filter(pk=object_change.pk).update(time=future)
+        default_partition = ObjectChange._meta.db_table + DEFAULT_PARTITION_SUFFIX
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) FROM {connection.ops.quote_name(default_partition)}")
+            self.assertEqual(cursor.fetchone()[0], 1)
+
+        # Creating the partitions for the upcoming months should move the record out of the default partition
+        self.assertEqual(create_partitions(months_ahead=2), 2)
+        partitions = get_partitions()
+        self.assertEqual(len(partitions), len(months) + 2)
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) FROM {connection.ops.quote_name(default_partition)}")
+            self.assertEqual(cursor.fetchone()[0], 0)
+            month = max(month for month in partitions if month <= future)
+            cursor.execute(f"SELECT id FROM {connection.ops.quote_name(partitions[month])}")
+            self.assertEqual(cursor.fetchall(), [(object_change.pk,)])
+        self.assertEqual(ObjectChange.objects.count(), 4)
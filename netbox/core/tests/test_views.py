@@ -139,6 +139,36 @@ class ObjectChangeTestCase(TestCase):
         self.assertHttpStatus(response, 200)
 
 
+class JobDownloadTestCase(TestCase):
+    user_permissions = (
+        'core.view_job',
+    )
+
+    def setUp(self):
+        super().setUp()
+        self.job = Job.objects.create(
+            name='Export Objects',
+            job_id=uuid.uuid4(),
+            user=self.user,
+            data={'export_file': 'exports/test/sites.csv', 'filename': 'sites.csv', 'content_type': 'text/csv'}
+        )
+
+    def test_download_by_other_user(self):
+        self.job.user = User.objects.create_user(username='testuser2')
+        self.job.save()
+
+        # Another user's export must not be downloadable, even with permission to view the job
+        response = self.client.get(reverse('core:job_download', kwargs={'pk': self.job.pk}))
+        self.assertHttpStatus(response, 403)
+
+    def test_download_without_file(self):
+        self.job.data = {}
+        self.job.save()
+
+        response = self.client.get(reverse('core:job_download', kwargs={'pk': self.job.pk}))
+        self.assertHttpStatus(response, 404)
+
+
 class BackgroundTaskTestCase(TestCase):
     user_permissions = ()
 
@@ -7,7 +7,8 @@ from django.contrib import messages
 from django.contrib.auth.mixins import UserPassesTestMixin
 from django.core.cache import cache
 from django.db import connection, ProgrammingError
-from django.http import HttpResponse, HttpResponseForbidden, Http404
+from django.core.files.storage import default_storage
+from django.http import FileResponse, HttpResponse, HttpResponseForbidden, Http404
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
@@ -176,6 +177,30 @@ class JobView(generic.ObjectView):
     queryset = Job.objects.all()
 
 
+@register_model_view(Job, 'download')
+class JobDownloadView(generic.ObjectView):
+    """
+    Download the file produced by a job (e.g. a background export).
+    """
+    queryset = Job.objects.all()
+
+    def get(self, request, **kwargs):
+        job = self.get_object(**kwargs)
+        if not isinstance(job.data, dict) or not job.data.get('export_file'):
+            raise Http404(_("This job has no file available for download."))
+
+        # The file reflects the object permissions of the user who ran the job, so only that user may download it
+        if job.user != request.user and not request.user.is_superuser:
+            return HttpResponseForbidden()
+
+        return FileResponse(
+            default_storage.open(job.data['export_file'], 'rb'),
+            as_attachment=True,
+            filename=job.data.get('filename'),
+            content_type=job.data.get('content_type')
+        )
+
+
 @register_model_view(Job, 'delete')
 class JobDeleteView(generic.ObjectDeleteView):
     queryset = Job.objects.defer('data')
@@ -1,4 +1,6 @@
+import io
 import json
+import tarfile
 
 from django.test import override_settings, tag
 from django.urls import reverse
@@ -1471,6 +1473,50 @@ class DeviceTest(APIViewTestCases.APIViewTestCase):
         self.assertHttpStatus(response, status.HTTP_200_OK)
         self.assertEqual(response.data['content'], f'Config for device {device.name}')
 
+    def test_bulk_render_config(self):
+        configtemplate = ConfigTemplate.objects.create(
+            name='Config Template 1',
+            template_code='Config for device {{ device.name }}'
+        )
+        devices = list(Device.objects.all()[:2])
+        for device in devices:
+            device.config_template = configtemplate
+            device.save()
+
+        self.add_permissions('dcim.add_device')
+        url = reverse('dcim-api:device-bulk-render-config')
+        response = self.client.post(
+            f'{url}?id={devices[0].pk}&id={devices[1].pk}', {}, format='json', HTTP_ACCEPT='application/x-ndjson',
+            **self.header
+        )
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        results = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+        self.assertEqual(len(results), 2)
+        for result in results:
+            self.assertEqual(result['content'], f"Config for device {result['name']}")
+            self.assertIsNone(result['error'])
+
+    def test_bulk_render_config_tar(self):
+        configtemplate = ConfigTemplate.objects.create(
+            name='Config Template 1',
+            template_code='Config for device {{ device.name }}'
+        )
+        device = Device.objects.first()
+        device.name = '../devices/Device 1'
+        device.config_template = configtemplate
+        device.save()
+
+        self.add_permissions('dcim.add_device')
+        url = reverse('dcim-api:device-bulk-render-config')
+        response = self.client.post(
+            f'{url}?id={device.pk}', {}, format='json', HTTP_ACCEPT='application/x-tar', **self.header
+        )
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+
+        # Path separators in object names must not produce nested or path-traversing archive members
+        with tarfile.open(fileobj=io.BytesIO(b''.join(response.streaming_content))) as archive:
+            self.assertEqual(archive.getnames(), ['_devices_Device 1.txt'])
+
 
 class ModuleTest(APIViewTestCases.APIViewTestCase):
     model = Module
@@ -51,18 +51,37 @@ class CustomFieldsDataField(Field):
             self._custom_fields = CustomField.objects.filter(object_types=object_type)
         return self._custom_fields
 
+    def _get_nested_serializer(self, cf, many=False):
+        """
+        Return a reusable nested serializer instance for object-type custom field values. Used by the compiled
+        representation path to avoid initializing a new serializer for each value.
+        """
+        if not hasattr(self, '_nested_serializers'):
+            self._nested_serializers = {}
+        if cf.pk not in self._nested_serializers:
+            serializer = get_serializer_for_model(cf.related_object_type.model_class())
+            self._nested_serializers[cf.pk] = serializer(nested=True, many=many, context=self.parent.context)
+        return self._nested_serializers[cf.pk]
+
     def to_representation(self, obj):
         # TODO: Fix circular import
         from utilities.api import get_serializer_for_model
+        compiled = self.context.get('compiled_representation')
         data = {}
         for cf in self._get_custom_fields():
             value = cf.deserialize(obj.get(cf.name))
             if value is not None and cf.type == CustomFieldTypeChoices.TYPE_OBJECT:
-                serializer = get_serializer_for_model(cf.related_object_type.model_class())
-                value = serializer(value, nested=True, context=self.parent.context).data
+                if compiled:
+                    value = self._get_nested_serializer(cf).to_representation(value)
+                else:
+                    serializer = get_serializer_for_model(cf.related_object_type.model_class())
+                    value = serializer(value, nested=True, context=self.parent.context).data
             elif value is not None and cf.type == CustomFieldTypeChoices.TYPE_MULTIOBJECT:
-                serializer = get_serializer_for_model(cf.related_object_type.model_class())
-                value = serializer(value, nested=True, many=True, context=self.parent.context).data
+                if compiled:
+                    value = self._get_nested_serializer(cf, many=True).to_representation(value)
+                else:
+                    serializer = get_serializer_for_model(cf.related_object_type.model_class())
+                    value = serializer(value, nested=True, many=True, context=self.parent.context).data
             data[cf.name] = value
 
         return data
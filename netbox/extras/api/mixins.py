@@ -1,10 +1,21 @@
+import io
+import json
+import re
+import tarfile
+import time
+
+from django.http import StreamingHttpResponse
 from jinja2.exceptions import TemplateError
 from rest_framework.decorators import action
 from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
-from rest_framework.status import HTTP_400_BAD_REQUEST
+from rest_framework.status import HTTP_202_ACCEPTED, HTTP_400_BAD_REQUEST
 
-from netbox.api.renderers import TextRenderer
+from core.api.serializers import JobSerializer
+from extras.jobs import RenderConfigJob
+from extras.utils import render_configs
+from netbox.api.renderers import NDJSONRenderer, TarRenderer, TextRenderer
+from utilities.request import get_boolean_param
 from .serializers import ConfigTemplateSerializer
 
 __all__ = (
@@ -83,3 +94,76 @@ class RenderConfigMixin(ConfigTemplateRenderMixin):
         context_data.update({object_type: instance})
 
         return self.render_configtemplate(request, configtemplate, context_data)
+
+    @action(
+        detail=False,
+        methods=['post'],
+        url_path='render-config',
+        url_name='bulk-render-config',
+        renderer_classes=[NDJSONRenderer, TarRenderer, JSONRenderer]
+    )
+    def bulk_render_config(self, request):
+        """
+        Render the preferred ConfigTemplate for all objects matching the provided filters. Results are streamed as
+        newline-delimited JSON (one object per line) or, if "application/x-tar" is requested, as a tar archive of
+        rendered configs. Specify `?background=true` to render the configs in a background job instead.
+        """
+        queryset = self.filter_queryset(self.queryset)
+        context = request.data if isinstance(request.data, dict) else {}
+
+        if get_boolean_param(request.query_params, 'background'):
+            job = RenderConfigJob.enqueue(
+                user=request.user,
+                model=queryset.model._meta.label_lower,
+                pk_list=list(queryset.values_list('pk', flat=True)),
+                context=context
+            )
+            serializer = JobSerializer(job, context={'request': request})
+            return Response(serializer.data, status=HTTP_202_ACCEPTED)
+
+        results = render_configs(queryset, context)
+        if request.accepted_renderer.format == 'tar':
+            response = StreamingHttpResponse(self._stream_tar(results), content_type=TarRenderer.media_type)
+            filename = f'{queryset.model._meta.model_name}_configs.tar'
+            response['Content-Disposition'] = f'attachment; filename="{filename}"'
+            return response
+
+        return StreamingHttpResponse(self._stream_ndjson(results), content_type=NDJSONRenderer.media_type)
+
+    @staticmethod
+    def _stream_ndjson(results):
+        for instance, configtemplate, output, error in results:
+            yield json.dumps({
+                'id': instance.pk,
+                'name': str(instance),
+                'configtemplate': {
+                    'id': configtemplate.pk,
+                    'name': configtemplate.name,
+                } if configtemplate else None,
+                'content': output,
+                'error': error,
+            }) + '\n'
+
+    @staticmethod
+    def _stream_tar(results):
+        buffer = io.BytesIO()
+        names = set()
+        with tarfile.open(fileobj=buffer, mode='w|') as archive:
+            for instance, configtemplate, output, error in results:
+                # Ensure a safe & unique file name per object (names may contain path separators)
+                name = re.sub(r'[/\\]', '_', instance.name or '').lstrip('.') or str(instance.pk)
+                if name in names:
+                    name = f'{name}_{instance.pk}'
+                names.add(name)
+
+                content = (output if error is None else error).encode('utf-8')
+                info = tarfile.TarInfo(name=f'{name}.error' if error else f'{name}.txt')
+                info.size = len(content)
+                info.mtime = int(time.time())
+                archive.addfile(info, io.BytesIO(content))
+
+                # Flush the archive content written so far
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue()
@@ -7,6 +7,16 @@ CUSTOMFIELD_EMPTY_VALUES = (None, '', [])
 # Template Export
 DEFAULT_MIME_TYPE = 'text/plain; charset=utf-8'
 
+# Bulk config rendering
+RENDER_CONFIG_CHUNK_SIZE = 100
+RENDER_CONFIG_WORKERS = 4
+
+# Config context caching
+CONFIG_CONTEXT_CACHE_CHUNK_SIZE = 500
+
+# Sharded script execution
+SCRIPT_SHARD_SIZE = 1000
+
 # Webhooks
 HTTP_CONTENT_TYPE_JSON = 'application/json'
 
@@ -145,7 +145,7 @@ class ExportTemplateImportForm(CSVModelForm):
         model = ExportTemplate
         fields = (
             'name', 'object_types', 'description', 'environment_params', 'mime_type', 'file_name', 'file_extension',
-            'as_attachment', 'template_code',
+            'as_attachment', 'prefetches', 'template_code',
         )
 
 
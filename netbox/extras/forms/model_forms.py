@@ -264,7 +264,8 @@ class ExportTemplateForm(SyncedDataMixin, forms.ModelForm):
         FieldSet('name', 'object_types', 'description', 'template_code', name=_('Export Template')),
         FieldSet('data_source', 'data_file', 'auto_sync_enabled', name=_('Data Source')),
         FieldSet(
-            'mime_type', 'file_name', 'file_extension', 'environment_params', 'as_attachment', name=_('Rendering')
+            'mime_type', 'file_name', 'file_extension', 'environment_params', 'as_attachment', 'prefetches',
+            name=_('Rendering')
         ),
     )
 
@@ -288,6 +289,11 @@ class ExportTemplateForm(SyncedDataMixin, forms.ModelForm):
         if not self.cleaned_data.get('template_code') and not self.cleaned_data.get('data_file'):
             raise forms.ValidationError(_("Must specify either local content or a data file"))
 
+        # Pass the assigned object types to model validation (for validation of prefetches)
+        self.instance._m2m_values = {
+            'object_types': list(self.cleaned_data.get('object_types') or []),
+        }
+
         return self.cleaned_data
 
 
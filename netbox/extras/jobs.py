@@ -1,16 +1,30 @@
+import json
 import logging
+import tempfile
 import traceback
+import uuid
+from collections import Counter
 from contextlib import ExitStack
 
-from django.db import transaction
+from django.apps import apps
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db import router, transaction
 from django.utils.translation import gettext as _
+from rq import get_current_job
 
+from core.choices import JobIntervalChoices, JobStatusChoices
+from core.models import Job
 from core.signals import clear_events
 from extras.models import Script as ScriptModel
-from netbox.jobs import JobRunner
+from netbox.api.renderers import NDJSONRenderer
+from netbox.jobs import JobLogWriter, JobRunner, system_job
 from netbox.registry import registry
 from utilities.exceptions import AbortScript, AbortTransaction
-from .utils import is_report
+from utilities.rqworker import get_queue_for_model
+from .constants import CONFIG_CONTEXT_CACHE_CHUNK_SIZE, RENDER_CONFIG_WORKERS
+from .utils import is_report, render_configs
 
 
 class ScriptJob(JobRunner):
@@ -80,6 +94,77 @@ class ScriptJob(JobRunner):
         finally:
             self.job.data = script.get_job_data()
 
+    def execute_script(self, script, request, data, commit, log_job=None):
+        """
+        Execute the script, recording its log to the log entries of the given job (by default, this job). If commit is
+        True, wrap execution with the event_tracking context manager to ensure we process change logging, event rules,
+        etc.
+        """
+        with JobLogWriter(log_job or self.job) as log_writer:
+            script.log_writer = log_writer
+            if commit:
+                with ExitStack() as stack:
+                    for request_processor in registry['request_processors']:
+                        stack.enter_context(request_processor(request))
+                    self.run_script(script, request, data, commit)
+            else:
+                self.run_script(script, request, data, commit)
+
+    def dispatch_shards(self, script, queryset, data, request, commit):
+        """
+        Split the script's shard queryset into shards and create a child job to run the script for each. The results
+        of each shard are aggregated into this job's data, and this job is terminated once all child jobs have finished.
+        """
+        logger = logging.getLogger(f"netbox.scripts.{script.full_name}")
+        pk_list = list(queryset.order_by('pk').values_list('pk', flat=True))
+        shards = [pk_list[i:i + script.shard_size] for i in range(0, len(pk_list), script.shard_size)]
+        logger.info(f"Dispatching {len(pk_list)} objects among {len(shards)} shards (commit={commit})")
+
+        # Child jobs are executed in parallel by the available workers. If this job is not being run by a worker (e.g.
+        # it was run from the CLI), they are instead executed in turn within this process.
+        immediate = get_current_job() is None
+
+        self.job.data = {
+            'log_counts': {},
+            'output': '',
+            'tests': script.tests,
+            'shards': {
+                'total': len(shards),
+                'finished': 0,
+                'errored': 0,
+                'failed': 0,
+                'commit': commit,
+            },
+        }
+
+        # Create all child jobs atomically: Background tasks are enqueued only upon commit, ensuring that this job
+        # cannot be terminated before every child job exists.
+        with transaction.atomic():
+            self.job.save()
+            children = []
+            for shard in shards:
+                if immediate:
+                    children.append(Job.objects.create(
+                        name=ScriptShardJob.name,
+                        user=self.job.user,
+                        job_id=uuid.uuid4(),
+                        parent=self.job
+                    ))
+                else:
+                    ScriptShardJob.enqueue(
+                        user=self.job.user,
+                        queue_name=get_queue_for_model(self.job.object_type.model),
+                        parent=self.job,
+                        data=data,
+                        pk_list=shard,
+                        request=request,
+                        commit=commit,
+                        job_timeout=script.job_timeout
+                    )
+
+        for job, shard in zip(children, shards):
+            ScriptShardJob.handle(job, data=data, pk_list=shard, request=request, commit=commit)
+
     def run(self, data, request=None, commit=True, **kwargs):
         """
         Run the script.
@@ -92,6 +177,12 @@ class ScriptJob(JobRunner):
         """
         script = ScriptModel.objects.get(pk=self.job.object_id).python_class()
 
+        # Distribute execution of the script among child jobs if it declares a queryset to shard
+        queryset = script.get_shard_queryset(data)
+        if queryset is not None:
+            self.dispatch_shards(script, queryset, data, request, commit)
+            return
+
         # Add files to form data
         if request:
             files = request.FILES
@@ -101,12 +192,169 @@ class ScriptJob(JobRunner):
         # Add the current request as a property of the script
         script.request = request
 
-        # Execute the script. If commit is True, wrap it with the event_tracking context manager to ensure we process
-        # change logging, event rules, etc.
-        if commit:
-            with ExitStack() as stack:
-                for request_processor in registry['request_processors']:
-                    stack.enter_context(request_processor(request))
-                self.run_script(script, request, data, commit)
-        else:
-            self.run_script(script, request, data, commit)
+        self.execute_script(script, request, data, commit)
+
+
+class ScriptShardJob(ScriptJob):
+    """
+    Execution of a script for one shard of the objects over which its execution is distributed. The script's log is
+    recorded to the parent job, and its results are aggregated into the parent job's data.
+    """
+
+    class Meta:
+        name = 'Run Script Shard'
+
+    def record_result(self, script, errored=False):
+        """
+        Aggregate the results of this shard into the parent job's data.
+        """
+        with transaction.atomic():
+            # Lock the parent job to serialize updates from concurrently running shards
+            parent = Job.objects.select_for_update().get(pk=self.job.parent_id)
+            data = parent.data
+
+            shards = data['shards']
+            shards['finished'] += 1
+            if errored:
+                shards['errored'] += 1
+            if script.failed:
+                shards['failed'] += 1
+
+            if script.log_writer:
+                data['log_counts'] = dict(Counter(data['log_counts']) + script.log_writer.counts)
+            if script.output:
+                data['output'] = '\n'.join(filter(None, (data['output'], str(script.output))))
+            for test_name, results in script.tests.items():
+                totals = data['tests'].setdefault(test_name, {'log': []})
+                for key, value in results.items():
+                    if key == 'log':
+                        totals['log'].extend(value)
+                    else:
+                        totals[key] = totals.get(key, 0) + value
+
+            parent.save(update_fields=('data',))
+
+    def run(self, data, pk_list, request=None, commit=True, **kwargs):
+        """
+        Run the script for a single shard.
+
+        Args:
+            data: A dictionary of data to be passed to the script upon execution
+            pk_list: The primary keys of the objects in the shard
+            request: The WSGI request associated with this execution (if any)
+            commit: Passed through to Script.run()
+        """
+        script = ScriptModel.objects.get(pk=self.job.parent.object_id).python_class()
+
+        try:
+            script.shard = script.get_shard_queryset(data).filter(pk__in=pk_list)
+
+            # Add files to form data
+            if request:
+                files = request.FILES
+                for field_name, fileobj in files.items():
+                    data[field_name] = fileobj
+
+            # Add the current request as a property of the script
+            script.request = request
+
+            self.execute_script(script, request, data, commit, log_job=self.job.parent)
+        except Exception:
+            self.record_result(script, errored=True)
+            raise
+
+        self.record_result(script)
+
+
+class RenderConfigJob(JobRunner):
+    """
+    Render the preferred ConfigTemplate for a set of Devices or VirtualMachines in bulk.
+    """
+
+    class Meta:
+        name = 'Render Configs'
+
+    def run(self, model, pk_list, context=None, workers=RENDER_CONFIG_WORKERS, **kwargs):
+        """
+        Args:
+            model: The label of the model being rendered (e.g. "dcim.device")
+            pk_list: A list of primary keys identifying the objects to render
+            context: Additional context data to apply when rendering each object (optional)
+            workers: The number of threads among which rendering is distributed
+        """
+        logger = logging.getLogger('netbox.jobs.RenderConfigJob')
+        queryset = apps.get_model(model).objects.filter(pk__in=pk_list)
+        filename = f'{queryset.model._meta.model_name}_configs.ndjson'
+
+        # Spool the rendered configs to a temporary file (one JSON object per line) before saving it to storage
+        total = failed = 0
+        with tempfile.TemporaryFile() as f:
+            for instance, configtemplate, output, error in render_configs(queryset, context, workers=workers):
+                f.write(json.dumps({
+                    'id': instance.pk,
+                    'name': str(instance),
+                    'configtemplate': configtemplate.pk if configtemplate else None,
+                    'content': output,
+                    'error': error,
+                }).encode('utf-8') + b'\n')
+                total += 1
+                if error:
+                    failed += 1
+            size = f.tell()
+            path = default_storage.save(f'exports/{self.job.job_id}/{filename}', File(f, name=filename))
+
+        logger.info(f"Rendered {total - failed} configs ({failed} failed)")
+        self.job.data = {
+            'export_file': path,
+            'filename': filename,
+            'content_type': NDJSONRenderer.media_type,
+            'size': size,
+            'total': total,
+            'failed': failed,
+        }
+
+
+@system_job(interval=JobIntervalChoices.INTERVAL_HOURLY)
+class ConfigContextCacheJob(JobRunner):
+    """
+    Recompute the cached config context data for all Devices and VirtualMachines whose cached data is stale.
+    """
+
+    class Meta:
+        name = 'Config Context Cache'
+
+    @classmethod
+    def enqueue_refresh(cls):
+        """
+        Enqueue an immediate refresh of stale config context data, unless one is already pending.
+        """
+        if not cls.get_jobs().filter(status=JobStatusChoices.STATUS_PENDING).exists():
+            cls.enqueue()
+
+    def run(self, *args, **kwargs):
+        if not settings.CONFIG_CONTEXT_CACHE_ENABLED:
+            return
+        logger = logging.getLogger('netbox.jobs.ConfigContextCacheJob')
+
+        for model in (apps.get_model('dcim', 'Device'), apps.get_model('virtualization', 'VirtualMachine')):
+            stale_ids = list(model.objects.filter(_config_context__isnull=True).values_list('pk', flat=True))
+            for i in range(0, len(stale_ids), CONFIG_CONTEXT_CACHE_CHUNK_SIZE):
+                pk_list = stale_ids[i:i + CONFIG_CONTEXT_CACHE_CHUNK_SIZE]
+                with transaction.atomic(using=router.db_for_write(model)):
+                    # Lock the objects which are still stale before computing their config context data. Any
+                    # concurrent invalidation must then wait for the data written here to be committed (and will
+                    # overwrite it), while any invalidation committed before this point is reflected by the data read.
+                    stale = model.objects.filter(_config_context__isnull=True)
+                    pk_list = list(
+                        stale.filter(pk__in=pk_list).select_for_update(of=('self',)).values_list('pk', flat=True)
+                    )
+                    instances = list(
+                        model.objects.filter(pk__in=pk_list).annotate_config_context_data().only(
+                            'pk', 'local_context_data', '_config_context'
+                        )
+                    )
+                    for instance in instances:
+                        instance._config_context = instance.get_config_context()
+                    # Write only to objects whose cached data remains unset
+                    stale.bulk_update(instances, ['_config_context'])
+            logger.info(f"Refreshed cached config context data for {len(stale_ids)} {model._meta.verbose_name_plural}")
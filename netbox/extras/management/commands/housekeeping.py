@@ -8,16 +8,44 @@ from django.core.management.base import BaseCommand
 from django.utils import timezone
 from packaging import version
 
+from core.constants import HOUSEKEEPING_BATCH_PAUSE
+from core.jobs import SystemHousekeepingJob
 from core.models import Job, ObjectChange
+from core.partitioning import create_partitions, is_partitioned
 from netbox.config import Config
+from utilities.constants import BULK_DELETE_BATCH_SIZE
 from utilities.proxy import resolve_proxies
 
 
 class Command(BaseCommand):
     help = "Perform nightly housekeeping tasks. (This command can be run at any time.)"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=BULK_DELETE_BATCH_SIZE,
+            help="The number of expired records to delete at a time"
+        )
+        parser.add_argument(
+            '--pause', type=float, default=HOUSEKEEPING_BATCH_PAUSE,
+            help="The number of seconds to wait between batches of deleted records"
+        )
+
+    def progress(self, options, total):
+        """
+        Return a callback which reports the progress of a bulk deletion.
+        """
+        def callback(count):
+            if options['verbosity'] >= 2:
+                self.stdout.write(f"\tDeleted {count}/{total} records")
+                self.stdout.flush()
+        return callback
+
     def handle(self, *args, **options):
         config = Config()
+        batch_options = {
+            'batch_size': options['batch_size'],
+            'pause': options['pause'],
+        }
 
         # Clear expired authentication sessions (essentially replicating the `clearsessions` command)
         if options['verbosity']:
@@ -36,6 +64,14 @@ class Command(BaseCommand):
                     f"clearing sessions; skipping."
                 )
 
+        # Create any upcoming changelog partitions (if the changelog has been partitioned)
+        if is_partitioned():
+            if options['verbosity']:
+                self.stdout.write("[*] Checking for upcoming changelog partitions")
+            created_count = create_partitions()
+            if options['verbosity']:
+                self.stdout.write(f"\tCreated {created_count} partitions.", self.style.SUCCESS)
+
         # Delete expired ObjectChanges
         if options['verbosity']:
             self.stdout.write("[*] Checking for expired changelog records")
@@ -47,15 +83,15 @@ class Command(BaseCommand):
             expired_records = ObjectChange.objects.filter(time__lt=cutoff).count()
             if expired_records:
                 if options['verbosity']:
-                    self.stdout.write(
-                        f"\tDeleting {expired_records} expired records... ",
-                        self.style.WARNING,
-                        ending=""
-                    )
+                    self.stdout.write(f"\tDeleting {expired_records} expired records...", self.style.WARNING)
                     self.stdout.flush()
-                ObjectChange.objects.filter(time__lt=cutoff).delete()
+                deleted_count = SystemHousekeepingJob.delete_expired_changes(
+                    cutoff,
+                    callback=self.progress(options, expired_records),
+                    **batch_options
+                )
                 if options['verbosity']:
-                    self.stdout.write("Done.", self.style.SUCCESS)
+                    self.stdout.write(f"\tDeleted {deleted_count} records.", self.style.SUCCESS)
             elif options['verbosity']:
                 self.stdout.write("\tNo expired records found.", self.style.SUCCESS)
         elif options['verbosity']:
@@ -74,15 +110,15 @@ class Command(BaseCommand):
             expired_records = Job.objects.filter(created__lt=cutoff).count()
             if expired_records:
                 if options['verbosity']:
-                    self.stdout.write(
-                        f"\tDeleting {expired_records} expired records... ",
-                        self.style.WARNING,
-                        ending=""
-                    )
+                    self.stdout.write(f"\tDeleting {expired_records} expired records...", self.style.WARNING)
                     self.stdout.flush()
-                Job.objects.filter(created__lt=cutoff).delete()
+                deleted_count = SystemHousekeepingJob.delete_expired_jobs(
+                    cutoff,
+                    callback=self.progress(options, expired_records),
+                    **batch_options
+                )
                 if options['verbosity']:
-                    self.stdout.write("Done.", self.style.SUCCESS)
+                    self.stdout.write(f"\tDeleted {deleted_count} records.", self.style.SUCCESS)
             elif options['verbosity']:
                 self.stdout.write("\tNo expired records found.", self.style.SUCCESS)
         elif options['verbosity']:
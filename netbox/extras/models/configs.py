@@ -167,6 +167,15 @@ class ConfigContextModel(models.Model):
         )
     )
 
+    # Pre-merged config context data, maintained when CONFIG_CONTEXT_CACHE_ENABLED is True. A null value indicates
+    # that the cached data is stale and must be recomputed.
+    _config_context = models.JSONField(
+        blank=True,
+        null=True,
+        editable=False,
+        serialize=False
+    )
+
     class Meta:
         abstract = True
 
@@ -175,6 +184,9 @@ class ConfigContextModel(models.Model):
         Compile all config data, overwriting lower-weight values with higher-weight values where a collision occurs.
         Return the rendered configuration context for a device or VM.
         """
+        if settings.CONFIG_CONTEXT_CACHE_ENABLED and self._config_context is not None:
+            return dict(self._config_context)
+
         data = {}
 
         if not hasattr(self, 'config_context_data'):
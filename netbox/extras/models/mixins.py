@@ -1,17 +1,18 @@
 import importlib.abc
 import importlib.util
+import itertools
 import os
 import sys
 
 from django.core.files.storage import storages
 from django.db import models
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from django.utils.module_loading import import_string
 from django.utils.translation import gettext_lazy as _
 
 from extras.constants import DEFAULT_MIME_TYPE, JINJA_ENV_PARAMS_WITH_PATH_IMPORT
 from extras.utils import filename_from_model, filename_from_object
-from utilities.jinja2 import render_jinja2
+from utilities.jinja2 import render_jinja2, stream_jinja2
 
 __all__ = (
     'PythonModuleMixin',
@@ -149,18 +150,45 @@ class RenderTemplateMixin(models.Model):
 
         return output
 
+    def render_stream(self, context=None, queryset=None):
+        """
+        Render the template incrementally, returning an iterator which yields the output in chunks. Unlike render(),
+        the complete output is never held in memory.
+        """
+        context = self.get_context(context=context, queryset=queryset)
+        env_params = self.get_environment_params()
+        output = stream_jinja2(self.template_code, context, env_params, getattr(self, 'data_file', None))
+
+        # Replace CRLF-style line terminators, carrying over any trailing CR in case a terminator spans two chunks
+        carry = ''
+        for chunk in output:
+            chunk = carry + chunk
+            if chunk.endswith('\r'):
+                chunk, carry = chunk[:-1], '\r'
+            else:
+                carry = ''
+            yield chunk.replace('\r\n', '\n')
+        if carry:
+            yield carry
+
     def render_to_response(self, context=None, queryset=None):
-        output = self.render(context=context, queryset=queryset)
         mime_type = self.mime_type or DEFAULT_MIME_TYPE
 
-        # Build the response
-        response = HttpResponse(output, content_type=mime_type)
+        # Build the response. Exports of a queryset are streamed to the client as they are rendered.
+        if queryset is not None:
+            output = self.render_stream(context=context, queryset=queryset)
+            # Render the first chunk immediately so that any errors are raised before the response is returned
+            first_chunk = next(output, '')
+            response = StreamingHttpResponse(itertools.chain([first_chunk], output), content_type=mime_type)
+        else:
+            output = self.render(context=context, queryset=queryset)
+            response = HttpResponse(output, content_type=mime_type)
 
         if self.as_attachment:
             extension = f'.{self.file_extension}' if self.file_extension else ''
             if self.file_name:
                 filename = self.file_name
-            elif queryset:
+            elif queryset is not None:
                 filename = filename_from_model(queryset.model)
             elif context:
                 filename = filename_from_object(context)
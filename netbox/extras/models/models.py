@@ -23,6 +23,8 @@ from netbox.models import ChangeLoggedModel
 from netbox.models.features import (
     CloningMixin, CustomFieldsMixin, CustomLinksMixin, ExportTemplatesMixin, SyncedDataMixin, TagsMixin
 )
+from utilities.export import ChunkedQuerySet
+from utilities.query import is_valid_prefetch
 from utilities.html import clean_html
 from utilities.jinja2 import render_jinja2
 from utilities.querydict import dict_to_querydict
@@ -407,9 +409,18 @@ class ExportTemplate(SyncedDataMixin, CloningMixin, ExportTemplatesMixin, Change
         max_length=200,
         blank=True
     )
+    prefetches = ArrayField(
+        base_field=models.CharField(max_length=200),
+        blank=True,
+        null=True,
+        verbose_name=_('prefetches'),
+        help_text=_(
+            'Related objects to prefetch when rendering the template (e.g. <code>interfaces__ip_addresses</code>)'
+        )
+    )
 
     clone_fields = (
-        'object_types', 'template_code', 'mime_type', 'file_name', 'file_extension', 'as_attachment',
+        'object_types', 'template_code', 'mime_type', 'file_name', 'file_extension', 'as_attachment', 'prefetches',
     )
 
     class Meta:
@@ -435,6 +446,25 @@ class ExportTemplate(SyncedDataMixin, CloningMixin, ExportTemplatesMixin, Change
                 'name': _('"{name}" is a reserved name. Please choose a different name.').format(name=self.name)
             })
 
+        # Validate prefetch lookups against each assigned object type (these would otherwise fail only once rendering
+        # of an export has begun)
+        if self.prefetches:
+            if 'object_types' in getattr(self, '_m2m_values', {}):
+                object_types = self._m2m_values['object_types']
+            elif self.pk:
+                object_types = self.object_types.all()
+            else:
+                object_types = []
+            for object_type in object_types:
+                model = object_type.model_class()
+                for lookup in self.prefetches:
+                    if model and not is_valid_prefetch(model, lookup):
+                        raise ValidationError({
+                            'prefetches': _('Invalid prefetch for {model}: {lookup}').format(
+                                model=model._meta.verbose_name, lookup=lookup
+                            )
+                        })
+
     def sync_data(self):
         """
         Synchronize template content from the designated DataFile (if any).
@@ -443,6 +473,12 @@ class ExportTemplate(SyncedDataMixin, CloningMixin, ExportTemplatesMixin, Change
     sync_data.alters_data = True
 
     def get_context(self, context=None, queryset=None):
+        if queryset is not None:
+            if self.prefetches:
+                queryset = queryset.prefetch_related(*self.prefetches)
+            # Consume the queryset in chunks rather than loading all objects into memory at once
+            queryset = ChunkedQuerySet(queryset)
+
         _context = {
             'queryset': queryset,
         }
@@ -1,5 +1,6 @@
+from django.conf import settings
 from django.contrib.postgres.aggregates import JSONBAgg
-from django.db.models import OuterRef, Subquery, Q
+from django.db.models import Case, JSONField, OuterRef, Subquery, Q, Value, When
 
 from extras.models.tags import TaggedItem
 from utilities.query_functions import EmptyGroupByJSONBAgg
@@ -84,16 +85,78 @@ class ConfigContextModelQuerySet(RestrictedQuerySet):
         Attach the subquery annotation to the base queryset
         """
         from extras.models import ConfigContext
-        return self.annotate(
-            config_context_data=Subquery(
-                ConfigContext.objects.filter(
-                    self._get_config_context_filters()
-                ).annotate(
-                    _data=EmptyGroupByJSONBAgg('data', ordering=['weight', 'name'])
-                ).values("_data").order_by()
+        config_context_data = Subquery(
+            ConfigContext.objects.filter(
+                self._get_config_context_filters()
+            ).annotate(
+                _data=EmptyGroupByJSONBAgg('data', ordering=['weight', 'name'])
+            ).values("_data").order_by()
+        )
+
+        # Evaluate the subquery only for objects which have no cached config context data
+        if settings.CONFIG_CONTEXT_CACHE_ENABLED:
+            config_context_data = Case(
+                When(_config_context__isnull=True, then=config_context_data),
+                default=Value(None, output_field=JSONField()),
             )
+
+        return self.annotate(
+            config_context_data=config_context_data
         ).distinct()
 
+    def for_config_context(self, config_context):
+        """
+        Return all objects to which the given ConfigContext may apply, based on its assignments (regardless of
+        whether it is active).
+        """
+        model_name = self.model._meta.model_name
+        queryset = self
+
+        def descendants(nodes):
+            return nodes.model.objects.get_queryset_descendants(nodes, include_self=True)
+
+        # Map each assignment to the corresponding filter for this model
+        assignments = (
+            (config_context.regions.all(), 'site__region__in', descendants),
+            (config_context.site_groups.all(), 'site__group__in', descendants),
+            (config_context.sites.all(), 'site__in', None),
+            (config_context.roles.all(), 'role__in', descendants),
+            (config_context.platforms.all(), 'platform__in', None),
+            (config_context.cluster_types.all(), 'cluster__type__in', None),
+            (config_context.cluster_groups.all(), 'cluster__group__in', None),
+            (config_context.clusters.all(), 'cluster__in', None),
+            (config_context.tenant_groups.all(), 'tenant__group__in', None),
+            (config_context.tenants.all(), 'tenant__in', None),
+            (config_context.tags.all(), 'tags__in', None),
+        )
+        for objects, lookup, resolve in assignments:
+            if objects.exists():
+                queryset = queryset.filter(**{lookup: resolve(objects) if resolve else objects})
+
+        # Location & DeviceType assignments apply only to Devices
+        for objects, lookup in (
+            (config_context.locations.all(), 'location__in'),
+            (config_context.device_types.all(), 'device_type__in'),
+        ):
+            if objects.exists():
+                if model_name != 'device':
+                    return self.none()
+                queryset = queryset.filter(**{lookup: objects})
+
+        return queryset.distinct()
+
+    def invalidate_config_context(self):
+        """
+        Mark the cached config context data of all objects in the queryset as stale. Returns the number of objects
+        affected.
+
+        Objects already marked as stale are updated as well: This ensures that the invalidation waits for any refresh
+        of their cached data which is in progress, rather than being overtaken by it.
+        """
+        return self.model.objects.filter(
+            pk__in=self.values('pk')
+        ).update(_config_context=None)
+
     def _get_config_context_filters(self):
         # Construct the set of Q objects for the specific object types
         tag_query_filters = {
@@ -14,6 +14,7 @@ from django.utils.functional import classproperty
 from django.utils.translation import gettext as _
 
 from extras.choices import LogLevelChoices
+from extras.constants import SCRIPT_SHARD_SIZE
 from extras.models import ScriptModule
 from ipam.formfields import IPAddressFormField, IPNetworkFormField
 from ipam.validators import MaxPrefixLengthValidator, MinPrefixLengthValidator, prefix_validator
@@ -296,10 +297,12 @@ class BaseScript:
         pass
 
     def __init__(self):
-        self.messages = []  # Primary script log
+        self.messages = []  # Primary script log (if not recorded by a log writer)
+        self.log_writer = None  # Records the primary script log to the job's log entries
         self.tests = {}  # Mapping of logs for test methods
         self.output = ''
         self.failed = False
+        self.shard = None  # The subset of the shard queryset to be processed by this execution (if sharded)
         self._current_test = None  # Tracks the current test method being run (if any)
 
         # Initiate the log
@@ -368,6 +371,10 @@ class BaseScript:
     def scheduling_enabled(self):
         return getattr(self.Meta, 'scheduling_enabled', True)
 
+    @classproperty
+    def shard_size(self):
+        return getattr(self.Meta, 'shard_size', SCRIPT_SHARD_SIZE)
+
     @property
     def filename(self):
         return inspect.getfile(self.__class__)
@@ -447,10 +454,25 @@ class BaseScript:
         self.run_tests()
         self.post_run()
 
+    def get_shard_queryset(self, data):
+        """
+        Override this method to return a queryset over which execution of the script is distributed. The queryset is
+        split into shards of `shard_size` objects, each of which is processed by a separate child job; `run()` is called
+        once per shard, with `self.shard` set to the objects in that shard.
+        """
+        return None
+
     def get_job_data(self):
         """
         Return a dictionary of data to attach to the script's Job.
         """
+        if self.log_writer:
+            # Log entries are recorded separately; include only a count of entries per level
+            return {
+                'log_counts': dict(self.log_writer.counts),
+                'output': self.output,
+                'tests': self.tests,
+            }
         return {
             'log': self.messages,
             'output': self.output,
@@ -530,13 +552,17 @@ class BaseScript:
         elif message:
 
             # Record to the script's log
-            self.messages.append({
-                'time': timezone.now().isoformat(),
-                'status': level,
-                'message': str(message),
-                'obj': str(obj) if obj else None,
-                'url': obj.get_absolute_url() if hasattr(obj, 'get_absolute_url') else None,
-            })
+            url = obj.get_absolute_url() if hasattr(obj, 'get_absolute_url') else None
+            if self.log_writer:
+                self.log_writer.write(level, str(message), str(obj) if obj else '', url or '')
+            else:
+                self.messages.append({
+                    'time': timezone.now().isoformat(),
+                    'status': level,
+                    'message': str(message),
+                    'obj': str(obj) if obj else None,
+                    'url': url,
+                })
 
             # Record to the system log
             if obj:
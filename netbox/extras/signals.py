@@ -1,5 +1,11 @@
+from collections import defaultdict
+
+from django.apps import apps
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
-from django.db.models.signals import m2m_changed, post_save, pre_delete
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, post_save, pre_delete, pre_save
 from django.dispatch import receiver
 
 from core.events import *
@@ -9,9 +15,9 @@ from extras.events import process_event_rules
 from extras.models import EventRule, Notification, Subscription
 from netbox.config import get_config
 from netbox.registry import registry
-from netbox.signals import post_clean
+from netbox.signals import post_bulk_update, post_clean
 from utilities.exceptions import AbortRequest
-from .models import CustomField, TaggedItem
+from .models import ConfigContext, ConfigContextModel, CustomField, TaggedItem
 from .utils import run_validators
 
 
@@ -89,6 +95,107 @@ def validate_assigned_tags(sender, instance, action, model, pk_set, **kwargs):
             raise AbortRequest(f"Tag {tag} cannot be assigned to {ct.model} objects.")
 
 
+#
+# Config context caching
+#
+
+# Models from which config context assignment is derived, mapped to a function returning the lookup which identifies
+# dependent Devices & VirtualMachines, and the fields which affect assignment
+CONFIG_CONTEXT_DEPENDENCIES = {
+    'dcim.region': (lambda obj: {'site__region__in': obj.get_descendants(include_self=True)}, ('parent',)),
+    'dcim.sitegroup': (lambda obj: {'site__group__in': obj.get_descendants(include_self=True)}, ('parent',)),
+    'dcim.site': (lambda obj: {'site': obj}, ('region', 'group')),
+    'dcim.location': (lambda obj: {'location': obj}, ()),
+    'dcim.devicerole': (lambda obj: {'role__in': obj.get_descendants(include_self=True)}, ('parent',)),
+    'dcim.platform': (lambda obj: {'platform': obj}, ()),
+    'virtualization.cluster': (lambda obj: {'cluster': obj}, ('type', 'group')),
+    'virtualization.clustertype': (lambda obj: {'cluster__type': obj}, ()),
+    'virtualization.clustergroup': (lambda obj: {'cluster__group': obj}, ()),
+    'tenancy.tenant': (lambda obj: {'tenant': obj}, ('group',)),
+    'tenancy.tenantgroup': (lambda obj: {'tenant__group': obj}, ()),
+    'extras.tag': (lambda obj: {'tags': obj}, ()),
+}
+
+
+def _config_context_models():
+    return apps.get_model('dcim', 'Device'), apps.get_model('virtualization', 'VirtualMachine')
+
+
+def _enqueue_config_context_refresh():
+    from .jobs import ConfigContextCacheJob
+    transaction.on_commit(ConfigContextCacheJob.enqueue_refresh)
+
+
+@receiver(pre_save)
+def invalidate_own_config_context(sender, instance, **kwargs):
+    """
+    Mark the cached config context data for a Device or VirtualMachine as stale whenever it is saved.
+    """
+    if settings.CONFIG_CONTEXT_CACHE_ENABLED and isinstance(instance, ConfigContextModel):
+        instance._config_context = None
+
+
+@receiver(m2m_changed, sender=TaggedItem)
+def invalidate_tagged_config_context(sender, instance, action, **kwargs):
+    """
+    Mark the cached config context data for a Device or VirtualMachine as stale when its tags change.
+    """
+    if not settings.CONFIG_CONTEXT_CACHE_ENABLED or not isinstance(instance, ConfigContextModel):
+        return
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        type(instance).objects.filter(pk=instance.pk).invalidate_config_context()
+
+
+def invalidate_config_context(instance, **kwargs):
+    """
+    Mark the cached config context data as stale for all Devices & VirtualMachines to which a ConfigContext applies.
+    This is called both before and after changes to its assignments, to account for objects which no longer apply.
+    """
+    if not settings.CONFIG_CONTEXT_CACHE_ENABLED:
+        return
+    if kwargs.get('action') not in (None, 'pre_remove', 'pre_clear', 'post_add', 'post_remove'):
+        return
+
+    invalidated = 0
+    for model in _config_context_models():
+        invalidated += model.objects.for_config_context(instance).invalidate_config_context()
+    if invalidated:
+        _enqueue_config_context_refresh()
+
+
+post_save.connect(invalidate_config_context, sender=ConfigContext)
+pre_delete.connect(invalidate_config_context, sender=ConfigContext)
+for field in ConfigContext._meta.many_to_many:
+    m2m_changed.connect(invalidate_config_context, sender=field.remote_field.through)
+
+
+@receiver((post_save, pre_delete))
+def invalidate_dependent_config_context(sender, instance, **kwargs):
+    """
+    Mark the cached config context data as stale for all Devices & VirtualMachines whose config context assignment
+    depends on the modified object.
+    """
+    if not settings.CONFIG_CONTEXT_CACHE_ENABLED or kwargs.get('created'):
+        return
+    if (dependency := CONFIG_CONTEXT_DEPENDENCIES.get(sender._meta.label_lower)) is None:
+        return
+    get_lookup, fields = dependency
+
+    # On update, skip if none of the relevant fields have changed (if this can be determined)
+    if 'created' in kwargs:
+        if not fields:
+            return
+        if snapshot := getattr(instance, '_prechange_snapshot', None):
+            if not any(snapshot.get(field) != instance.serializable_value(field) for field in fields):
+                return
+
+    invalidated = 0
+    for model in _config_context_models():
+        invalidated += model.objects.filter(**get_lookup(instance)).invalidate_config_context()
+    if invalidated:
+        _enqueue_config_context_refresh()
+
+
 #
 # Event rules
 #
@@ -139,8 +246,8 @@ def process_job_end_event_rules(sender, **kwargs):
 
 @receiver((post_save, pre_delete))
 def notify_object_changed(sender, instance, **kwargs):
-    # Skip for newly-created objects
-    if kwargs.get('created'):
+    # Skip for newly-created objects, and for objects updated in bulk (handled by notify_objects_changed())
+    if kwargs.get('created') or kwargs.get('bulk'):
         return
 
     # Determine event type
@@ -172,3 +279,41 @@ def notify_object_changed(sender, instance, **kwargs):
         )
         for user in subscribed_users
     ])
+
+
+@receiver(post_bulk_update)
+def notify_objects_changed(sender, instances, **kwargs):
+    # Skip unsupported object types
+    ct = ContentType.objects.get_for_model(sender)
+    if ct.model not in registry['model_features']['notifications'].get(ct.app_label, []):
+        return
+
+    # Find all subscribed Users for the updated objects
+    instances = {instance.pk: instance for instance in instances}
+    subscriptions = Subscription.objects.filter(
+        object_type=ct,
+        object_id__in=list(instances)
+    ).values_list('object_id', 'user')
+    subscribed_users = defaultdict(list)
+    for object_id, user in subscriptions:
+        subscribed_users[object_id].append(user)
+    if not subscribed_users:
+        return
+
+    # Delete any existing Notifications for the objects
+    query = Q()
+    for object_id, users in subscribed_users.items():
+        query |= Q(object_id=object_id, user__in=users)
+    Notification.objects.filter(query, object_type=ct).delete()
+
+    # Create Notifications for Subscribers
+    Notification.objects.bulk_create([
+        Notification(
+            user_id=user,
+            object=instances[object_id],
+            object_repr=Notification.get_object_repr(instances[object_id]),
+            event_type=OBJECT_UPDATED
+        )
+        for object_id, users in subscribed_users.items()
+        for user in users
+    ])
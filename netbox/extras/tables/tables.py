@@ -6,7 +6,7 @@ from django.utils.translation import gettext_lazy as _
 
 from extras.models import *
 from core.tables import JobTable
-from core.models import Job
+from core.models import Job, JobLogEntry
 from netbox.constants import EMPTY_TABLE_TEXT
 from netbox.events import get_event_text
 from netbox.tables import BaseTable, NetBoxTable, columns
@@ -682,6 +682,7 @@ class ScriptResultsTable(BaseTable):
     )
 
     class Meta(BaseTable.Meta):
+        model = JobLogEntry
         empty_text = _(EMPTY_TABLE_TEXT)
         fields = (
             'index', 'time', 'status', 'object', 'message',
@@ -2,11 +2,11 @@ import tempfile
 from pathlib import Path
 
 from django.forms import ValidationError
-from django.test import tag, TestCase
+from django.test import override_settings, tag, TestCase
 
 from core.models import DataSource, ObjectType
 from dcim.models import Device, DeviceRole, DeviceType, Location, Manufacturer, Platform, Region, Site, SiteGroup
-from extras.models import ConfigContext, ConfigTemplate, Tag
+from extras.models import ConfigContext, ConfigTemplate, ExportTemplate, Tag
 from tenancy.models import Tenant, TenantGroup
 from utilities.exceptions import AbortRequest
 from virtualization.models import Cluster, ClusterGroup, ClusterType, VirtualMachine
@@ -544,6 +544,45 @@ class ConfigContextTest(TestCase):
         with self.assertRaises(ValidationError):
             device.clean()
 
+    @override_settings(CONFIG_CONTEXT_CACHE_ENABLED=True)
+    def test_cached_config_context(self):
+        device = Device.objects.first()
+        Device.objects.filter(pk=device.pk).update(_config_context={'foo': 'cached'})
+        device.refresh_from_db()
+        self.assertEqual(device.get_config_context(), {'foo': 'cached'})
+
+        # The annotation should be bypassed for objects with cached data
+        device = Device.objects.filter(pk=device.pk).annotate_config_context_data().first()
+        self.assertIsNone(device.config_context_data)
+        self.assertEqual(device.get_config_context(), {'foo': 'cached'})
+
+    @override_settings(CONFIG_CONTEXT_CACHE_ENABLED=True)
+    def test_cached_config_context_invalidation(self):
+        device = Device.objects.first()
+        site = Site.objects.first()
+        site2 = Site.objects.create(name='Site 2', slug='site-2')
+        Device.objects.filter(pk=device.pk).update(_config_context={'foo': 'cached'})
+
+        # Assigning a ConfigContext to another site should not invalidate the cached data
+        context = ConfigContext.objects.create(name='context 1', weight=100, data={'foo': 'bar'})
+        Device.objects.filter(pk=device.pk).update(_config_context={'foo': 'cached'})
+        context.sites.add(site2)
+        device.refresh_from_db()
+        self.assertEqual(device._config_context, {'foo': 'cached'})
+
+        # Assigning it to the device's site should
+        context.sites.add(site)
+        device.refresh_from_db()
+        self.assertIsNone(device._config_context)
+        self.assertEqual(device.get_config_context(), {'foo': 'bar'})
+
+        # Saving the device invalidates its cached data
+        Device.objects.filter(pk=device.pk).update(_config_context={'foo': 'cached'})
+        device.refresh_from_db()
+        device.save()
+        device.refresh_from_db()
+        self.assertIsNone(device._config_context)
+
 
 class ConfigTemplateTest(TestCase):
     """
@@ -606,3 +645,27 @@ class ConfigTemplateTest(TestCase):
     @tag('regression')
     def test_config_template_with_data_source_nested_templates(self):
         self.assertEqual(self.BASE_TEMPLATE, self.main_config_template.render({}))
+
+
+class ExportTemplateTest(TestCase):
+
+    def test_clean_prefetches(self):
+        export_template = ExportTemplate.objects.create(
+            name='Export Template 1',
+            template_code='{% for device in queryset %}{{ device.name }}{% endfor %}'
+        )
+        export_template.object_types.set([ObjectType.objects.get_for_model(Device)])
+
+        export_template.prefetches = ['interfaces__ip_addresses', 'site__tenant']
+        export_template.full_clean()
+
+        # Invalid lookups should be rejected rather than failing during rendering
+        export_template.prefetches = ['interfaces__invalid']
+        with self.assertRaises(ValidationError):
+            export_template.full_clean()
+
+        # Object types assigned prior to saving should be taken into account
+        export_template._m2m_values = {'object_types': [ObjectType.objects.get_for_model(Site)]}
+        export_template.prefetches = ['interfaces']
+        with self.assertRaises(ValidationError):
+            export_template.full_clean()
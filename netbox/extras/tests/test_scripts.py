@@ -1,12 +1,18 @@
 import logging
 import tempfile
 from datetime import date, datetime, timezone
+from unittest.mock import patch
 
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase
 from netaddr import IPAddress, IPNetwork
 
-from dcim.models import DeviceRole
+from core.choices import JobStatusChoices, ManagedFileRootPathChoices
+from core.models import Job, JobLogEntry
+from dcim.models import DeviceRole, Site
+from extras.choices import LogLevelChoices
+from extras.jobs import ScriptJob, ScriptShardJob
+from extras.models import Script as ScriptModel, ScriptModule
 from extras.scripts import *
 from utilities.testing import disable_logging
 
@@ -34,6 +40,33 @@ JSON_DATA = """
 """
 
 
+class ShardedScript(Script):
+    """
+    Process all sites, distributed among shards of two sites each.
+    """
+    class Meta:
+        name = 'Sharded script'
+        shard_size = 2
+
+    def get_shard_queryset(self, data):
+        return Site.objects.all()
+
+    def run(self, data, commit):
+        self.run_tests()
+        for site in self.shard:
+            if site.name == data.get('error_on'):
+                raise Exception(f"Error processing {site}")
+            if site.name == data.get('fail_on'):
+                self.log_failure(f"Failed to process {site}", obj=site)
+            else:
+                self.log_info(f"Processed {site}", obj=site)
+        return f"Processed {len(self.shard)} sites"
+
+    def test_shard(self):
+        for site in self.shard:
+            self.log_success(f"Checked {site}", obj=site)
+
+
 class ScriptTest(TestCase):
 
     def test_load_yaml(self):
@@ -371,3 +404,92 @@ class ScriptVariablesTest(TestCase):
         self.assertEqual(form.cleaned_data['var1'], input_datetime)
         # Validate required=False works for this Var type
         self.assertEqual(form.cleaned_data['var2'], None)
+
+
+class ScriptShardingTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.bulk_create([
+            Site(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 6)
+        ])
+        module = ScriptModule.objects.create(
+            file_root=ManagedFileRootPathChoices.SCRIPTS,
+            file_path='/var/tmp/sharded_script.py'
+        )
+        cls.script = ScriptModel.objects.create(module=module, name='Sharded script', is_executable=True)
+
+    def setUp(self):
+        patcher = patch.object(ScriptModel, 'python_class', new=property(lambda self: ShardedScript))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_script(self, data=None):
+        return ScriptJob.enqueue(instance=self.script, immediate=True, data=data or {}, request=None, commit=True)
+
+    def test_sharded_execution(self):
+        job = self.run_script()
+
+        self.assertEqual(job.status, JobStatusChoices.STATUS_COMPLETED)
+        children = job.children.all()
+        self.assertEqual(len(children), 3)
+        for child in children:
+            self.assertEqual(child.name, ScriptShardJob.name)
+            self.assertEqual(child.status, JobStatusChoices.STATUS_COMPLETED)
+            self.assertFalse(child.log_entries.exists())
+
+        # The results of all shards should be aggregated into the parent job's data
+        self.assertEqual(job.data['shards'], {
+            'total': 3,
+            'finished': 3,
+            'errored': 0,
+            'failed': 0,
+            'commit': True,
+        })
+        self.assertEqual(job.data['log_counts'], {LogLevelChoices.LOG_INFO: 5})
+        self.assertEqual(job.data['output'], 'Processed 2 sites\nProcessed 2 sites\nProcessed 1 sites')
+        self.assertEqual(job.data['tests']['test_shard'][LogLevelChoices.LOG_SUCCESS], 5)
+        self.assertEqual(len(job.data['tests']['test_shard']['log']), 5)
+
+        # Log entries for all shards should be recorded to the parent job
+        self.assertEqual(
+            sorted(JobLogEntry.objects.filter(job=job).values_list('message', flat=True)),
+            [f'Processed Site {i}' for i in range(1, 6)]
+        )
+
+    def test_sharded_execution_failure(self):
+        job = self.run_script(data={'fail_on': 'Site 3'})
+
+        self.assertEqual(job.status, JobStatusChoices.STATUS_COMPLETED)
+        self.assertEqual(job.data['shards']['finished'], 3)
+        self.assertEqual(job.data['shards']['errored'], 0)
+        self.assertEqual(job.data['shards']['failed'], 1)
+        self.assertEqual(job.data['log_counts'], {LogLevelChoices.LOG_INFO: 4, LogLevelChoices.LOG_FAILURE: 1})
+        entry = JobLogEntry.objects.get(job=job, level=LogLevelChoices.LOG_FAILURE)
+        self.assertEqual(entry.message, 'Failed to process Site 3')
+        self.assertEqual(entry.object_repr, 'Site 3')
+
+    def test_sharded_execution_error(self):
+        with disable_logging():
+            job = self.run_script(data={'error_on': 'Site 3'})
+
+        # The parent job should reflect the error raised by one of its shards
+        self.assertEqual(job.status, JobStatusChoices.STATUS_ERRORED)
+        self.assertEqual(job.error, '1 of 3 child jobs errored')
+        statuses = list(job.children.order_by('pk').values_list('status', flat=True))
+        self.assertEqual(statuses, [
+            JobStatusChoices.STATUS_COMPLETED,
+            JobStatusChoices.STATUS_ERRORED,
+            JobStatusChoices.STATUS_COMPLETED,
+        ])
+        self.assertEqual(job.data['shards'], {
+            'total': 3,
+            'finished': 3,
+            'errored': 1,
+            'failed': 1,
+            'commit': True,
+        })
+        self.assertEqual(job.data['output'], 'Processed 2 sites\nProcessed 1 sites')
+        entry = JobLogEntry.objects.get(job=job, level=LogLevelChoices.LOG_FAILURE)
+        self.assertIn('Error processing Site 3', entry.message)
+        self.assertFalse(Job.objects.filter(parent=job, log_entries__isnull=False).exists())
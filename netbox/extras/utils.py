@@ -1,11 +1,17 @@
 import importlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
 from django.core.exceptions import ImproperlyConfigured
-from django.db import models
+from django.db import connections, models
 from django.db.models import Q
+from django.utils.translation import gettext as _
+from jinja2.exceptions import TemplateError
 from taggit.managers import _TaggableManager
 
 from netbox.context import current_request
+from .constants import RENDER_CONFIG_CHUNK_SIZE
 from .validators import CustomValidator
 
 __all__ = (
@@ -14,6 +20,7 @@ __all__ = (
     'is_report',
     'is_script',
     'is_taggable',
+    'render_configs',
     'run_validators',
 )
 
@@ -120,3 +127,73 @@ def run_validators(instance, validators):
             raise ImproperlyConfigured(f"Invalid value for custom validator: {validator}")
 
         validator(instance, request)
+
+
+def _render_config(instance, extra_context, config_templates):
+    """
+    Render the preferred ConfigTemplate for a single Device or VirtualMachine.
+    """
+    model_name = instance._meta.model_name
+    if (configtemplate := instance.get_config_template()) is None:
+        return instance, None, None, _("No config template found for this {object_type}.").format(
+            object_type=model_name
+        )
+
+    # Share a single ConfigTemplate instance (and its DataFile) among all objects to which it applies
+    configtemplate = config_templates.setdefault(configtemplate.pk, configtemplate)
+
+    # Compile context data
+    context_data = instance.get_config_context()
+    context_data.update(extra_context or {})
+    context_data.update({model_name: instance})
+
+    try:
+        return instance, configtemplate, configtemplate.render(context=context_data), None
+    except TemplateError as e:
+        return instance, configtemplate, None, _("An error occurred while rendering the template: {error}").format(
+            error=e
+        )
+
+
+def _render_config_chunk(instances, extra_context, config_templates, close_connections=False):
+    try:
+        return [_render_config(instance, extra_context, config_templates) for instance in instances]
+    finally:
+        # Release any database connections opened by a pool thread
+        if close_connections:
+            connections.close_all()
+
+
+def render_configs(queryset, extra_context=None, workers=None, chunk_size=RENDER_CONFIG_CHUNK_SIZE):
+    """
+    Render the preferred ConfigTemplate for each Device or VirtualMachine in the queryset. Config context data is
+    annotated for the entire queryset, which is then consumed in chunks. Yields a tuple of (instance, config template,
+    rendered output, error message) for each object, in queryset order.
+
+    Args:
+        queryset: A queryset of objects which support ConfigContext and ConfigTemplate assignment
+        extra_context: Additional context data to apply for each object (optional)
+        workers: The number of threads among which rendering is distributed (renders inline if not set)
+        chunk_size: The number of objects to fetch and render at a time
+    """
+    queryset = queryset.select_related(
+        'config_template', 'role__config_template', 'platform__config_template',
+    ).annotate_config_context_data()
+    instances = queryset.iterator(chunk_size=chunk_size)
+    chunks = iter(lambda: list(islice(instances, chunk_size)), [])
+    config_templates = {}
+
+    if not workers or workers < 2:
+        for chunk in chunks:
+            yield from _render_config_chunk(chunk, extra_context, config_templates)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Bound the number of in-flight chunks to keep memory consumption flat
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_render_config_chunk, chunk, extra_context, config_templates, True))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
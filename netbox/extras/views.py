@@ -2,7 +2,8 @@ from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.contenttypes.models import ContentType
 from django.core.paginator import EmptyPage
-from django.db.models import Count, Q
+from django.db.models import Count, F, Q, Window
+from django.db.models.functions import RowNumber
 from django.http import HttpResponseBadRequest, HttpResponseForbidden, HttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
@@ -1430,31 +1431,48 @@ class ScriptResultView(TableMixin, generic.ObjectView):
             log_threshold = LOG_LEVEL_RANK[request.GET.get('log_threshold', LogLevelChoices.LOG_INFO)]
         except KeyError:
             log_threshold = LOG_LEVEL_RANK[LogLevelChoices.LOG_INFO]
-        if job.data:
-
-            if 'log' in job.data:
-                if 'tests' in job.data:
-                    tests = job.data['tests']
-
-                for log in job.data['log']:
-                    log_level = LOG_LEVEL_RANK.get(log.get('status'), LogLevelChoices.LOG_INFO)
-                    if log_level >= log_threshold:
-                        index += 1
-                        result = {
-                            'index': index,
-                            'time': log.get('time'),
-                            'status': log.get('status'),
-                            'message': log.get('message'),
-                            'object': log.get('obj'),
-                            'url': log.get('url'),
-                        }
-                        data.append(result)
-
-                table = ScriptResultsTable(data, user=request.user)
-                table.configure(request)
+        if not job.data or 'log_counts' in job.data:
+            # Log entries are recorded separately from the job, and may be retrieved while it is still running
+            levels = [level for level, rank in LOG_LEVEL_RANK.items() if rank >= log_threshold]
+            log_entries = job.log_entries.filter(level__in=levels).annotate(
+                index=Window(RowNumber(), order_by='pk'),
+                status=F('level'),
+                object=F('object_repr'),
+            ).values('index', 'time', 'status', 'object', 'url', 'message')
+            if job.data:
+                tests = job.data.get('tests')
+            if tests:
+                # Combine the script log with the logs of test methods below
+                data = list(log_entries)
+                index = len(data)
             else:
-                # for legacy reports
-                tests = job.data
+                table = ScriptResultsTable(log_entries, user=request.user)
+                table.configure(request)
+
+        elif 'log' in job.data:
+            if 'tests' in job.data:
+                tests = job.data['tests']
+
+            for log in job.data['log']:
+                log_level = LOG_LEVEL_RANK.get(log.get('status'), LogLevelChoices.LOG_INFO)
+                if log_level >= log_threshold:
+                    index += 1
+                    result = {
+                        'index': index,
+                        'time': log.get('time'),
+                        'status': log.get('status'),
+                        'message': log.get('message'),
+                        'object': log.get('obj'),
+                        'url': log.get('url'),
+                    }
+                    data.append(result)
+
+            table = ScriptResultsTable(data, user=request.user)
+            table.configure(request)
+
+        else:
+            # for legacy reports
+            tests = job.data
 
         if tests:
             for method, test_data in tests.items():
@@ -1492,7 +1510,7 @@ class ScriptResultView(TableMixin, generic.ObjectView):
             response['Content-Disposition'] = f'attachment; filename="{filename}"'
             return response
 
-        elif job.completed:
+        elif job.started:
             table = self.get_table(job, request, bulk_actions=False)
 
         log_threshold = request.GET.get('log_threshold', LogLevelChoices.LOG_INFO)
@@ -1507,7 +1525,7 @@ class ScriptResultView(TableMixin, generic.ObjectView):
             'log_threshold': log_threshold,
         }
 
-        if job.data and 'log' in job.data:
+        if job.data and ('log' in job.data or 'log_counts' in job.data):
             # Script
             context['tests'] = job.data.get('tests', {})
         elif job.data:
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from django.core.exceptions import ObjectDoesNotExist
 from django.db.backends.postgresql.psycopg_any import NumericRange
 from django.utils.translation import gettext as _
@@ -143,8 +145,18 @@ class SerializedPKRelatedField(PrimaryKeyRelatedField):
         super().__init__(**kwargs)
 
     def to_representation(self, value):
+        # Reuse a single nested serializer instance when the compiled representation path is enabled
+        if self.context.get('compiled_representation'):
+            return self._nested_serializer.to_representation(value)
         return self.serializer(value, nested=self.nested, context={'request': self.context['request']}).data
 
+    @cached_property
+    def _nested_serializer(self):
+        return self.serializer(nested=self.nested, context={
+            'request': self.context['request'],
+            'compiled_representation': True,
+        })
+
 
 @extend_schema_field(OpenApiTypes.INT64)
 class RelatedObjectCountField(serializers.ReadOnlyField):
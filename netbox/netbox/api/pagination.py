@@ -1,5 +1,14 @@
-from django.db.models import QuerySet
+import base64
+import json
+import operator
+from functools import reduce
+
+from django.core.exceptions import ValidationError
+from django.db import connections
+from django.db.models import F, OrderBy, Q, QuerySet
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 from netbox.api.exceptions import QuerySetNotOrdered
 from netbox.config import get_config
@@ -10,9 +19,27 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
     Override the stock paginator to allow setting limit=0 to disable pagination for a request. This returns all objects
     matching a query, but retains the same format as a paginated request. The limit can only be disabled if
     MAX_PAGE_SIZE has been set to 0 or None.
+
+    Keyset (cursor) pagination can be requested by passing the `cursor` query parameter (empty for the first page).
+    Rather than skipping over `offset` rows, each page is retrieved by filtering on the ordering values of the last
+    object of the previous page, which remains fast regardless of how deep into the result set a client has paged.
+
+    The `count` query parameter controls how the total object count is determined: `false` omits the count, and
+    `estimate` uses the table statistics maintained by PostgreSQL for unfiltered querysets. With keyset pagination,
+    the count is omitted unless requested (e.g. `count=true`).
     """
+    cursor_query_param = 'cursor'
+    count_query_param = 'count'
+    invalid_cursor_message = 'Invalid cursor'
+
+    # Estimated counts below this threshold are replaced with an exact count
+    estimate_count_threshold = 10000
+
     def __init__(self):
         self.default_limit = get_config().PAGINATE_COUNT
+        self.keyset = False
+        self.has_next = False
+        self.next_cursor = None
 
     def paginate_queryset(self, queryset, request, view=None):
 
@@ -22,27 +49,145 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
                 "ordering has been applied to the queryset for this API endpoint."
             )
 
+        self.limit = self.get_limit(request)
+        self.offset = self.get_offset(request)
+        self.request = request
+        self.keyset = bool(
+            isinstance(queryset, QuerySet) and self.limit and self.cursor_query_param in request.query_params
+        )
+
         if isinstance(queryset, QuerySet):
-            self.count = self.get_queryset_count(queryset)
+            self.count = self.get_count(queryset, request)
         else:
             # We're dealing with an iterable, not a QuerySet
             self.count = len(queryset)
 
-        self.limit = self.get_limit(request)
-        self.offset = self.get_offset(request)
-        self.request = request
+        if self.keyset:
+            return self.paginate_keyset(queryset, request)
 
-        if self.limit and self.count > self.limit and self.template is not None:
+        if self.count is not None and self.limit and self.count > self.limit and self.template is not None:
             self.display_page_controls = True
 
-        if self.count == 0 or self.offset > self.count:
+        if self.count == 0 or (self.count is not None and self.offset > self.count):
             return list()
 
-        if self.limit:
-            return list(queryset[self.offset:self.offset + self.limit])
-        else:
+        if not self.limit:
             return list(queryset[self.offset:])
 
+        if self.count is None:
+            # Retrieve one additional object to determine whether a next page exists
+            results = list(queryset[self.offset:self.offset + self.limit + 1])
+            self.has_next = len(results) > self.limit
+            return results[:self.limit]
+
+        return list(queryset[self.offset:self.offset + self.limit])
+
+    def paginate_keyset(self, queryset, request):
+        """
+        Return a page of objects following the position encoded in the request's cursor.
+        """
+        ordering = self.get_keyset_ordering(queryset)
+
+        # Annotate the value of each ordering expression, so that the position of the last object can be recorded
+        aliases = [f'_cursor_{i}' for i in range(len(ordering))]
+        queryset = queryset.annotate(**{
+            alias: expression for alias, (expression, _, _) in zip(aliases, ordering)
+        }).order_by(*[
+            OrderBy(
+                F(alias), descending=descending, nulls_first=nulls_first or None, nulls_last=not nulls_first or None
+            )
+            for alias, (_, descending, nulls_first) in zip(aliases, ordering)
+        ])
+
+        if cursor := request.query_params.get(self.cursor_query_param):
+            values = self.decode_cursor(cursor, len(ordering))
+            try:
+                queryset = queryset.filter(self.get_keyset_filter(aliases, ordering, values))
+            except (TypeError, ValueError, ValidationError):
+                raise NotFound(self.invalid_cursor_message)
+
+        # Retrieve one additional object to determine whether a next page exists
+        results = list(queryset[:self.limit + 1])
+        self.has_next = len(results) > self.limit
+        results = results[:self.limit]
+        if self.has_next:
+            self.next_cursor = self.encode_cursor([getattr(results[-1], alias) for alias in aliases])
+
+        return results
+
+    @staticmethod
+    def get_keyset_ordering(queryset):
+        """
+        Return the ordering of the queryset as a list of (expression, descending, nulls_first) tuples. The primary key
+        is appended (if not already present) to guarantee that each position is unique. Ordering by a related object
+        orders by its primary key rather than by the related model's ordering.
+        """
+        if queryset.query.order_by:
+            order_by = queryset.query.order_by
+        elif queryset.query.default_ordering:
+            order_by = queryset.model._meta.ordering
+        else:
+            order_by = ()
+
+        ordering = []
+        for field in order_by:
+            if isinstance(field, str):
+                if field == '?':
+                    continue
+                descending = field.startswith('-')
+                # PostgreSQL sorts nulls as greater than any other value by default
+                ordering.append((F(field.lstrip('-')), descending, descending))
+            elif isinstance(field, OrderBy):
+                if field.nulls_first or field.nulls_last:
+                    nulls_first = bool(field.nulls_first)
+                else:
+                    nulls_first = field.descending
+                ordering.append((field.expression, field.descending, nulls_first))
+            else:
+                ordering.append((field, False, False))
+
+        pk_names = ('pk', queryset.model._meta.pk.name)
+        if not any(isinstance(expression, F) and expression.name in pk_names for expression, _, _ in ordering):
+            ordering.append((F('pk'), False, False))
+
+        return ordering
+
+    @staticmethod
+    def get_keyset_filter(aliases, ordering, values):
+        """
+        Return a Q object matching all objects which follow the given position (the values of each ordering
+        expression for the last object on the previous page).
+        """
+        conditions = []
+        preceding = Q()
+        for alias, (_, descending, nulls_first), value in zip(aliases, ordering, values):
+            if value is None:
+                # Only non-null values can follow a null if nulls are sorted first
+                if nulls_first:
+                    conditions.append(preceding & Q(**{f'{alias}__isnull': False}))
+                preceding &= Q(**{f'{alias}__isnull': True})
+            else:
+                following = Q(**{f'{alias}__{"lt" if descending else "gt"}': value})
+                if not nulls_first:
+                    following |= Q(**{f'{alias}__isnull': True})
+                conditions.append(preceding & following)
+                preceding &= Q(**{alias: value})
+
+        return reduce(operator.or_, conditions, Q(pk__in=[]))
+
+    def encode_cursor(self, values):
+        data = json.dumps(values, default=str, separators=(',', ':'))
+        return base64.urlsafe_b64encode(data.encode()).decode()
+
+    def decode_cursor(self, cursor, length):
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if type(values) is not list or len(values) != length:
+            raise NotFound(self.invalid_cursor_message)
+        return values
+
     def get_limit(self, request):
         if self.limit_query_param:
             MAX_PAGE_SIZE = get_config().MAX_PAGE_SIZE
@@ -61,15 +206,62 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
 
         return self.default_limit
 
+    def get_count(self, queryset, request):
+        """
+        Return the total number of objects in the queryset, an estimate thereof, or None, per the `count` query
+        parameter. The count is omitted by default for keyset pagination, where it would otherwise dominate the cost
+        of retrieving each page.
+        """
+        count = request.query_params.get(self.count_query_param, '').lower()
+        if count in ('false', '0') or (self.keyset and not count):
+            return None
+        if count == 'estimate':
+            return self.get_estimated_count(queryset)
+        return self.get_queryset_count(queryset)
+
     def get_queryset_count(self, queryset):
         return queryset.count()
 
+    def get_estimated_count(self, queryset):
+        """
+        Return the number of rows in the queryset's table as estimated by PostgreSQL. This is available only for
+        unfiltered querysets; otherwise an exact count is returned.
+        """
+        if not queryset.query.where:
+            with connections[queryset.db].cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+                    [queryset.model._meta.db_table]
+                )
+                row = cursor.fetchone()
+            # reltuples is -1 if the table has not yet been analyzed
+            if row and row[0] >= self.estimate_count_threshold:
+                return int(row[0])
+
+        return self.get_queryset_count(queryset)
+
     def get_next_link(self):
 
         # Pagination has been disabled
         if not self.limit:
             return None
 
+        if self.keyset:
+            if not self.has_next:
+                return None
+            url = self.request.build_absolute_uri()
+            url = replace_query_param(url, self.limit_query_param, self.limit)
+            url = remove_query_param(url, self.offset_query_param)
+            return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+        # The total count is unknown
+        if self.count is None:
+            if not self.has_next:
+                return None
+            url = self.request.build_absolute_uri()
+            url = replace_query_param(url, self.limit_query_param, self.limit)
+            return replace_query_param(url, self.offset_query_param, self.offset + self.limit)
+
         return super().get_next_link()
 
     def get_previous_link(self):
@@ -78,6 +270,10 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
         if not self.limit:
             return None
 
+        # Keyset pagination is forward-only
+        if self.keyset:
+            return None
+
         return super().get_previous_link()
 
 
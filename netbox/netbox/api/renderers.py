@@ -1,10 +1,41 @@
+import json
+from itertools import islice
+
 from rest_framework.renderers import BaseRenderer, BrowsableAPIRenderer
+from rest_framework.utils.encoders import JSONEncoder
 
 __all__ = (
     'FormlessBrowsableAPIRenderer',
+    'NDJSONRenderer',
+    'TarRenderer',
     'TextRenderer',
+    'render_json_stream',
 )
 
+# Number of objects to render into each chunk of a streamed response
+STREAM_BATCH_SIZE = 100
+
+
+def _batched(items, size):
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def render_json_stream(renderer, data, results, batch_size=STREAM_BATCH_SIZE):
+    """
+    Render a JSON document incrementally using the given JSONRenderer. The data dictionary is rendered as-is, with an
+    empty "results" list (which must be its last key) replaced by the objects yielded by results.
+    """
+    head, tail = renderer.render({**data, 'results': []}).rsplit(b'[]', 1)
+    yield head + b'['
+    separator = b''
+    for batch in _batched(results, batch_size):
+        # Render each batch as a list and strip the enclosing brackets
+        yield separator + renderer.render(batch)[1:-1]
+        separator = b','
+    yield b']' + tail
+
 
 class FormlessBrowsableAPIRenderer(BrowsableAPIRenderer):
     """
@@ -26,3 +57,46 @@ class TextRenderer(BaseRenderer):
 
     def render(self, data, accepted_media_type=None, renderer_context=None):
         return str(data)
+
+
+class NDJSONRenderer(BaseRenderer):
+    """
+    Render a list of objects as newline-delimited JSON (one object per line).
+    """
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if not isinstance(data, list):
+            data = [data]
+        return b''.join(self._render_item(item) for item in data)
+
+    def render_stream(self, items, batch_size=STREAM_BATCH_SIZE):
+        """
+        Render an iterable of objects incrementally, yielding one chunk of lines per batch.
+        """
+        for batch in _batched(items, batch_size):
+            yield b''.join(self._render_item(item) for item in batch)
+
+    @staticmethod
+    def _render_item(item):
+        return json.dumps(item, cls=JSONEncoder, ensure_ascii=False).encode('utf-8') + b'\n'
+
+
+class TarRenderer(BaseRenderer):
+    """
+    Pass through raw tar archive content.
+    """
+    media_type = 'application/x-tar'
+    format = 'tar'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if isinstance(data, bytes):
+            return data
+        # Error responses are rendered as JSON
+        return json.dumps(data, cls=JSONEncoder).encode('utf-8')
@@ -1,11 +1,13 @@
-from functools import cached_property
+import copy
+from functools import cached_property, lru_cache
 
 from rest_framework import serializers
-from rest_framework.utils.serializer_helpers import BindingDict
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
 from drf_spectacular.utils import extend_schema_field
 from drf_spectacular.types import OpenApiTypes
 
-from utilities.api import get_related_object_by_attrs
+from utilities.api import SERIALIZER_CACHE_SIZE, get_related_object_by_attrs
 from .fields import NetBoxAPIHyperlinkedIdentityField, NetBoxURLHyperlinkedIdentityField
 
 __all__ = (
@@ -14,6 +16,15 @@ __all__ = (
 )
 
 
+@lru_cache(maxsize=SERIALIZER_CACHE_SIZE)
+def _get_serializer_fields(serializer_class, requested_fields):
+    """
+    Construct the (unbound) fields for a serializer class, limited to the requested fields (if any).
+    """
+    serializer = serializer_class(fields=requested_fields)
+    return super(BaseModelSerializer, serializer).get_fields()
+
+
 class BaseModelSerializer(serializers.ModelSerializer):
     url = NetBoxAPIHyperlinkedIdentityField()
     display_url = NetBoxURLHyperlinkedIdentityField()
@@ -52,19 +63,57 @@ class BaseModelSerializer(serializers.ModelSerializer):
         return super().to_internal_value(data)
 
     @cached_property
-    def fields(self):
+    def _compiled_fields(self):
+        """
+        The name, attribute accessor, and representation method of each readable field, resolved once per serializer
+        instance for use by the compiled representation path.
+        """
+        return tuple(
+            (field.field_name, field.get_attribute, field.to_representation)
+            for field in self.fields.values() if not field.write_only
+        )
+
+    def to_representation(self, instance):
+        """
+        When the `compiled_representation` context flag is set (e.g. for list responses), render the object using the
+        precomputed field accessors. The output is identical to that of Serializer.to_representation().
+        """
+        if not self.context.get('compiled_representation'):
+            return super().to_representation(instance)
+
+        ret = {}
+        for field_name, get_attribute, to_representation in self._compiled_fields:
+            try:
+                attribute = get_attribute(instance)
+            except SkipField:
+                continue
+
+            # Represent null values (including PKOnlyObjects with a null PK) as None
+            check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+            if check_for_none is None:
+                ret[field_name] = None
+            else:
+                ret[field_name] = to_representation(attribute)
+
+        return ret
+
+    def get_field_names(self, declared_fields, info):
+        """
+        Limit the field names to the requested fields (if any), so that only the applicable fields are constructed.
+        """
+        field_names = super().get_field_names(declared_fields, info)
+        if self._requested_fields:
+            return [name for name in field_names if name in self._requested_fields]
+        return field_names
+
+    def get_fields(self):
         """
-        Override the fields property to check for requested fields. If defined,
-        return only the applicable fields.
+        Return a copy of the cached fields for this serializer class and set of requested fields. Constructing the
+        fields (in particular those derived from model fields) is relatively expensive, so this is done only once per
+        process for each combination.
         """
-        if not self._requested_fields:
-            return super().fields
-
-        fields = BindingDict(self)
-        for key, value in self.get_fields().items():
-            if key in self._requested_fields:
-                fields[key] = value
-        return fields
+        requested_fields = tuple(self._requested_fields) if self._requested_fields else None
+        return copy.deepcopy(_get_serializer_fields(self.__class__, requested_fields))
 
     @extend_schema_field(OpenApiTypes.STR)
     def get_display(self, obj):
@@ -9,6 +9,10 @@ __all__ = (
 )
 
 
+# Placeholder primary key used to derive a reusable URL template for each view
+URL_TEMPLATE_PK = 2147483647
+
+
 class BaseNetBoxHyperlinkedIdentityField(serializers.HyperlinkedIdentityField):
     """
     Overrides HyperlinkedIdentityField to use standard NetBox view naming
@@ -31,11 +35,34 @@ class BaseNetBoxHyperlinkedIdentityField(serializers.HyperlinkedIdentityField):
             return None
 
         lookup_value = getattr(obj, self.lookup_field)
-        kwargs = {self.lookup_url_kwarg: lookup_value}
-
         view_name = self.get_view_name(obj)
+
+        # If the compiled representation path is enabled, resolve each view only once per request
+        if self.context.get('compiled_representation') and type(lookup_value) is int:
+            prefix, suffix = self.get_url_template(view_name, request, format)
+            return f'{prefix}{lookup_value}{suffix}'
+
+        kwargs = {self.lookup_url_kwarg: lookup_value}
         return self.reverse(view_name, kwargs=kwargs, request=request, format=format)
 
+    def get_url_template(self, view_name, request, format):
+        """
+        Return the portions of the absolute URL for the given view which precede and follow the object's primary key.
+        Templates are cached on the request.
+        """
+        try:
+            url_templates = request._url_templates
+        except AttributeError:
+            url_templates = request._url_templates = {}
+
+        key = (view_name, self.lookup_url_kwarg, format)
+        if key not in url_templates:
+            kwargs = {self.lookup_url_kwarg: URL_TEMPLATE_PK}
+            url = self.reverse(view_name, kwargs=kwargs, request=request, format=format)
+            url_templates[key] = tuple(url.rsplit(str(URL_TEMPLATE_PK), 1))
+
+        return url_templates[key]
+
     def get_view_name(self, model):
         raise NotImplementedError(_('{class_name} must implement get_view_name()').format(
             class_name=self.__class__.__name__
@@ -66,6 +66,15 @@ class BaseViewSet(GenericViewSet):
 
         return qs
 
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+
+        # Employ the compiled (read-only) representation path when serializing list responses
+        if self.action == 'list':
+            context['compiled_representation'] = True
+
+        return context
+
     def get_serializer(self, *args, **kwargs):
 
         # If specific fields have been requested, pass them to the serializer
@@ -89,6 +98,7 @@ class BaseViewSet(GenericViewSet):
 class NetBoxReadOnlyModelViewSet(
     mixins.CustomFieldsMixin,
     mixins.ExportTemplatesMixin,
+    mixins.StreamingListMixin,
     drf_mixins.RetrieveModelMixin,
     drf_mixins.ListModelMixin,
     BaseViewSet
@@ -97,11 +107,13 @@ class NetBoxReadOnlyModelViewSet(
 
 
 class NetBoxModelViewSet(
+    mixins.BackgroundBulkCreateMixin,
     mixins.BulkUpdateModelMixin,
     mixins.BulkDestroyModelMixin,
     mixins.ObjectValidationMixin,
     mixins.CustomFieldsMixin,
     mixins.ExportTemplatesMixin,
+    mixins.StreamingListMixin,
     drf_mixins.CreateModelMixin,
     drf_mixins.RetrieveModelMixin,
     drf_mixins.UpdateModelMixin,
@@ -110,7 +122,7 @@ class NetBoxModelViewSet(
     BaseViewSet
 ):
     """
-    Extend DRF's ModelViewSet to support bulk update and delete functions.
+    Extend DRF's ModelViewSet to support background bulk creation, and bulk update and delete functions.
     """
     def get_object_with_snapshot(self):
         """
@@ -1,20 +1,36 @@
+import json
+import uuid
+
 from django.core.exceptions import ObjectDoesNotExist
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
 from django.db import router, transaction
-from django.http import Http404
+from django.http import Http404, QueryDict, StreamingHttpResponse
+from django.utils.translation import gettext as _
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 
 from core.models import ObjectType
 from extras.models import ExportTemplate
+from netbox.api.pagination import OptionalLimitOffsetPagination
+from netbox.api.renderers import NDJSONRenderer, render_json_stream
 from netbox.api.serializers import BulkOperationSerializer
+from netbox.choices import ImportFormatChoices
+from utilities.exceptions import AbortTransaction
+from utilities.export import iterate_queryset
+from utilities.request import copy_safe_request, get_boolean_param
 
 __all__ = (
+    'BackgroundBulkCreateMixin',
     'BulkDestroyModelMixin',
     'BulkUpdateModelMixin',
     'CustomFieldsMixin',
     'ExportTemplatesMixin',
     'ObjectValidationMixin',
     'SequentialBulkCreatesMixin',
+    'StreamingListMixin',
 )
 
 
@@ -50,6 +66,65 @@ class ExportTemplatesMixin:
         return super().list(request, *args, **kwargs)
 
 
+class StreamingListMixin:
+    """
+    Stream list responses which are not paginated (i.e. limit=0), serializing each object as the queryset is
+    consumed in chunks, rather than rendering the entire set of objects in memory at once. List views also support
+    rendering objects as newline-delimited JSON (Accept: application/x-ndjson); in this case, pagination (if any) is
+    conveyed via a Link header.
+    """
+    def get_renderers(self):
+        renderers = super().get_renderers()
+        if getattr(self, 'action', None) == 'list':
+            renderers.append(NDJSONRenderer())
+        return renderers
+
+    def list(self, request, *args, **kwargs):
+        renderer = request.accepted_renderer
+        paginator = self.paginator
+
+        if isinstance(renderer, NDJSONRenderer):
+            queryset = self.filter_queryset(self.get_queryset())
+            headers = {}
+            if paginator is None:
+                results = iterate_queryset(queryset)
+            elif isinstance(paginator, OptionalLimitOffsetPagination) and not paginator.get_limit(request):
+                results = iterate_queryset(queryset[paginator.get_offset(request):])
+            else:
+                results = self.paginate_queryset(queryset)
+                if next_link := paginator.get_next_link():
+                    headers['Link'] = f'<{next_link}>; rel="next"'
+            return StreamingHttpResponse(
+                renderer.render_stream(self._serialize_stream(results)),
+                content_type=renderer.media_type,
+                headers=headers
+            )
+
+        if (
+            type(renderer) is JSONRenderer and
+            isinstance(paginator, OptionalLimitOffsetPagination) and
+            not paginator.get_limit(request)
+        ):
+            queryset = self.filter_queryset(self.get_queryset())
+            data = {
+                'count': paginator.get_count(queryset, request),
+                'next': None,
+                'previous': None,
+            }
+            results = iterate_queryset(queryset[paginator.get_offset(request):])
+            return StreamingHttpResponse(
+                render_json_stream(renderer, data, self._serialize_stream(results)),
+                content_type=renderer.media_type
+            )
+
+        return super().list(request, *args, **kwargs)
+
+    def _serialize_stream(self, objects):
+        serializer = self.get_serializer()
+        for obj in objects:
+            yield serializer.to_representation(obj)
+
+
 class SequentialBulkCreatesMixin:
     """
     Perform bulk creation of new objects sequentially, rather than all at once. This ensures that any validation
@@ -57,11 +132,11 @@ class SequentialBulkCreatesMixin:
     appropriately.
     """
     def create(self, request, *args, **kwargs):
-        with transaction.atomic(using=router.db_for_write(self.queryset.model)):
-            if not isinstance(request.data, list):
-                # Creating a single object
-                return super().create(request, *args, **kwargs)
+        # Creating a single object, or handing off to a background job
+        if not isinstance(request.data, list) or self.is_background_request(request):
+            return super().create(request, *args, **kwargs)
 
+        with transaction.atomic(using=router.db_for_write(self.queryset.model)):
             return_data = []
             for data in request.data:
                 serializer = self.get_serializer(data=data)
@@ -74,6 +149,88 @@ class SequentialBulkCreatesMixin:
             return Response(return_data, status=status.HTTP_201_CREATED, headers=headers)
 
 
+class BackgroundBulkCreateMixin:
+    """
+    Enable the bulk creation of objects to be performed by a background job. When a list of objects is submitted with
+    the `background` query parameter set, the data is saved and a job is enqueued to create the objects, and the job
+    is returned immediately (HTTP 202). The optional `chunk_size` parameter specifies the number of objects to commit
+    at a time; if omitted, all objects are created within a single transaction.
+    """
+    def is_background_request(self, request):
+        return isinstance(request.data, list) and get_boolean_param(request.query_params, 'background')
+
+    def create(self, request, *args, **kwargs):
+        if self.is_background_request(request):
+            return self.create_background(request)
+        return super().create(request, *args, **kwargs)
+
+    def create_background(self, request):
+        from core.api.serializers import JobSerializer
+        from core.jobs import ImportObjectsJob
+
+        chunk_size = request.query_params.get('chunk_size')
+        if chunk_size is not None:
+            try:
+                chunk_size = int(chunk_size)
+                if chunk_size < 1:
+                    raise ValueError
+            except ValueError:
+                raise ValidationError({'chunk_size': _("Chunk size must be a positive integer.")})
+
+        path = default_storage.save(
+            f'imports/{uuid.uuid4()}/data.json',
+            ContentFile(json.dumps(request.data).encode('utf-8'))
+        )
+
+        # Omit the submitted data from the copy of the request passed to the job
+        import_request = copy_safe_request(request)
+        import_request.POST = QueryDict()
+        import_request.FILES = {}
+
+        job = ImportObjectsJob.enqueue(
+            user=request.user,
+            view=self.__class__,
+            request=import_request,
+            path=path,
+            format=ImportFormatChoices.JSON,
+            chunk_size=chunk_size
+        )
+        serializer = JobSerializer(job, context={'request': request})
+
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
+    def import_records(self, records, request, headers=None, start=1):
+        """
+        Create a set of objects (e.g. a chunk of the data being processed by a background job) within a single
+        transaction. If any object fails, none are saved. Returns a tuple of the saved objects and a list of any
+        errors.
+        """
+        self.action = 'create'
+        self.format_kwarg = None
+        serializer_class = self.get_serializer_class()
+        context = self.get_serializer_context()
+
+        instances = []
+        errors = []
+        try:
+            with transaction.atomic(using=router.db_for_write(self.queryset.model)):
+                for i, data in enumerate(records, start=start):
+                    serializer = serializer_class(data=data, context=context)
+                    if not serializer.is_valid():
+                        errors.append(f'Record {i}: {json.dumps(serializer.errors)}')
+                        raise AbortTransaction()
+                    instances.append(serializer.save())
+
+                # Enforce object-level permissions
+                self._validate_objects(instances)
+        except AbortTransaction:
+            return [], errors
+        except ObjectDoesNotExist:
+            return [], [_("One or more objects does not conform to the permissions granted to the user.")]
+
+        return instances, []
+
+
 class BulkUpdateModelMixin:
     """
     Support bulk modification of objects using the list endpoint for a model. Accepts a PATCH action with a list of one
@@ -1,5 +1,6 @@
 import logging
 import threading
+import time
 
 from django.conf import settings
 from django.core.cache import cache
@@ -13,36 +14,78 @@ __all__ = (
     'ConfigItem',
     'get_config',
     'PARAMS',
+    'release_config',
 )
 
 _thread_locals = threading.local()
 
+# The most recently loaded configuration, shared by all threads within the process
+_config = None
+_config_checked = 0
+_config_lock = threading.RLock()
+
 logger = logging.getLogger('netbox.config')
 
 
 def get_config():
     """
-    Return the current NetBox configuration, pulling it from cache if not already loaded in memory.
+    Return the current NetBox configuration. The configuration is held in memory for the duration of a request (or
+    until released), and is shared among all threads in the process: The cached configuration version is checked at
+    most once every CONFIG_REFRESH_INTERVAL seconds, and the configuration is reloaded only if it has changed.
     """
     if not hasattr(_thread_locals, 'config'):
-        _thread_locals.config = Config()
-        logger.debug("Initialized configuration")
+        _thread_locals.config = _get_current_config()
     return _thread_locals.config
 
 
-def clear_config():
+def _get_current_config():
+    global _config, _config_checked
+
+    now = time.monotonic()
+    config = _config
+    if config is not None and now - _config_checked < settings.CONFIG_REFRESH_INTERVAL:
+        return config
+
+    with _config_lock:
+        config = _config
+        # Another thread may have checked the configuration while we were waiting for the lock
+        if config is not None and now <= _config_checked:
+            return config
+        if config is None or not config.version or config.version != cache.get('config_version'):
+            config = Config()
+            logger.debug("Initialized configuration")
+        _config = config
+        _config_checked = time.monotonic()
+
+    return config
+
+
+def release_config():
     """
-    Delete the currently loaded configuration, if any.
+    Release the configuration held by the current thread (e.g. upon completion of a request), such that any updates
+    are picked up on next access.
     """
     if hasattr(_thread_locals, 'config'):
         del _thread_locals.config
-        logger.debug("Cleared configuration")
+
+
+def clear_config():
+    """
+    Delete the currently loaded configuration, if any, forcing it to be reloaded from cache on next access.
+    """
+    global _config
+
+    release_config()
+    with _config_lock:
+        _config = None
+    logger.debug("Cleared configuration")
 
 
 class Config:
     """
     Fetch and store in memory the current NetBox configuration. This class must be instantiated prior to access, and
-    must be re-instantiated each time it's necessary to check for updates to the cached config.
+    must be re-instantiated each time it's necessary to load updates to the cached config. (get_config() handles this
+    automatically.)
     """
     def __init__(self):
         self._populate_from_cache()
@@ -26,6 +26,9 @@ ADVISORY_LOCK_KEYS = {
 
     # Jobs
     'job-schedules': 110100,
+
+    # Data files
+    'data-blobs': 115100,
 }
 
 # Default view action permission mapping
@@ -16,10 +16,21 @@ class DataBackend:
         is_local: A boolean indicating whether this backend accesses local data
         parameters: A dictionary mapping configuration form field names to their classes
         sensitive_parameters: An iterable of field names for which the values should not be displayed to the user
+        cache_key: An identifier unique to the consumer of the backend (e.g. a DataSource), for use by backends which
+            maintain a persistent local cache
+        synced_revision: The revision of the data (e.g. a git commit) as of the consumer's last successful sync (if
+            known), as previously reported by the backend
+        revision: After fetching, the revision of the fetched data (or None if not applicable)
+        changed_paths: After fetching, the set of paths which have changed since `synced_revision` (or None if
+            unknown)
     """
     is_local = False
     parameters = {}
     sensitive_parameters = []
+    cache_key = None
+    synced_revision = None
+    revision = None
+    changed_paths = None
 
     # Prevent Django's template engine from calling the backend
     # class when referenced via DataSource.backend_class
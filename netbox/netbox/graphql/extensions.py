@@ -0,0 +1,214 @@
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from graphql import (
+    ExecutionResult, FieldNode, FragmentDefinitionNode, FragmentSpreadNode, GraphQLError, get_named_type,
+    get_nullable_type, get_operation_ast, is_list_type, print_ast, value_from_ast_untyped,
+)
+from graphql.language import OperationType
+from strawberry.extensions import SchemaExtension
+
+from netbox.authentication import ObjectPermissionBackend
+from users.constants import CONSTRAINT_TOKEN_USER
+
+__all__ = (
+    'QueryCostLimiter',
+    'QueryResultCache',
+    'get_query_cost',
+    'invalidate_query_cache',
+)
+
+CACHE_VERSION_KEY = 'graphql_cache_version'
+
+
+#
+# Cost analysis
+#
+
+def get_query_cost(schema, document, operation_name=None, variables=None, list_size=100):
+    """
+    Estimate the cost of executing a GraphQL query. Returns a tuple of the query's maximum depth and the estimated
+    number of rows it will retrieve.
+
+    Args:
+        schema: The GraphQLSchema against which the query is executed
+        document: The parsed (and validated) query document
+        operation_name: The name of the operation to be executed (if the document defines more than one)
+        variables: A dictionary of variables passed with the query
+        list_size: The number of rows assumed for a list field for which no pagination limit has been specified
+    """
+    operation = get_operation_ast(document, operation_name)
+    if operation is None or operation.operation != OperationType.QUERY:
+        return 0, 0
+    fragments = {
+        definition.name.value: definition
+        for definition in document.definitions
+        if isinstance(definition, FragmentDefinitionNode)
+    }
+
+    def get_list_size(node):
+        for argument in node.arguments:
+            if argument.name.value == 'pagination':
+                pagination = value_from_ast_untyped(argument.value, variables) or {}
+                limit = pagination.get('limit')
+                if type(limit) is int and limit > 0:
+                    return limit
+        return list_size
+
+    def get_cost(selection_set, parent_type, multiplier, depth):
+        cost = 0
+        max_depth = depth
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                # Scalar fields incur no additional cost; ignore introspection fields
+                if selection.selection_set is None or selection.name.value.startswith('__'):
+                    continue
+                field = getattr(parent_type, 'fields', {}).get(selection.name.value)
+                if field is None:
+                    continue
+                field_type = get_nullable_type(field.type)
+                rows = multiplier * get_list_size(selection) if is_list_type(field_type) else multiplier
+                field_cost, field_depth = get_cost(
+                    selection.selection_set, get_named_type(field_type), rows, depth + 1
+                )
+                cost += rows + field_cost
+            else:
+                if isinstance(selection, FragmentSpreadNode):
+                    selection = fragments.get(selection.name.value)
+                    if selection is None:
+                        continue
+                fragment_type = parent_type
+                if selection.type_condition is not None:
+                    fragment_type = schema.get_type(selection.type_condition.name.value)
+                field_cost, field_depth = get_cost(selection.selection_set, fragment_type, multiplier, depth)
+                cost += field_cost
+            max_depth = max(max_depth, field_depth)
+
+        return cost, max_depth
+
+    cost, depth = get_cost(operation.selection_set, schema.query_type, 1, 0)
+
+    return depth, cost
+
+
+class QueryCostLimiter(SchemaExtension):
+    """
+    Reject any query which exceeds the maximum depth (GRAPHQL_MAX_DEPTH) or estimated cost (GRAPHQL_MAX_COST; the
+    number of rows to be retrieved) prior to its execution. List fields for which no pagination limit has been
+    specified are assumed to return the default page size.
+    """
+    def __init__(self, *, execution_context=None):
+        super().__init__(execution_context=execution_context)
+        self.max_depth = settings.GRAPHQL_MAX_DEPTH
+        self.max_cost = settings.GRAPHQL_MAX_COST
+        self.list_size = settings.STRAWBERRY_DJANGO['PAGINATION_DEFAULT_LIMIT']
+
+    def on_execute(self):
+        execution_context = self.execution_context
+
+        if execution_context.result is None and (self.max_depth or self.max_cost):
+            depth, cost = get_query_cost(
+                execution_context.schema._schema,
+                execution_context.graphql_document,
+                operation_name=execution_context.operation_name,
+                variables=execution_context.variables,
+                list_size=self.list_size
+            )
+            if self.max_depth and depth > self.max_depth:
+                error = GraphQLError(f"Query depth of {depth} exceeds the maximum allowed depth of {self.max_depth}.")
+                execution_context.result = ExecutionResult(data=None, errors=[error])
+            elif self.max_cost and cost > self.max_cost:
+                error = GraphQLError(
+                    f"Estimated query cost of {cost} exceeds the maximum allowed cost of {self.max_cost}. Consider "
+                    f"paginating list fields or requesting fewer related objects."
+                )
+                execution_context.result = ExecutionResult(data=None, errors=[error])
+
+        yield
+
+
+#
+# Result caching
+#
+
+def get_cache_version():
+    """
+    Return the current version of cached query results.
+    """
+    return cache.get_or_set(CACHE_VERSION_KEY, 1, None)
+
+
+def _increment_cache_version():
+    try:
+        cache.incr(CACHE_VERSION_KEY)
+    except ValueError:
+        cache.set(CACHE_VERSION_KEY, 1, None)
+
+
+def invalidate_query_cache(using=None):
+    """
+    Invalidate all cached query results once the current transaction has been committed. (The version counter is
+    incremented at most once per transaction.)
+    """
+    if not settings.GRAPHQL_CACHE_TIMEOUT:
+        return
+    connection = transaction.get_connection(using)
+    if connection.in_atomic_block and any(
+        func is _increment_cache_version for _, func, _ in connection.run_on_commit
+    ):
+        return
+    transaction.on_commit(_increment_cache_version, using=using)
+
+
+def get_permissions_fingerprint(user):
+    """
+    Return a digest representing the set of objects visible to the user. Users to whom identical permissions have been
+    assigned share a fingerprint, unless any constraint references the user.
+    """
+    if user.is_superuser:
+        return 'superuser'
+    permissions = json.dumps(ObjectPermissionBackend().get_all_permissions(user), sort_keys=True, default=str)
+    if CONSTRAINT_TOKEN_USER in permissions:
+        permissions += f'{user.pk}'
+    return hashlib.sha256(permissions.encode()).hexdigest()
+
+
+class QueryResultCache(SchemaExtension):
+    """
+    Cache the results of queries keyed by the normalized query, its variables, and the permissions of the requesting
+    user. Results are cached for GRAPHQL_CACHE_TIMEOUT seconds, and all cached results are invalidated whenever a change
+    is recorded.
+    """
+    def __init__(self, *, execution_context=None):
+        super().__init__(execution_context=execution_context)
+        self.timeout = settings.GRAPHQL_CACHE_TIMEOUT
+
+    def get_cache_key(self, execution_context):
+        query = json.dumps({
+            'query': print_ast(execution_context.graphql_document),
+            'operation_name': execution_context.operation_name,
+            'variables': execution_context.variables,
+        }, sort_keys=True, default=str)
+        digest = hashlib.sha256(query.encode()).hexdigest()
+        fingerprint = get_permissions_fingerprint(execution_context.context.request.user)
+
+        return f'graphql:{get_cache_version()}:{fingerprint}:{digest}'
+
+    def on_execute(self):
+        execution_context = self.execution_context
+        cache_key = None
+
+        if execution_context.result is None and execution_context.operation_type.value == OperationType.QUERY.value:
+            cache_key = self.get_cache_key(execution_context)
+            if (data := cache.get(cache_key)) is not None:
+                execution_context.result = ExecutionResult(data=data)
+                cache_key = None
+
+        yield
+
+        result = execution_context.result
+        if cache_key and result is not None and result.data is not None and not result.errors:
+            cache.set(cache_key, result.data, self.timeout)
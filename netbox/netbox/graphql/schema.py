@@ -9,6 +9,7 @@ from core.graphql.schema import CoreQuery
 from dcim.graphql.schema import DCIMQuery
 from extras.graphql.schema import ExtrasQuery
 from ipam.graphql.schema import IPAMQuery
+from netbox.graphql.extensions import QueryCostLimiter, QueryResultCache
 from netbox.registry import registry
 from tenancy.graphql.schema import TenancyQuery
 from users.graphql.schema import UsersQuery
@@ -34,11 +35,16 @@ class Query(
     pass
 
 
+extensions = [
+    DjangoOptimizerExtension(prefetch_custom_queryset=True),
+    MaxAliasesLimiter(max_alias_count=settings.GRAPHQL_MAX_ALIASES),
+    QueryCostLimiter,
+]
+if settings.GRAPHQL_CACHE_TIMEOUT:
+    extensions.append(QueryResultCache)
+
 schema = strawberry.Schema(
     query=Query,
     config=StrawberryConfig(auto_camel_case=False),
-    extensions=[
-        DjangoOptimizerExtension(prefetch_custom_queryset=True),
-        MaxAliasesLimiter(max_alias_count=settings.GRAPHQL_MAX_ALIASES),
-    ]
+    extensions=extensions
 )
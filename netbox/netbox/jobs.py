@@ -1,19 +1,27 @@
 import logging
+import queue
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import Counter
 from datetime import timedelta
 
 from django.core.exceptions import ImproperlyConfigured
+from django.db import connections, router, transaction
+from django.utils import timezone
 from django.utils.functional import classproperty
 from django_pglocks import advisory_lock
 from rq.timeouts import JobTimeoutException
 
 from core.choices import JobStatusChoices
+from core.constants import JOB_LOG_BATCH_SIZE, JOB_LOG_FLUSH_INTERVAL
 from core.exceptions import JobFailed
-from core.models import Job, ObjectType
+from core.models import Job, JobLogEntry, ObjectType
 from netbox.constants import ADVISORY_LOCK_KEYS
 from netbox.registry import registry
 
 __all__ = (
+    'JobLogWriter',
     'JobRunner',
     'system_job',
 )
@@ -79,7 +87,12 @@ class JobRunner(ABC):
         try:
             job.start()
             cls(job).run(*args, **kwargs)
-            job.terminate()
+
+            # A job which has dispatched child jobs is terminated once all of its children have finished
+            if job.children.exists():
+                job.refresh_from_db()
+            else:
+                job.terminate()
 
         except JobFailed:
             logger.warning(f"Job {job} failed")
@@ -161,3 +174,102 @@ class JobRunner(ABC):
             job.delete()
 
         return cls.enqueue(instance=instance, schedule_at=schedule_at, interval=interval, *args, **kwargs)
+
+
+class JobLogWriter:
+    """
+    Record log entries for a Job as it runs. Entries are written to the database in batches by a background thread.
+    Because the thread uses its own database connection, entries are committed (and become visible to other sessions)
+    independently of any transaction within which the job is executing.
+
+    If the Job has not yet been committed (i.e. the writer is opened within an atomic block), the background thread
+    would be unable to reference it; entries are instead held in memory and written when the writer is closed.
+
+    Args:
+        job: The Job for which log entries are recorded
+        batch_size: The maximum number of log entries to write at a time
+        interval: The maximum number of seconds for which log entries are buffered before being written
+    """
+    def __init__(self, job, batch_size=JOB_LOG_BATCH_SIZE, interval=JOB_LOG_FLUSH_INTERVAL):
+        self.job = job
+        self.batch_size = batch_size
+        self.interval = interval
+        self.counts = Counter()
+        self._queue = queue.Queue(maxsize=batch_size * 10)
+        self._thread = None
+        self._pending = []
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def open(self):
+        if transaction.get_connection(router.db_for_write(JobLogEntry)).in_atomic_block:
+            return
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def close(self):
+        """
+        Write any outstanding log entries to the database.
+        """
+        if self._thread:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        elif self._pending:
+            self._write(self._pending)
+            self._pending = []
+
+    def write(self, level, message, object_repr='', url=''):
+        """
+        Record a log entry.
+        """
+        entry = JobLogEntry(
+            job_id=self.job.pk,
+            time=timezone.now(),
+            level=level,
+            message=message,
+            object_repr=object_repr,
+            url=url
+        )
+        self.counts[level] += 1
+        if self._thread:
+            # Blocks if the background thread has fallen behind
+            self._queue.put(entry)
+        else:
+            self._pending.append(entry)
+
+    def _write(self, entries):
+        try:
+            JobLogEntry.objects.bulk_create(entries, batch_size=self.batch_size)
+        except Exception as e:
+            logger = logging.getLogger('netbox.jobs')
+            logger.error(f"Failed to record {len(entries)} log entries for job {self.job}: {e}")
+
+    def _run(self):
+        """
+        Write queued log entries to the database in batches until the writer is closed.
+        """
+        closed = False
+        try:
+            while not closed:
+                entries = []
+                deadline = time.monotonic() + self.interval
+                while len(entries) < self.batch_size:
+                    try:
+                        entry = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                    except queue.Empty:
+                        break
+                    if entry is None:
+                        closed = True
+                        break
+                    entries.append(entry)
+                if entries:
+                    self._write(entries)
+        finally:
+            # Close the database connection opened by this thread
+            connections.close_all()
@@ -12,7 +12,7 @@ from django.db import connection, ProgrammingError
 from django.db.utils import InternalError
 from django.http import Http404, HttpResponseRedirect
 
-from netbox.config import clear_config, get_config
+from netbox.config import get_config, release_config
 from netbox.registry import registry
 from netbox.views import handler_500
 from utilities.api import is_api_request
@@ -64,8 +64,8 @@ class CoreMiddleware:
         if is_api_request(request):
             response['API-Version'] = settings.REST_FRAMEWORK_VERSION
 
-        # Clear any cached dynamic config parameters after each request.
-        clear_config()
+        # Release the dynamic config parameters held for this request, so that any updates are picked up by the next.
+        release_config()
 
         return response
 
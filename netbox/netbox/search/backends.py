@@ -15,6 +15,7 @@ from netaddr.core import AddrFormatError
 from core.models import ObjectType
 from extras.models import CachedValue, CustomField
 from netbox.registry import registry
+from netbox.signals import post_bulk_update
 from utilities.object_types import object_type_identifier
 from utilities.querysets import RestrictedPrefetch
 from utilities.string import title
@@ -62,8 +63,17 @@ class SearchBackend:
         """
         Receiver for the post_save signal, responsible for caching object creation/changes.
         """
+        # Objects updated in bulk are handled by bulk_caching_handler()
+        if kwargs.get('bulk'):
+            return
         self.cache(instance, remove_existing=not created)
 
+    def bulk_caching_handler(self, sender, instances, **kwargs):
+        """
+        Receiver for the post_bulk_update signal, responsible for caching changes to a set of objects.
+        """
+        self.cache(instances, remove_existing=True)
+
     def removal_handler(self, sender, instance, **kwargs):
         """
         Receiver for the post_delete signal, responsible for caching object deletion.
@@ -195,6 +205,7 @@ class CachedValueSearchBackend(SearchBackend):
             instances = [instances]
 
         buffer = []
+        stale_pks = []
         counter = 0
         for instance in instances:
 
@@ -212,9 +223,9 @@ class CachedValueSearchBackend(SearchBackend):
                 object_type = ObjectType.objects.get_for_model(indexer.model)
                 custom_fields = CustomField.objects.filter(object_types=object_type).exclude(search_weight=0)
 
-            # Wipe out any previously cached values for the object
+            # Mark any previously cached values for the object for deletion
             if remove_existing:
-                self.remove(instance)
+                stale_pks.append(instance.pk)
 
             # Generate cache data
             for field in indexer.to_cache(instance, custom_fields=custom_fields):
@@ -231,10 +242,13 @@ class CachedValueSearchBackend(SearchBackend):
 
             # Check whether the buffer needs to be flushed
             if len(buffer) >= 2000:
+                self._remove_stale(object_type, stale_pks)
                 counter += len(CachedValue.objects.bulk_create(buffer))
                 buffer = []
+                stale_pks = []
 
         # Final buffer flush
+        self._remove_stale(object_type, stale_pks)
         if buffer:
             counter += len(CachedValue.objects.bulk_create(buffer))
 
@@ -253,6 +267,18 @@ class CachedValueSearchBackend(SearchBackend):
         # Call _raw_delete() on the queryset to avoid first loading instances into memory
         return qs._raw_delete(using=qs.db)
 
+    @staticmethod
+    def _remove_stale(object_type, object_ids):
+        """
+        Delete any cached values for the specified objects in a single query.
+        """
+        if not object_ids:
+            return
+        qs = CachedValue.objects.filter(object_type=object_type, object_id__in=object_ids)
+
+        # Call _raw_delete() on the queryset to avoid first loading instances into memory
+        return qs._raw_delete(using=qs.db)
+
     def clear(self, object_types=None):
         qs = CachedValue.objects.all()
         if object_types:
@@ -289,4 +315,5 @@ search_backend = get_backend()
 
 # Connect handlers to the appropriate model signals
 post_save.connect(search_backend.caching_handler)
+post_bulk_update.connect(search_backend.bulk_caching_handler)
 post_delete.connect(search_backend.removal_handler)
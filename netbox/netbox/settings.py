@@ -80,6 +80,8 @@ AUTH_PASSWORD_VALIDATORS = getattr(configuration, 'AUTH_PASSWORD_VALIDATORS', [
 BASE_PATH = trailing_slash(getattr(configuration, 'BASE_PATH', ''))
 CHANGELOG_SKIP_EMPTY_CHANGES = getattr(configuration, 'CHANGELOG_SKIP_EMPTY_CHANGES', True)
 CENSUS_REPORTING_ENABLED = getattr(configuration, 'CENSUS_REPORTING_ENABLED', True)
+CONFIG_CONTEXT_CACHE_ENABLED = getattr(configuration, 'CONFIG_CONTEXT_CACHE_ENABLED', False)
+CONFIG_REFRESH_INTERVAL = getattr(configuration, 'CONFIG_REFRESH_INTERVAL', 5)
 CORS_ORIGIN_ALLOW_ALL = getattr(configuration, 'CORS_ORIGIN_ALLOW_ALL', False)
 CORS_ORIGIN_REGEX_WHITELIST = getattr(configuration, 'CORS_ORIGIN_REGEX_WHITELIST', [])
 CORS_ORIGIN_WHITELIST = getattr(configuration, 'CORS_ORIGIN_WHITELIST', [])
@@ -87,6 +89,10 @@ CSRF_COOKIE_NAME = getattr(configuration, 'CSRF_COOKIE_NAME', 'csrftoken')
 CSRF_COOKIE_PATH = f'/{BASE_PATH.rstrip("/")}'
 CSRF_COOKIE_SECURE = getattr(configuration, 'CSRF_COOKIE_SECURE', False)
 CSRF_TRUSTED_ORIGINS = getattr(configuration, 'CSRF_TRUSTED_ORIGINS', [])
+DATA_FILE_STORE = getattr(configuration, 'DATA_FILE_STORE', None)
+if DATA_FILE_STORE not in (None, 'database', 'storage'):
+    raise ImproperlyConfigured(f"DATA_FILE_STORE must be None, 'database', or 'storage' (found {DATA_FILE_STORE})")
+DATA_SOURCE_CACHE_PATH = getattr(configuration, 'DATA_SOURCE_CACHE_PATH', None)
 DATA_UPLOAD_MAX_MEMORY_SIZE = getattr(configuration, 'DATA_UPLOAD_MAX_MEMORY_SIZE', 2621440)
 DATABASE = getattr(configuration, 'DATABASE', None)  # Legacy DB definition
 DATABASE_ROUTERS = getattr(configuration, 'DATABASE_ROUTERS', [])
@@ -124,7 +130,10 @@ EVENTS_PIPELINE = getattr(configuration, 'EVENTS_PIPELINE', [
 EXEMPT_VIEW_PERMISSIONS = getattr(configuration, 'EXEMPT_VIEW_PERMISSIONS', [])
 FIELD_CHOICES = getattr(configuration, 'FIELD_CHOICES', {})
 FILE_UPLOAD_MAX_MEMORY_SIZE = getattr(configuration, 'FILE_UPLOAD_MAX_MEMORY_SIZE', 2621440)
+GRAPHQL_CACHE_TIMEOUT = getattr(configuration, 'GRAPHQL_CACHE_TIMEOUT', 0)
 GRAPHQL_MAX_ALIASES = getattr(configuration, 'GRAPHQL_MAX_ALIASES', 10)
+GRAPHQL_MAX_COST = getattr(configuration, 'GRAPHQL_MAX_COST', None)
+GRAPHQL_MAX_DEPTH = getattr(configuration, 'GRAPHQL_MAX_DEPTH', None)
 HTTP_PROXIES = getattr(configuration, 'HTTP_PROXIES', {})
 INTERNAL_IPS = getattr(configuration, 'INTERNAL_IPS', ('127.0.0.1', '::1'))
 ISOLATED_DEPLOYMENT = getattr(configuration, 'ISOLATED_DEPLOYMENT', False)
@@ -274,6 +283,12 @@ DEFAULT_STORAGES = {
     "scripts": {
         "BACKEND": "extras.storage.ScriptFileSystemStorage",
     },
+    "datafiles": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+        "OPTIONS": {
+            "location": os.path.join(MEDIA_ROOT, 'datafiles'),
+        },
+    },
 }
 STORAGES = DEFAULT_STORAGES | STORAGES
 
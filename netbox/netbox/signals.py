@@ -3,3 +3,7 @@ from django.dispatch import Signal
 
 # Signals that a model has completed its clean() method
 post_clean = Signal()
+
+# Signals that a set of objects has been updated in bulk. A post_save signal (with bulk=True) is sent for each object
+# beforehand; receivers which handle bulk updates more efficiently may defer their work to this signal.
+post_bulk_update = Signal()
@@ -1,9 +1,16 @@
 import uuid
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
 
 from django.test import RequestFactory, TestCase
 from django.urls import reverse
+from rest_framework.exceptions import NotFound
 from rest_framework.request import Request
 
+from core.choices import JobStatusChoices
+from core.jobs import ImportObjectsJob
+from core.models import Job
+from dcim.models import Site
 from netbox.api.exceptions import QuerySetNotOrdered
 from netbox.api.pagination import OptionalLimitOffsetPagination
 from utilities.testing import APITestCase
@@ -33,6 +40,70 @@ class AppTest(APITestCase):
         self.assertEqual(response.status_code, 200)
 
 
+class BackgroundBulkCreateTest(APITestCase):
+
+    def test_create_background(self):
+        self.add_permissions('dcim.add_site')
+        data = [
+            {'name': f'Site {i}', 'slug': f'site-{i}'} for i in range(1, 4)
+        ]
+        url = reverse('dcim-api:site-list')
+
+        with patch.object(ImportObjectsJob, 'enqueue', wraps=ImportObjectsJob.enqueue) as enqueue:
+            response = self.client.post(f'{url}?background=true&chunk_size=2', data, format='json', **self.header)
+        self.assertHttpStatus(response, 202)
+        job = Job.objects.get(pk=response.data['id'])
+        self.assertEqual(job.name, ImportObjectsJob.name)
+        self.assertFalse(Site.objects.exists())
+
+        # Run the enqueued job
+        kwargs = enqueue.call_args.kwargs
+        self.assertEqual(kwargs['chunk_size'], 2)
+        kwargs.pop('user')
+        ImportObjectsJob.handle(job, **kwargs)
+
+        self.assertEqual(job.status, JobStatusChoices.STATUS_COMPLETED)
+        self.assertEqual(job.data, {'processed': 3, 'imported': 3, 'errors': []})
+        self.assertEqual(Site.objects.count(), 3)
+
+    def test_create_background_invalid_record(self):
+        self.add_permissions('dcim.add_site')
+        data = [
+            {'name': 'Site 1', 'slug': 'site-1'},
+            {'name': 'Site 2', 'slug': 'site-2'},
+            {'name': 'Site 3', 'slug': 'site-3'},
+            {'name': 'Site 4'},  # Missing slug
+        ]
+        url = reverse('dcim-api:site-list')
+
+        with patch.object(ImportObjectsJob, 'enqueue', wraps=ImportObjectsJob.enqueue) as enqueue:
+            response = self.client.post(f'{url}?background=true&chunk_size=2', data, format='json', **self.header)
+        self.assertHttpStatus(response, 202)
+        job = Job.objects.get(pk=response.data['id'])
+
+        # Run the enqueued job
+        kwargs = enqueue.call_args.kwargs
+        kwargs.pop('user')
+        ImportObjectsJob.handle(job, **kwargs)
+
+        # The first chunk is saved; the second chunk is rolled back in its entirety
+        self.assertEqual(job.status, JobStatusChoices.STATUS_FAILED)
+        self.assertEqual(job.data['processed'], 4)
+        self.assertEqual(job.data['imported'], 2)
+        self.assertEqual(len(job.data['errors']), 1)
+        self.assertTrue(job.data['errors'][0].startswith('Record 4:'))
+        self.assertEqual(sorted(Site.objects.values_list('name', flat=True)), ['Site 1', 'Site 2'])
+
+    def test_create_background_invalid_chunk_size(self):
+        self.add_permissions('dcim.add_site')
+        url = reverse('dcim-api:site-list')
+        data = [{'name': 'Site 1', 'slug': 'site-1'}]
+
+        response = self.client.post(f'{url}?background=true&chunk_size=0', data, format='json', **self.header)
+        self.assertHttpStatus(response, 400)
+        self.assertFalse(Job.objects.exists())
+
+
 class OptionalLimitOffsetPaginationTest(TestCase):
 
     def setUp(self):
@@ -68,3 +139,59 @@ class OptionalLimitOffsetPaginationTest(TestCase):
         request = self._make_drf_request()
 
         self.paginator.paginate_queryset(iterable, request)  # Should not raise exception
+
+    def test_keyset_pagination(self):
+        """Should return each object exactly once when following cursors"""
+        Site.objects.bulk_create([
+            Site(name=f'Site {i % 3}', slug=f'site-{i}') for i in range(10)
+        ])
+        queryset = Site.objects.order_by('-name')
+        # Ties are ordered by primary key
+        expected = list(queryset.order_by('-name', 'pk').values_list('pk', flat=True))
+
+        results = []
+        query_params = {'limit': 3, 'cursor': ''}
+        while True:
+            paginator = OptionalLimitOffsetPagination()
+            page = paginator.paginate_queryset(queryset, self._make_drf_request(query_params=query_params))
+            results.extend(obj.pk for obj in page)
+            if not (next_link := paginator.get_next_link()):
+                break
+            self.assertIsNone(paginator.get_previous_link())
+            query_params = {k: v[0] for k, v in parse_qs(urlparse(next_link).query).items()}
+
+        self.assertEqual(results, expected)
+
+    def test_keyset_pagination_invalid_cursor(self):
+        """Should raise NotFound for a malformed cursor"""
+        request = self._make_drf_request(query_params={'cursor': 'invalid'})
+
+        with self.assertRaises(NotFound):
+            self.paginator.paginate_queryset(Token.objects.order_by('created'), request)
+
+    def test_keyset_pagination_count(self):
+        """Should omit the count for keyset pagination unless requested"""
+        Site.objects.bulk_create([
+            Site(name=f'Site {i}', slug=f'site-{i}') for i in range(5)
+        ])
+        queryset = Site.objects.order_by('name')
+
+        with self.assertNumQueries(1):
+            self.paginator.paginate_queryset(queryset, self._make_drf_request(query_params={'limit': 3, 'cursor': ''}))
+        self.assertIsNone(self.paginator.count)
+
+        request = self._make_drf_request(query_params={'limit': 3, 'cursor': '', 'count': 'true'})
+        self.paginator.paginate_queryset(queryset, request)
+        self.assertEqual(self.paginator.count, 5)
+
+    def test_skip_count(self):
+        """Should omit the count but still indicate whether a next page exists"""
+        Site.objects.bulk_create([
+            Site(name=f'Site {i}', slug=f'site-{i}') for i in range(5)
+        ])
+        request = self._make_drf_request(query_params={'limit': 3, 'count': 'false'})
+
+        page = self.paginator.paginate_queryset(Site.objects.order_by('name'), request)
+        self.assertEqual(len(page), 3)
+        self.assertIsNone(self.paginator.count)
+        self.assertIn('offset=3', self.paginator.get_next_link())
@@ -3,7 +3,7 @@ from django.core.cache import cache
 from django.test import override_settings, TestCase
 
 from core.models import ConfigRevision
-from netbox.config import clear_config, get_config
+from netbox.config import clear_config, get_config, release_config
 
 
 # Prefix cache keys to avoid interfering with the local environment
@@ -13,6 +13,10 @@ CACHES['default'].update({'KEY_PREFIX': 'TEST-'})
 
 class ConfigTestCase(TestCase):
 
+    def setUp(self):
+        # Discard any configuration loaded by a previous test
+        clear_config()
+
     @override_settings(CACHES=CACHES)
     def test_config_init_empty(self):
         cache.clear()
@@ -66,3 +70,27 @@ class ConfigTestCase(TestCase):
         self.assertEqual(config.version, configrevision.pk)
 
         clear_config()
+
+    @override_settings(CACHES=CACHES)
+    def test_config_refresh(self):
+        cache.clear()
+
+        configrevision1 = ConfigRevision.objects.create(data={'BANNER_TOP': 'A'})
+        configrevision1.activate()
+        self.assertEqual(get_config().BANNER_TOP, 'A')
+        release_config()
+
+        # Simulate the activation of a new ConfigRevision by another process
+        configrevision2 = ConfigRevision(pk=configrevision1.pk + 1, data={'BANNER_TOP': 'B'})
+        cache.set('config', configrevision2.data, None)
+        cache.set('config_version', configrevision2.pk, None)
+
+        # The loaded configuration should be retained until the refresh interval has elapsed
+        with override_settings(CONFIG_REFRESH_INTERVAL=3600):
+            self.assertEqual(get_config().BANNER_TOP, 'A')
+            release_config()
+        with override_settings(CONFIG_REFRESH_INTERVAL=0):
+            self.assertEqual(get_config().BANNER_TOP, 'B')
+            self.assertEqual(get_config().version, configrevision2.pk)
+
+        clear_config()
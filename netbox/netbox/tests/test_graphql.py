@@ -1,13 +1,20 @@
 import json
+from types import SimpleNamespace
 
-from django.test import override_settings
+import strawberry
+from django.core.cache import cache
+from django.test import RequestFactory, override_settings
 from django.urls import reverse
+from graphql import parse
 from rest_framework import status
+from strawberry.schema.config import StrawberryConfig
 
 from core.models import ObjectType
 from dcim.choices import LocationStatusChoices
 from dcim.models import Site, Location
-from users.models import ObjectPermission
+from netbox.graphql.extensions import QueryCostLimiter, QueryResultCache, get_query_cost
+from netbox.graphql.schema import Query, schema
+from users.models import ObjectPermission, User
 from utilities.testing import disable_warnings, APITestCase, TestCase
 
 
@@ -42,6 +49,126 @@ class GraphQLTestCase(TestCase):
         with disable_warnings('django.request'):
             self.assertHttpStatus(response, 302)  # Redirect to login page
 
+    def test_query_cost(self):
+        """
+        Validate the estimation of query depth and cost.
+        """
+        query = """
+        query ($limit: Int!) {
+            site_list(pagination: {limit: $limit}) {
+                name
+                devices {
+                    ...DeviceFields
+                }
+            }
+        }
+        fragment DeviceFields on DeviceType {
+            name
+            interfaces {
+                name
+            }
+        }
+        """
+        depth, cost = get_query_cost(schema._schema, parse(query), variables={'limit': 10}, list_size=100)
+        self.assertEqual(depth, 3)
+        self.assertEqual(cost, 10 + 10 * 100 + 10 * 100 * 100)
+
+
+class GraphQLExtensionsTestCase(TestCase):
+    """
+    Test the QueryCostLimiter and QueryResultCache schema extensions.
+    """
+    user_permissions = ('dcim.view_site',)
+
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.bulk_create((
+            Site(name='Site 1', slug='site-1'),
+            Site(name='Site 2', slug='site-2'),
+        ))
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    @staticmethod
+    def get_schema(*extensions):
+        return strawberry.Schema(query=Query, config=StrawberryConfig(auto_camel_case=False), extensions=extensions)
+
+    def execute(self, schema, query, user=None):
+        request = RequestFactory().post(reverse('graphql'))
+        request.user = user or self.user
+        return schema.execute_sync(query, context_value=SimpleNamespace(request=request))
+
+    @override_settings(GRAPHQL_MAX_DEPTH=2, GRAPHQL_MAX_COST=None)
+    def test_max_depth(self):
+        schema = self.get_schema(QueryCostLimiter)
+
+        result = self.execute(schema, '{site_list {name devices {name interfaces {name}}}}')
+        self.assertIsNone(result.data)
+        self.assertIn('exceeds the maximum allowed depth of 2', result.errors[0].message)
+
+        result = self.execute(schema, '{site_list {name devices {name}}}')
+        self.assertIsNone(result.errors)
+        self.assertEqual(len(result.data['site_list']), 2)
+
+    @override_settings(GRAPHQL_MAX_DEPTH=None, GRAPHQL_MAX_COST=50)
+    def test_max_cost(self):
+        schema = self.get_schema(QueryCostLimiter)
+
+        result = self.execute(schema, '{site_list {name}}')
+        self.assertIsNone(result.data)
+        self.assertIn('exceeds the maximum allowed cost of 50', result.errors[0].message)
+
+        # Paginating the list field reduces its estimated cost
+        result = self.execute(schema, '{site_list(pagination: {limit: 10}) {name}}')
+        self.assertIsNone(result.errors)
+        self.assertEqual(len(result.data['site_list']), 2)
+
+    @override_settings(GRAPHQL_CACHE_TIMEOUT=60)
+    def test_result_cache(self):
+        schema = self.get_schema(QueryResultCache)
+        query = '{site_list {name}}'
+
+        result = self.execute(schema, query)
+        self.assertEqual(len(result.data['site_list']), 2)
+
+        # Objects created without any change being recorded should not be reflected by the cached result
+        Site.objects.bulk_create([Site(name='Site 3', slug='site-3')])
+        result = self.execute(schema, query)
+        self.assertEqual(len(result.data['site_list']), 2)
+
+        # Recording a change should invalidate all cached results once committed
+        with self.captureOnCommitCallbacks(execute=True):
+            Site.objects.create(name='Site 4', slug='site-4')
+        result = self.execute(schema, query)
+        self.assertEqual(len(result.data['site_list']), 4)
+
+    @override_settings(GRAPHQL_CACHE_TIMEOUT=60)
+    def test_result_cache_permissions(self):
+        schema = self.get_schema(QueryResultCache)
+        query = '{site_list {name}}'
+        object_type = ObjectType.objects.get_for_model(Site)
+
+        result = self.execute(schema, query)
+        self.assertEqual(len(result.data['site_list']), 2)
+        Site.objects.bulk_create([Site(name='Site 3', slug='site-3')])
+
+        # A user with identical permissions should receive the cached result
+        user2 = User.objects.create_user(username='testuser2')
+        ObjectPermission.objects.get(name='dcim.view_site').users.add(user2)
+        result = self.execute(schema, query, user=user2)
+        self.assertEqual(len(result.data['site_list']), 2)
+
+        # A user with different permissions should not
+        user3 = User.objects.create_user(username='testuser3')
+        obj_perm = ObjectPermission(name='Test permission', actions=['view'], constraints={'name': 'Site 1'})
+        obj_perm.save()
+        obj_perm.users.add(user3)
+        obj_perm.object_types.add(object_type)
+        result = self.execute(schema, query, user=user3)
+        self.assertEqual(result.data['site_list'], [{'name': 'Site 1'}])
+
 
 class GraphQLAPITestCase(APITestCase):
 
@@ -1,6 +1,11 @@
+from unittest.mock import patch
+
+from django.core.files.storage import default_storage
 from django.test import override_settings
 
-from core.models import ObjectType
+from core.choices import JobStatusChoices
+from core.jobs import ImportObjectsJob
+from core.models import Job, ObjectType
 from dcim.models import *
 from extras.models import CustomField
 from netbox.choices import CSVDelimiterChoices, ImportFormatChoices
@@ -141,3 +146,81 @@ class CSVImportTestCase(ModelViewTestCase):
         self.assertHttpStatus(self.client.post(self._get_url('bulk_import'), data), 302)
         region = Region.objects.get(slug='region-1')
         self.assertEqual(region.cf['tcf'], 'def-cf-text')
+
+
+class BackgroundImportTestCase(ModelViewTestCase):
+    model = Region
+
+    def _import_background(self, csv_data, chunk_size=None):
+        """
+        Submit an import to be processed as a background job, and then run the job.
+        """
+        self.add_permissions('dcim.add_region')
+        data = {
+            'format': ImportFormatChoices.CSV,
+            'data': '\n'.join(csv_data),
+            'csv_delimiter': CSVDelimiterChoices.AUTO,
+            'background_job': True,
+            'chunk_size': chunk_size or '',
+        }
+        with patch.object(ImportObjectsJob, 'enqueue', wraps=ImportObjectsJob.enqueue) as enqueue:
+            response = self.client.post(self._get_url('bulk_import'), data)
+        job = Job.objects.get(name=ImportObjectsJob.name)
+        self.assertRedirects(response, job.get_absolute_url(), fetch_redirect_response=False)
+
+        # No objects are imported until the job runs
+        self.assertEqual(Region.objects.count(), 0)
+        kwargs = enqueue.call_args.kwargs
+        kwargs.pop('user')
+        ImportObjectsJob.handle(job, **kwargs)
+
+        # The import data should be deleted once the job has finished
+        self.assertFalse(default_storage.exists(kwargs['path']))
+
+        return job
+
+    def test_import(self):
+        csv_data = (
+            'name,slug',
+            'Region 1,region-1',
+            'Region 2,region-2',
+            'Region 3,region-3',
+        )
+        job = self._import_background(csv_data)
+
+        self.assertEqual(job.status, JobStatusChoices.STATUS_COMPLETED)
+        self.assertEqual(job.data, {'processed': 3, 'imported': 3, 'errors': []})
+        self.assertEqual(Region.objects.count(), 3)
+
+    def test_import_chunked(self):
+        csv_data = (
+            'name,slug',
+            'Region 1,region-1',
+            'Region 2,region-2',
+            'Region 3,',
+        )
+        job = self._import_background(csv_data, chunk_size=2)
+
+        # The first chunk should be committed, and the second rolled back
+        self.assertEqual(job.status, JobStatusChoices.STATUS_FAILED)
+        self.assertEqual(job.data['processed'], 3)
+        self.assertEqual(job.data['imported'], 2)
+        self.assertEqual(len(job.data['errors']), 1)
+        self.assertIn('Record 3 slug', job.data['errors'][0])
+        self.assertEqual(sorted(Region.objects.values_list('name', flat=True)), ['Region 1', 'Region 2'])
+
+    def test_import_rollback(self):
+        csv_data = (
+            'name,slug',
+            'Region 1,region-1',
+            'Region 2,region-2',
+            'Region 3,',
+        )
+        job = self._import_background(csv_data)
+
+        # Without a chunk size, no objects should be imported if any record fails
+        self.assertEqual(job.status, JobStatusChoices.STATUS_FAILED)
+        self.assertEqual(job.data['processed'], 3)
+        self.assertEqual(job.data['imported'], 0)
+        self.assertIn('Record 3 slug', job.data['errors'][0])
+        self.assertFalse(Region.objects.exists())
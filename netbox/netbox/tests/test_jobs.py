@@ -5,7 +5,7 @@ from django.utils import timezone
 from django_rq import get_queue
 
 from ..jobs import *
-from core.models import DataSource, Job
+from core.models import DataSource, Job, JobLogEntry
 from core.choices import JobStatusChoices
 from core.exceptions import JobFailed
 from utilities.testing import disable_warnings
@@ -71,6 +71,36 @@ class JobRunnerTest(JobRunnerTestCase):
         self.assertEqual(job.status, JobStatusChoices.STATUS_ERRORED)
         self.assertEqual(job.error, repr(ErroredJobRunner.EXP))
 
+    def test_handle_children(self):
+        class ParentJobRunner(TestJobRunner):
+            def run(self, *args, **kwargs):
+                children = [
+                    TestJobRunner.enqueue(schedule_at=timezone.now() + timedelta(weeks=1), parent=self.job)
+                    for __ in range(2)
+                ]
+                for child in children:
+                    TestJobRunner.handle(child)
+
+        job = ParentJobRunner.enqueue(immediate=True)
+
+        # The parent job should be terminated by the last of its children to finish
+        self.assertEqual(job.status, JobStatusChoices.STATUS_COMPLETED)
+        self.assertEqual(job.children.filter(status=JobStatusChoices.STATUS_COMPLETED).count(), 2)
+
+    def test_terminate_parent(self):
+        parent = TestJobRunner.enqueue(schedule_at=self.get_schedule_at())
+        parent.start()
+        children = [TestJobRunner.enqueue(schedule_at=self.get_schedule_at(), parent=parent) for __ in range(2)]
+
+        children[0].terminate(status=JobStatusChoices.STATUS_ERRORED)
+        parent.refresh_from_db()
+        self.assertEqual(parent.status, JobStatusChoices.STATUS_RUNNING)
+
+        children[1].terminate()
+        parent.refresh_from_db()
+        self.assertEqual(parent.status, JobStatusChoices.STATUS_ERRORED)
+        self.assertEqual(parent.error, "1 of 2 child jobs errored")
+
 
 class EnqueueTest(JobRunnerTestCase):
     """
@@ -173,3 +203,24 @@ class SystemJobTest(JobRunnerTestCase):
 
         self.assertEqual(job1, job2)
         self.assertEqual(TestJobRunner.get_jobs().count(), 1)
+
+
+class JobLogWriterTest(JobRunnerTestCase):
+
+    def test_write(self):
+        job = TestJobRunner.enqueue(schedule_at=self.get_schedule_at())
+
+        with JobLogWriter(job, batch_size=2) as log_writer:
+            log_writer.write('info', 'Message 1')
+            log_writer.write('info', 'Message 2')
+            log_writer.write('warning', 'Message 3', object_repr='Site 1', url='/dcim/sites/1/')
+
+        self.assertEqual(log_writer.counts, {'info': 2, 'warning': 1})
+        self.assertEqual(
+            list(job.log_entries.values_list('level', 'message')),
+            [('info', 'Message 1'), ('info', 'Message 2'), ('warning', 'Message 3')]
+        )
+
+        # Deleting the job should delete its log entries
+        job.delete()
+        self.assertFalse(JobLogEntry.objects.exists())
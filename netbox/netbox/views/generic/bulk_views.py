@@ -1,35 +1,43 @@
 import logging
 import re
+import time
+import uuid
+from contextlib import nullcontext
 from copy import deepcopy
 
 from django.contrib import messages
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRel
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist, ValidationError
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
 from django.db import IntegrityError, router, transaction
 from django.db.models import ManyToManyField, ProtectedError, RestrictedError
 from django.db.models.fields.reverse_related import ManyToManyRel
 from django.forms import ModelMultipleChoiceField, MultipleHiddenInput
-from django.http import HttpResponse
+from django.http import QueryDict, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
 from django.utils.safestring import mark_safe
 from django.utils.translation import gettext as _
-from django_tables2.export import TableExport
 from mptt.models import MPTTModel
 
 from core.models import ObjectType
 from core.signals import clear_events
 from extras.choices import CustomFieldUIEditableChoices
 from extras.models import CustomField, ExportTemplate
+from netbox.registry import registry
+from utilities.bulk import bulk_save, supports_bulk_save
 from utilities.error_handlers import handle_protectederror
 from utilities.exceptions import AbortRequest, AbortTransaction, PermissionsViolation
+from utilities.export import stream_table_csv, stream_yaml
 from utilities.forms import BulkRenameForm, ConfirmationForm, restrict_form_fields
-from utilities.forms.bulk_import import BulkImportForm
+from utilities.forms.bulk_import import BulkImportForm, CSVObjectCache
 from utilities.htmx import htmx_partial
+from utilities.mptt import get_tree_ids
 from utilities.permissions import get_permission_for_model
 from utilities.query import reapply_model_ordering
-from utilities.request import safe_for_redirect
+from utilities.request import NetBoxFakeRequest, copy_safe_request, get_boolean_param, safe_for_redirect
 from utilities.tables import get_table_configs
 from utilities.views import GetReturnURLMixin, get_viewname
 from .base import BaseMultiObjectView
@@ -70,15 +78,15 @@ class ObjectListView(BaseMultiObjectView, ActionsMixin, TableMixin):
 
     def export_yaml(self):
         """
-        Export the queryset of objects as concatenated YAML documents.
+        Export the queryset of objects as concatenated YAML documents. Returns an iterator yielding one document at
+        a time.
         """
-        yaml_data = [obj.to_yaml() for obj in self.queryset]
-
-        return '---\n'.join(yaml_data)
+        return stream_yaml(self.queryset)
 
     def export_table(self, table, columns=None, filename=None):
         """
-        Export all table data in CSV format.
+        Export all table data in CSV format. The response is streamed, rendering rows as they are retrieved from the
+        database.
 
         Args:
             table: The Table instance to export
@@ -92,14 +100,37 @@ class ObjectListView(BaseMultiObjectView, ActionsMixin, TableMixin):
             exclude_columns.update({
                 col for col in all_columns if col not in columns
             })
-        exporter = TableExport(
-            export_format=TableExport.CSV,
-            table=table,
-            exclude_columns=exclude_columns
+        response = StreamingHttpResponse(
+            stream_table_csv(table, exclude_columns=exclude_columns),
+            content_type='text/csv; charset=utf-8'
         )
-        return exporter.response(
-            filename=filename or f'netbox_{self.queryset.model._meta.verbose_name_plural}.csv'
+        filename = filename or f'netbox_{self.queryset.model._meta.verbose_name_plural}.csv'
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+    def export_background(self, request):
+        """
+        Enqueue a background job to perform the requested export and store the result for later download.
+
+        Args:
+            request: The current request
+        """
+        from core.jobs import ExportObjectsJob
+
+        # Strip the `background` param so that the job performs the export itself
+        export_request = copy_safe_request(request)
+        export_request.GET = request.GET.copy()
+        export_request.GET.pop('background')
+
+        job = ExportObjectsJob.enqueue(user=request.user, view=self.__class__, request=export_request)
+        messages.info(
+            request,
+            _("Queued job #{id} to export {model}").format(
+                id=job.pk,
+                model=self.queryset.model._meta.verbose_name_plural
+            )
         )
+        return redirect(job.get_absolute_url())
 
     def export_template(self, template, request):
         """
@@ -112,6 +143,9 @@ class ObjectListView(BaseMultiObjectView, ActionsMixin, TableMixin):
         try:
             return template.render_to_response(queryset=self.queryset)
         except Exception as e:
+            # Exports run as a background job report their errors via the job
+            if isinstance(request, NetBoxFakeRequest):
+                raise
             messages.error(
                 request,
                 _("There was an error rendering the selected export template ({template}): {error}").format(
@@ -154,6 +188,10 @@ class ObjectListView(BaseMultiObjectView, ActionsMixin, TableMixin):
 
         if 'export' in request.GET:
 
+            # Hand the export off to a background job
+            if get_boolean_param(request.GET, 'background'):
+                return self.export_background(request)
+
             # Export the current table view
             if request.GET['export'] == 'table':
                 table = self.get_table(self.queryset, request, has_bulk_actions)
@@ -167,7 +205,7 @@ class ObjectListView(BaseMultiObjectView, ActionsMixin, TableMixin):
 
             # Check for YAML export support on the model
             elif hasattr(model, 'to_yaml'):
-                response = HttpResponse(self.export_yaml(), content_type='text/yaml')
+                response = StreamingHttpResponse(self.export_yaml(), content_type='text/yaml')
                 filename = 'netbox_{}.yaml'.format(self.queryset.model._meta.verbose_name_plural)
                 response['Content-Disposition'] = 'attachment; filename="{}"'.format(filename)
                 return response
@@ -403,7 +441,7 @@ class BulkImportView(GetReturnURLMixin, BaseMultiObjectView):
         """
         return object_form.save()
 
-    def create_and_update_objects(self, form, request):
+    def create_and_update_objects(self, form, request, start=1):
         saved_objects = []
 
         records = list(form.cleaned_data['data'])
@@ -415,67 +453,159 @@ class BulkImportView(GetReturnURLMixin, BaseMultiObjectView):
             for obj in self.queryset.model.objects.filter(id__in=prefetch_ids)
         } if prefetch_ids else {}
 
-        for i, record in enumerate(records, start=1):
-            instance = None
-            object_id = int(record.pop('id')) if record.get('id') else None
-
-            # Determine whether this object is being created or updated
-            if object_id:
-                try:
-                    instance = prefetched_objects[object_id]
-                except KeyError:
-                    form.add_error('data', _("Row {i}: Object with ID {id} does not exist").format(i=i, id=object_id))
-                    raise ValidationError('')
+        # Retrieve any custom fields for which default values must be applied to new objects
+        custom_fields = CustomField.objects.filter(
+            object_types=ContentType.objects.get_for_model(self.queryset.model),
+            ui_editable=CustomFieldUIEditableChoices.YES
+        )
 
-                # Take a snapshot for change logging
-                if instance.pk and hasattr(instance, 'snapshot'):
-                    instance.snapshot()
+        # Resolve related objects referenced by the records in batches, rather than individually for each form
+        object_cache = CSVObjectCache(records)
 
-            else:
-                # For newly created objects, apply any default custom field values
-                custom_fields = CustomField.objects.filter(
-                    object_types=ContentType.objects.get_for_model(self.queryset.model),
-                    ui_editable=CustomFieldUIEditableChoices.YES
-                )
-                for cf in custom_fields:
-                    field_name = f'cf_{cf.name}'
-                    if field_name not in record:
-                        record[field_name] = cf.default
-
-            # Instantiate the model form for the object
-            model_form_kwargs = {
-                'data': record,
-                'instance': instance,
-            }
-            if hasattr(form, '_csv_headers'):
-                model_form_kwargs['headers'] = form._csv_headers  # Add CSV headers
-            model_form = self.model_form(**model_form_kwargs)
-
-            # When updating, omit all form fields other than those specified in the record. (No
-            # fields are required when modifying an existing object.)
-            if object_id:
-                unused_fields = [f for f in model_form.fields if f not in record]
-                for field_name in unused_fields:
-                    del model_form.fields[field_name]
-
-            restrict_form_fields(model_form, request.user)
+        # Defer maintenance of MPTT trees until all objects have been saved, and then rebuild only the affected trees
+        if issubclass(self.queryset.model, MPTTModel):
+            tree_rebuild = self.queryset.model.objects.delay_tree_rebuild()
+        else:
+            tree_rebuild = nullcontext()
+
+        with tree_rebuild as tree_ids:
+            for i, record in enumerate(records, start=start):
+                instance = None
+                object_id = int(record.pop('id')) if record.get('id') else None
+
+                # Determine whether this object is being created or updated
+                if object_id:
+                    try:
+                        instance = prefetched_objects[object_id]
+                    except KeyError:
+                        form.add_error(
+                            'data', _("Row {i}: Object with ID {id} does not exist").format(i=i, id=object_id)
+                        )
+                        raise ValidationError('')
+
+                    # Take a snapshot for change logging
+                    if instance.pk and hasattr(instance, 'snapshot'):
+                        instance.snapshot()
 
-            if model_form.is_valid():
-                obj = self._save_object(form, model_form, request)
-                saved_objects.append(obj)
-            else:
-                # Replicate model form errors for display
-                for field, errors in model_form.errors.items():
-                    for err in errors:
-                        if field == '__all__':
-                            form.add_error(None, f'Record {i}: {err}')
-                        else:
-                            form.add_error(None, f'Record {i} {field}: {err}')
+                else:
+                    # For newly created objects, apply any default custom field values
+                    for cf in custom_fields:
+                        field_name = f'cf_{cf.name}'
+                        if field_name not in record:
+                            record[field_name] = cf.default
+
+                # Instantiate the model form for the object
+                model_form_kwargs = {
+                    'data': record,
+                    'instance': instance,
+                }
+                if hasattr(form, '_csv_headers'):
+                    model_form_kwargs['headers'] = form._csv_headers  # Add CSV headers
+                model_form = self.model_form(**model_form_kwargs)
+
+                # When updating, omit all form fields other than those specified in the record. (No
+                # fields are required when modifying an existing object.)
+                if object_id:
+                    unused_fields = [f for f in model_form.fields if f not in record]
+                    for field_name in unused_fields:
+                        del model_form.fields[field_name]
+
+                restrict_form_fields(model_form, request.user)
+                object_cache.bind(model_form)
+
+                if model_form.is_valid():
+                    obj = self._save_object(form, model_form, request)
+                    saved_objects.append(obj)
+                    if tree_ids is not None:
+                        tree_ids.update(get_tree_ids(obj))
+                else:
+                    # Replicate model form errors for display
+                    for field, errors in model_form.errors.items():
+                        for err in errors:
+                            if field == '__all__':
+                                form.add_error(None, f'Record {i}: {err}')
+                            else:
+                                form.add_error(None, f'Record {i} {field}: {err}')
 
-                raise ValidationError("")
+                    raise ValidationError("")
 
         return saved_objects
 
+    def import_records(self, records, request, headers=None, start=1):
+        """
+        Import a set of records (e.g. a chunk of the data being processed by a background job) within a single
+        transaction. If any record fails, no objects are saved. Returns a tuple of the saved objects and a list of any
+        errors.
+
+        Args:
+            records: A list of dictionaries, each representing an object to be created or updated
+            request: The request (or a copy of it) which initiated the import
+            headers: CSV column headers (if applicable)
+            start: The number of the first record (for error reporting)
+        """
+        model = self.queryset.model
+        form = BulkImportForm()
+        form.cleaned_data = {'data': records}
+        if headers is not None:
+            form._csv_headers = headers
+
+        try:
+            with transaction.atomic(using=router.db_for_write(model)):
+                saved_objects = self.create_and_update_objects(form, request, start=start)
+
+                # Enforce object-level permissions
+                if self.queryset.filter(pk__in=[obj.pk for obj in saved_objects]).count() != len(saved_objects):
+                    raise PermissionsViolation
+
+        except (AbortTransaction, ValidationError) as e:
+            errors = [str(error) for errors in form.errors.values() for error in errors]
+            if not errors and isinstance(e, ValidationError):
+                errors = [message for message in e.messages if message]
+            return [], errors or [_("Import failed at or after record {start}").format(start=start)]
+
+        except (AbortRequest, PermissionsViolation) as e:
+            return [], [e.message]
+
+        return saved_objects, []
+
+    def import_background(self, request, form):
+        """
+        Save the import data to the default storage backend and enqueue a background job to process it.
+
+        Args:
+            request: The current request
+            form: The validated BulkImportForm
+        """
+        from core.jobs import ImportObjectsJob
+
+        path = default_storage.save(
+            f'imports/{uuid.uuid4()}/data',
+            ContentFile(form.cleaned_data['data'].encode('utf-8'))
+        )
+
+        # Omit the submitted data from the copy of the request passed to the job
+        import_request = copy_safe_request(request)
+        import_request.POST = QueryDict()
+        import_request.FILES = {}
+
+        job = ImportObjectsJob.enqueue(
+            user=request.user,
+            view=self.__class__,
+            request=import_request,
+            path=path,
+            format=form.cleaned_data['format'],
+            csv_delimiter=form.cleaned_data['csv_delimiter'],
+            chunk_size=form.cleaned_data['chunk_size']
+        )
+        messages.info(
+            request,
+            _("Queued job #{id} to import {model}").format(
+                id=job.pk,
+                model=self.queryset.model._meta.verbose_name_plural
+            )
+        )
+        return redirect(job.get_absolute_url())
+
     #
     # Request handlers
     #
@@ -499,8 +629,13 @@ class BulkImportView(GetReturnURLMixin, BaseMultiObjectView):
         if form.is_valid():
             logger.debug("Import form validation was successful")
 
+            # Hand the import off to a background job
+            if form.cleaned_data['background_job']:
+                return self.import_background(request, form)
+
             try:
                 # Iterate through data and bind each record to a new model form instance.
+                start_time = time.monotonic()
                 with transaction.atomic(using=router.db_for_write(model)):
                     new_objs = self.create_and_update_objects(form, request)
 
@@ -510,7 +645,8 @@ class BulkImportView(GetReturnURLMixin, BaseMultiObjectView):
 
                 if new_objs:
                     msg = f"Imported {len(new_objs)} {model._meta.verbose_name_plural}"
-                    logger.info(msg)
+                    elapsed = time.monotonic() - start_time
+                    logger.info(f"{msg} in {elapsed:.2f} seconds ({len(new_objs) / max(elapsed, 0.001):.1f} rows/sec)")
                     messages.success(request, msg)
 
                     view_name = get_viewname(model, action='list')
@@ -563,6 +699,110 @@ class BulkEditView(GetReturnURLMixin, BaseMultiObjectView):
         if form.cleaned_data.get('remove_tags', None):
             obj.tags.remove(*form.cleaned_data['remove_tags'])
 
+    def _apply_changes(self, obj, form, model_fields, custom_fields, nullified_fields):
+        """
+        Apply the changes specified by the form to an object (without saving it).
+        """
+        # Update standard fields. If a field is listed in _nullify, delete its value.
+        for name, model_field in model_fields.items():
+            # Handle nullification
+            if name in form.nullable_fields and name in nullified_fields:
+                if type(model_field) is GenericForeignKey:
+                    setattr(obj, name, None)
+                else:
+                    setattr(obj, name, None if model_field.null else '')
+            # Normal fields
+            elif name in form.changed_data:
+                setattr(obj, name, form.cleaned_data[name])
+
+        # Update custom fields
+        for name, customfield in custom_fields.items():
+            assert name.startswith('cf_')
+            cf_name = name[3:]  # Strip cf_ prefix
+            if name in form.nullable_fields and name in nullified_fields:
+                obj.custom_field_data[cf_name] = None
+            elif name in form.changed_data:
+                obj.custom_field_data[cf_name] = customfield.serialize(form.cleaned_data[name])
+
+        # Store M2M values for validation
+        obj._m2m_values = {}
+        for field in obj._meta.local_many_to_many:
+            if value := form.cleaned_data.get(field.name):
+                obj._m2m_values[field.name] = list(value)
+            elif field.name in nullified_fields:
+                obj._m2m_values[field.name] = []
+
+    def _tree_fields_changed(self, form, nullified_fields):
+        """
+        Return True if the form modifies any field which determines the position of MPTT nodes within their trees.
+        """
+        model = self.queryset.model
+        if not issubclass(model, MPTTModel):
+            return False
+        tree_fields = (model._mptt_meta.parent_attr, *model._mptt_meta.order_insertion_by)
+        return any(name in form.changed_data or name in nullified_fields for name in tree_fields)
+
+    def _can_bulk_update(self, form, model_fields, m2m_fields, nullified_fields):
+        """
+        Return True if the selected objects can be updated using bulk queries. This is possible only when the edit
+        affects concrete fields on the model itself, and no object-level operations are required after saving.
+        """
+        model = self.queryset.model
+
+        # The model's own save() logic and signal receivers may depend on objects being saved individually
+        if not supports_bulk_save(model):
+            return False
+
+        # Object-level post-save operations must be performed individually
+        if type(self).post_save_operations is not BulkEditView.post_save_operations:
+            return False
+        if form.cleaned_data.get('add_tags') or form.cleaned_data.get('remove_tags'):
+            return False
+
+        # M2M assignments must be performed individually
+        for field in model._meta.local_many_to_many:
+            if form.cleaned_data.get(field.name) or field.name in nullified_fields:
+                return False
+        for name in m2m_fields:
+            if form.cleaned_data.get(name) or name in nullified_fields:
+                return False
+
+        # Check that each modified field maps to a concrete model field which is not tracked by a counter
+        counter_fields = registry['counter_fields'][model]
+        for name, model_field in model_fields.items():
+            if name not in form.changed_data and name not in nullified_fields:
+                continue
+            if model_field is None or not getattr(model_field, 'concrete', False):
+                return False
+            if model_field.attname in counter_fields:
+                return False
+
+        return True
+
+    def _bulk_update_objects(self, form, model_fields, custom_fields, nullified_fields):
+        """
+        Update the selected objects using bulk queries (see bulk_save()).
+        """
+        model = self.queryset.model
+        objects = list(self.queryset.filter(pk__in=form.cleaned_data['pk']))
+
+        # Apply and validate changes to all objects prior to writing any to the database
+        for obj in objects:
+            if hasattr(obj, 'snapshot'):
+                obj.snapshot()
+            self._apply_changes(obj, form, model_fields, custom_fields, nullified_fields)
+            obj.full_clean()
+
+        # Determine which fields to update
+        update_fields = {
+            model_fields[name].attname for name in model_fields
+            if name in form.changed_data or name in nullified_fields
+        }
+        if custom_fields:
+            update_fields.add('custom_field_data')
+
+        return bulk_save(model, objects, update_fields=update_fields)
+
     def _update_objects(self, form, request):
         custom_fields = getattr(form, 'custom_fields', {})
         standard_fields = [
@@ -588,57 +828,40 @@ class BulkEditView(GetReturnURLMixin, BaseMultiObjectView):
                 # This form field is used to modify a field rather than set its value directly
                 model_fields[name] = None
 
-        for obj in self.queryset.filter(pk__in=form.cleaned_data['pk']):
+        # If the position of MPTT nodes may change, defer tree maintenance until all objects have been saved and then
+        # rebuild only the affected trees
+        if self._tree_fields_changed(form, nullified_fields):
+            tree_rebuild = self.queryset.model.objects.delay_tree_rebuild()
+        else:
+            tree_rebuild = nullcontext()
 
-            # Take a snapshot of change-logged models
-            if hasattr(obj, 'snapshot'):
-                obj.snapshot()
+            # Update the objects in bulk where possible
+            if self._can_bulk_update(form, model_fields, m2m_fields, nullified_fields):
+                return self._bulk_update_objects(form, model_fields, custom_fields, nullified_fields)
 
-            # Update standard fields. If a field is listed in _nullify, delete its value.
-            for name, model_field in model_fields.items():
-                # Handle nullification
-                if name in form.nullable_fields and name in nullified_fields:
-                    if type(model_field) is GenericForeignKey:
-                        setattr(obj, name, None)
-                    else:
-                        setattr(obj, name, None if model_field.null else '')
-                # Normal fields
-                elif name in form.changed_data:
-                    setattr(obj, name, form.cleaned_data[name])
-
-            # Update custom fields
-            for name, customfield in custom_fields.items():
-                assert name.startswith('cf_')
-                cf_name = name[3:]  # Strip cf_ prefix
-                if name in form.nullable_fields and name in nullified_fields:
-                    obj.custom_field_data[cf_name] = None
-                elif name in form.changed_data:
-                    obj.custom_field_data[cf_name] = customfield.serialize(form.cleaned_data[name])
-
-            # Store M2M values for validation
-            obj._m2m_values = {}
-            for field in obj._meta.local_many_to_many:
-                if value := form.cleaned_data.get(field.name):
-                    obj._m2m_values[field.name] = list(value)
-                elif field.name in nullified_fields:
-                    obj._m2m_values[field.name] = []
+        with tree_rebuild as tree_ids:
+            for obj in self.queryset.filter(pk__in=form.cleaned_data['pk']):
 
-            obj.full_clean()
-            obj.save()
-            updated_objects.append(obj)
+                # Take a snapshot of change-logged models
+                if hasattr(obj, 'snapshot'):
+                    obj.snapshot()
 
-            # Handle M2M fields after save
-            for name, m2m_field in m2m_fields.items():
-                if name in form.nullable_fields and name in nullified_fields:
-                    getattr(obj, name).clear()
-                elif form.cleaned_data[name]:
-                    getattr(obj, name).set(form.cleaned_data[name])
+                self._apply_changes(obj, form, model_fields, custom_fields, nullified_fields)
 
-            self.post_save_operations(form, obj)
+                obj.full_clean()
+                obj.save()
+                updated_objects.append(obj)
+                if tree_ids is not None:
+                    tree_ids.update(get_tree_ids(obj))
 
-        # Rebuild the tree for MPTT models
-        if issubclass(self.queryset.model, MPTTModel):
-            self.queryset.model.objects.rebuild()
+                # Handle M2M fields after save
+                for name, m2m_field in m2m_fields.items():
+                    if name in form.nullable_fields and name in nullified_fields:
+                        getattr(obj, name).clear()
+                    elif form.cleaned_data[name]:
+                        getattr(obj, name).set(form.cleaned_data[name])
+
+                self.post_save_operations(form, obj)
 
         return updated_objects
 
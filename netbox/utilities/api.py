@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.core.exceptions import (
     FieldDoesNotExist, FieldError, MultipleObjectsReturned, ObjectDoesNotExist, ValidationError,
@@ -24,6 +26,10 @@ __all__ = (
     'is_api_request',
 )
 
+# Maximum number of prefetch/annotation plans and serializer field sets to retain per process. Each is keyed by the
+# serializer class and the requested fields.
+SERIALIZER_CACHE_SIZE = 1024
+
 
 def get_serializer_for_model(model, prefix=''):
     """
@@ -78,6 +84,12 @@ def get_prefetches_for_serializer(serializer_class, fields_to_include=None):
     """
     Compile and return a list of fields which should be prefetched on the queryset for a serializer.
     """
+    fields_to_include = tuple(fields_to_include) if fields_to_include else None
+    return list(_get_prefetches_for_serializer(serializer_class, fields_to_include))
+
+
+@lru_cache(maxsize=SERIALIZER_CACHE_SIZE)
+def _get_prefetches_for_serializer(serializer_class, fields_to_include):
     model = serializer_class.Meta.model
 
     # If fields are not specified, default to all
@@ -110,13 +122,19 @@ def get_prefetches_for_serializer(serializer_class, fields_to_include=None):
                 for subfield in get_prefetches_for_serializer(type(serializer_field), subfields):
                     prefetch_fields.append(f'{field_name}__{subfield}')
 
-    return prefetch_fields
+    return tuple(prefetch_fields)
 
 
 def get_annotations_for_serializer(serializer_class, fields_to_include=None):
     """
     Return a mapping of field names to annotations to be applied to the queryset for a serializer.
     """
+    fields_to_include = tuple(fields_to_include) if fields_to_include else None
+    return dict(_get_annotations_for_serializer(serializer_class, fields_to_include))
+
+
+@lru_cache(maxsize=SERIALIZER_CACHE_SIZE)
+def _get_annotations_for_serializer(serializer_class, fields_to_include):
     annotations = {}
 
     # If specific fields are not specified, default to all
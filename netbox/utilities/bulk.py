@@ -0,0 +1,165 @@
+import time
+
+from django.contrib.contenttypes.fields import GenericRelation
+from django.db import models, router
+from django.db.models.signals import post_save, pre_save
+
+from netbox.signals import post_bulk_update
+from utilities.constants import BULK_DELETE_BATCH_SIZE, BULK_UPDATE_BATCH_SIZE
+
+__all__ = (
+    'bulk_delete',
+    'bulk_save',
+    'save_deferred',
+    'supports_bulk_save',
+)
+
+
+def _has_receivers(signal, sender):
+    """
+    Return True if any receivers have been connected to the signal specifically for the given sender.
+    """
+    sender_id = id(sender)
+    return any(lookup_key[1] == sender_id for lookup_key, *__ in signal.receivers)
+
+
+def supports_bulk_save(model):
+    """
+    Return True if instances of the model can be saved using bulk queries. This is not the case if the model overrides
+    save() (other than within NetBox's generic model mixins), or if any pre_save or post_save receivers have been
+    connected for the model specifically: Such logic may depend on the state of other objects in the database, which
+    is not updated until the entire set has been saved.
+    """
+    for cls in model.__mro__:
+        if 'save' in cls.__dict__ and not cls.__module__.startswith(('django.', 'netbox.models')):
+            return False
+    return not any(_has_receivers(signal, model) for signal in (pre_save, post_save))
+
+
+def save_deferred(obj, using):
+    """
+    Run an object's save() logic, including any pre_save signal receivers, without writing it to the database.
+    Returns the names of any concrete fields modified in the process.
+    """
+    fields = [field for field in obj._meta.concrete_fields if not field.primary_key]
+    initial_values = {field.attname: getattr(obj, field.attname) for field in fields}
+
+    def save_base(*args, **kwargs):
+        pre_save.send(sender=obj.__class__, instance=obj, raw=False, using=using, update_fields=None)
+        # Populate any values generated on save (e.g. auto_now timestamps and naturalized fields)
+        for field in fields:
+            value = field.pre_save(obj, False)
+            if value is not getattr(obj, field.attname):
+                setattr(obj, field.attname, value)
+
+    # Substitute save_base() on the instance to intercept the write
+    obj.save_base = save_base
+    try:
+        obj.save(using=using)
+    finally:
+        del obj.save_base
+
+    return {
+        field.attname for field in fields if getattr(obj, field.attname) != initial_values[field.attname]
+    }
+
+
+def bulk_save(model, objects, update_fields=None):
+    """
+    Save a set of existing objects using bulk queries. Each object's save() logic is executed as normal, but the
+    resulting changes are written to the database collectively. A post_save signal is sent for each object (with
+    bulk=True) followed by a single post_bulk_update signal, allowing change logging, search caching, and
+    notifications to be handled in batches.
+
+    If the model does not support bulk saving (see supports_bulk_save()), each object is instead saved individually.
+
+    Args:
+        model: The model of the objects being saved
+        objects: A list of model instances
+        update_fields: The names of any fields modified prior to calling bulk_save() (in addition to those modified
+            by each object's save() logic)
+    """
+    using = router.db_for_write(model)
+    if not supports_bulk_save(model):
+        for obj in objects:
+            obj.save(using=using)
+        return objects
+
+    update_fields = set(update_fields or ())
+    for obj in objects:
+        update_fields.update(save_deferred(obj, using))
+
+    if update_fields:
+        model.objects.bulk_update(objects, update_fields, batch_size=BULK_UPDATE_BATCH_SIZE)
+
+    for obj in objects:
+        post_save.send(
+            sender=model,
+            instance=obj,
+            created=False,
+            update_fields=None,
+            raw=False,
+            using=using,
+            bulk=True
+        )
+    post_bulk_update.send(sender=model, instances=objects)
+
+    return objects
+
+
+def _has_dependents(model):
+    """
+    Return True if deleting an instance of the model requires the deletion or modification of any other objects (e.g.
+    cascading to related objects or to many-to-many relationships).
+    """
+    return bool(model._meta.many_to_many) or any(
+        rel.on_delete is not models.DO_NOTHING for rel in model._meta.related_objects
+    ) or any(
+        isinstance(field, GenericRelation) for field in model._meta.private_fields
+    )
+
+
+def bulk_delete(queryset, batch_size=BULK_DELETE_BATCH_SIZE, pause=0, raw=True, callback=None):
+    """
+    Delete all objects matching a queryset in batches of primary keys, committing each batch separately. This avoids
+    holding locks on (or loading into memory) a large number of rows at once. Returns the number of objects deleted.
+
+    If raw is True and no other objects depend on the model, each batch is deleted using a single DELETE query without
+    loading its objects: Note that no pre_delete or post_delete signals are sent in this case. Otherwise, each batch
+    is deleted using QuerySet.delete().
+
+    Args:
+        queryset: The objects to delete
+        batch_size: The maximum number of objects to delete at a time
+        pause: The number of seconds to wait between batches (to limit the load placed on the database)
+        raw: Delete objects directly (where possible), bypassing the deletion collector and its signals
+        callback: A function to be called with the cumulative number of objects deleted after each batch
+    """
+    model = queryset.model
+    using = router.db_for_write(model)
+    raw = raw and not _has_dependents(model)
+    queryset = queryset.order_by('pk')
+
+    deleted_count = 0
+    last_pk = None
+    while True:
+        batch = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        pk_list = list(batch.values_list('pk', flat=True)[:batch_size])
+        if not pk_list:
+            break
+        last_pk = pk_list[-1]
+
+        to_delete = model._base_manager.using(using).filter(pk__in=pk_list)
+        if raw:
+            deleted_count += to_delete._raw_delete(using)
+        else:
+            deleted_count += to_delete.delete()[1].get(model._meta.label, 0)
+        if callback:
+            callback(deleted_count)
+
+        if len(pk_list) < batch_size:
+            break
+        if pause:
+            time.sleep(pause)
+
+    return deleted_count
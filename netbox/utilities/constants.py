@@ -99,3 +99,30 @@ HTML_ALLOWED_ATTRIBUTES = {
 HTTP_PROXY_SUPPORTED_SOCK_SCHEMAS = ['socks4', 'socks4a', 'socks4h', 'socks5', 'socks5a', 'socks5h']
 HTTP_PROXY_SOCK_RDNS_SCHEMAS = ['socks4h', 'socks4a', 'socks5h', 'socks5a']
 HTTP_PROXY_SUPPORTED_SCHEMAS = ['http', 'https', 'socks4', 'socks4a', 'socks4h', 'socks5', 'socks5a', 'socks5h']
+
+#
+# Exports
+#
+
+# Number of objects to retrieve from the database at a time when streaming an export
+EXPORT_CHUNK_SIZE = 2000
+
+#
+# Bulk operations
+#
+
+# Maximum number of objects to write to the database in a single query when updating objects in bulk
+BULK_UPDATE_BATCH_SIZE = 500
+
+# Number of objects to delete at a time when purging expired records in bulk
+BULK_DELETE_BATCH_SIZE = 10000
+
+#
+# Imports
+#
+
+# Number of characters sampled from the beginning of CSV data to detect its dialect
+CSV_SNIFF_SIZE = 65536
+
+# Number of records processed at a time by a background import job within a single transaction
+IMPORT_CHUNK_SIZE = 1000
@@ -0,0 +1,89 @@
+import csv
+
+from django.db.models import QuerySet
+from django.utils.encoding import force_str
+from django_tables2.rows import BoundRow
+
+from .constants import EXPORT_CHUNK_SIZE
+
+__all__ = (
+    'ChunkedQuerySet',
+    'iterate_queryset',
+    'stream_table_csv',
+    'stream_yaml',
+)
+
+
+class Echo:
+    """
+    A pseudo-buffer which simply returns each value written to it. Used to stream the output of csv.writer.
+    """
+    def write(self, value):
+        return value
+
+
+class ChunkedQuerySet:
+    """
+    A thin wrapper around a QuerySet which is consumed in chunks when iterated, so that the complete result set is
+    never held in memory. Other attributes (e.g. filter() or count()) are proxied to the underlying QuerySet. Note
+    that results are not cached: each iteration executes a new query.
+    """
+    def __init__(self, queryset, chunk_size=EXPORT_CHUNK_SIZE):
+        self.queryset = queryset
+        self.chunk_size = chunk_size
+
+    def __iter__(self):
+        return self.queryset.iterator(chunk_size=self.chunk_size)
+
+    def __len__(self):
+        return self.queryset.count()
+
+    def __bool__(self):
+        return self.queryset.exists()
+
+    def __getitem__(self, key):
+        return self.queryset[key]
+
+    def __getattr__(self, name):
+        return getattr(self.queryset, name)
+
+
+def iterate_queryset(data, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Iterate over a QuerySet in chunks of the given size, without populating its result cache. Any prefetches are
+    applied to each chunk. Other iterables are returned as-is.
+    """
+    if isinstance(data, QuerySet):
+        return data.iterator(chunk_size=chunk_size)
+    return iter(data)
+
+
+def stream_table_csv(table, exclude_columns=None, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Render the data of a django-tables2 Table as CSV, one row at a time. This mirrors Table.as_values(), but
+    consumes the underlying QuerySet in chunks so that memory consumption remains flat regardless of its size.
+
+    Args:
+        table: The Table instance to export
+        exclude_columns: A set of column names to omit
+        chunk_size: The number of objects to retrieve from the database at a time
+    """
+    exclude_columns = exclude_columns or set()
+    columns = [
+        column for column in table.columns.iterall()
+        if not (column.column.exclude_from_export or column.name in exclude_columns)
+    ]
+    writer = csv.writer(Echo())
+
+    yield writer.writerow([force_str(column.header, strings_only=True) for column in columns])
+    for record in iterate_queryset(getattr(table.data, 'data', table.data), chunk_size):
+        row = BoundRow(record, table=table)
+        yield writer.writerow([force_str(row.get_cell_value(column.name), strings_only=True) for column in columns])
+
+
+def stream_yaml(queryset, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Render each object in the QuerySet as a YAML document, one at a time.
+    """
+    for i, obj in enumerate(iterate_queryset(queryset, chunk_size)):
+        yield obj.to_yaml() if not i else f'---\n{obj.to_yaml()}'
@@ -1,15 +1,24 @@
 import csv
 import json
+from collections import defaultdict
 from io import StringIO
 
 import yaml
 from django import forms
+from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.utils.translation import gettext as _
 
 from core.forms.mixins import SyncedDataMixin
 from netbox.choices import CSVDelimiterChoices, ImportFormatChoices, ImportMethodChoices
-from utilities.constants import CSV_DELIMITERS
-from utilities.forms.utils import parse_csv
+from utilities.constants import CSV_DELIMITERS, CSV_SNIFF_SIZE
+from utilities.forms.fields.csv import CSVModelChoiceField
+from utilities.forms.utils import iter_csv_records, parse_csv, parse_csv_headers
+
+__all__ = (
+    'BulkImportForm',
+    'CSVObjectCache',
+    'iter_import_records',
+)
 
 
 class BulkImportForm(SyncedDataMixin, forms.Form):
@@ -37,6 +46,20 @@ class BulkImportForm(SyncedDataMixin, forms.Form):
         help_text=_("The character which delimits CSV fields. Applies only to CSV format."),
         required=False
     )
+    background_job = forms.BooleanField(
+        label=_("Background job"),
+        help_text=_("Process the import as a background job. Recommended for large imports."),
+        required=False
+    )
+    chunk_size = forms.IntegerField(
+        label=_("Chunk size"),
+        min_value=1,
+        help_text=_(
+            "Applies only to background jobs. Commit imported objects in batches of this size; if omitted, all "
+            "objects are imported in a single transaction."
+        ),
+        required=False
+    )
 
     data_field = 'data'
 
@@ -68,6 +91,12 @@ class BulkImportForm(SyncedDataMixin, forms.Form):
         else:
             format = self.cleaned_data['format']
 
+        # Defer processing of the data to a background job
+        if self.cleaned_data.get('background_job'):
+            self.cleaned_data['data'] = data
+            self.cleaned_data['format'] = format
+            return
+
         # Process data according to the selected format
         if format == ImportFormatChoices.CSV:
             delimiter = self.cleaned_data.get('csv_delimiter', CSVDelimiterChoices.AUTO)
@@ -100,28 +129,34 @@ class BulkImportForm(SyncedDataMixin, forms.Form):
             'format': _('Unable to detect data format. Please specify.')
         })
 
-    def _clean_csv(self, data, delimiter=CSVDelimiterChoices.AUTO):
+    @staticmethod
+    def get_csv_dialect(data, delimiter=CSVDelimiterChoices.AUTO):
         """
-        Clean CSV-formatted data. The first row will be treated as column headers.
+        Determine the CSV dialect to use for parsing the given data (or a sample of it).
         """
-        # Determine the CSV dialect
         if delimiter == CSVDelimiterChoices.AUTO:
             # This uses a rough heuristic to detect the CSV dialect based on the presence of supported delimiting
             # characters. If the data is malformed, we'll fall back to the default Excel dialect.
             delimiters = ''.join(CSV_DELIMITERS.values())
             try:
-                dialect = csv.Sniffer().sniff(data.strip(), delimiters=delimiters)
+                return csv.Sniffer().sniff(data.strip(), delimiters=delimiters)
             except csv.Error:
-                dialect = csv.excel
+                return csv.excel
         elif delimiter in (CSVDelimiterChoices.COMMA, CSVDelimiterChoices.SEMICOLON):
             dialect = csv.excel
             dialect.delimiter = delimiter
+            return dialect
         elif delimiter == CSVDelimiterChoices.TAB:
-            dialect = csv.excel_tab
-        else:
-            raise forms.ValidationError({
-                'csv_delimiter': _('Invalid CSV delimiter'),
-            })
+            return csv.excel_tab
+        raise forms.ValidationError({
+            'csv_delimiter': _('Invalid CSV delimiter'),
+        })
+
+    def _clean_csv(self, data, delimiter=CSVDelimiterChoices.AUTO):
+        """
+        Clean CSV-formatted data. The first row will be treated as column headers.
+        """
+        dialect = self.get_csv_dialect(data, delimiter)
 
         stream = StringIO(data.strip())
         reader = csv.reader(stream, dialect=dialect)
@@ -174,3 +209,148 @@ class BulkImportForm(SyncedDataMixin, forms.Form):
             })
 
         return records
+
+
+def iter_import_records(stream, format, csv_delimiter=CSVDelimiterChoices.AUTO):
+    """
+    Parse import data incrementally from a text stream. CSV rows and YAML documents are parsed as the returned iterator
+    is consumed; JSON data must be parsed in its entirety. Returns a tuple of the CSV headers (or None) and an iterator
+    of records.
+
+    Args:
+        stream: A text stream from which to read the import data
+        format: The format of the data (CSV, JSON, or YAML)
+        csv_delimiter: The CSV delimiter (if applicable)
+    """
+    if format == ImportFormatChoices.CSV:
+        # Detect the dialect from a sample of complete lines
+        sample = stream.read(CSV_SNIFF_SIZE)
+        if len(sample) == CSV_SNIFF_SIZE and '\n' in sample:
+            sample = sample.rsplit('\n', 1)[0]
+        dialect = BulkImportForm.get_csv_dialect(sample, delimiter=csv_delimiter)
+        stream.seek(0)
+        # Ignore any blank lines
+        reader = (row for row in csv.reader(stream, dialect=dialect) if row)
+        headers = parse_csv_headers(next(reader, []))
+        records = iter_csv_records(reader, headers.copy())
+        headers.pop('id', None)
+        return headers, records
+
+    if format == ImportFormatChoices.JSON:
+        try:
+            data = json.load(stream)
+        except json.decoder.JSONDecodeError as err:
+            raise forms.ValidationError(f"Invalid JSON data: {err}")
+        return None, iter(data if type(data) is list else [data])
+
+    if format == ImportFormatChoices.YAML:
+        def iter_yaml_records():
+            try:
+                for data in yaml.load_all(stream, Loader=yaml.SafeLoader):
+                    if type(data) is list:
+                        yield from data
+                    elif type(data) is dict:
+                        yield data
+                    else:
+                        raise forms.ValidationError(_(
+                            "Invalid YAML data. Data must be in the form of multiple documents, or a single document "
+                            "comprising a list of dictionaries."
+                        ))
+            except yaml.error.YAMLError as err:
+                raise forms.ValidationError(f"Invalid YAML data: {err}")
+        return None, iter_yaml_records()
+
+    raise forms.ValidationError(_("Unknown data format: {format}").format(format=format))
+
+
+class CSVObjectCache:
+    """
+    Caches the related objects resolved by CSVModelChoiceFields across all records of a bulk import. The first time a
+    field is bound, the values specified for it by all records are resolved using a single query. Objects resolved
+    individually thereafter (e.g. where a form has restricted the field's queryset) are cached as well.
+
+    Args:
+        records: The list of records (dictionaries) being imported
+    """
+    def __init__(self, records):
+        self.records = records
+        self._objects = {}
+        self._prefetched_fields = set()
+
+    @staticmethod
+    def _get_key(queryset, to_field_name):
+        # Objects are cached per distinct queryset filter, as forms may restrict a field's queryset for each record
+        key = (queryset.model, to_field_name or 'pk', queryset.query.where)
+        try:
+            hash(key)
+        except (AttributeError, TypeError):
+            return None
+        return key
+
+    def bind(self, form):
+        """
+        Attach the cache to all applicable fields of a bound form, prefetching the objects referenced by each field.
+        """
+        for name, field in form.fields.items():
+            # Skip any fields other than CSVModelChoiceFields (including subclasses which resolve values differently)
+            if type(field).to_python is not CSVModelChoiceField.to_python:
+                continue
+            field.object_cache = self
+
+            if name not in self._prefetched_fields:
+                self._prefetched_fields.add(name)
+                values = set()
+                for record in self.records:
+                    value = record.get(name)
+                    if isinstance(value, (str, int)) and value not in field.empty_values:
+                        values.add(value)
+                self.prefetch(field.queryset, field.to_field_name, values)
+
+    def prefetch(self, queryset, to_field_name, values):
+        """
+        Resolve and cache the objects identified by the given values using a single query. Values which do not match
+        exactly one object are not cached, and will be resolved (and validated) individually by the field.
+        """
+        if not values or (key := self._get_key(queryset, to_field_name)) is None:
+            return
+        try:
+            model_field = queryset.model._meta.get_field(to_field_name or queryset.model._meta.pk.name)
+        except FieldDoesNotExist:
+            return
+        if not model_field.concrete or model_field.is_relation:
+            return
+
+        # Map each valid value to its Python representation
+        lookup = defaultdict(list)
+        for value in values:
+            try:
+                lookup[model_field.to_python(value)].append(value)
+            except (TypeError, ValidationError):
+                continue
+        if not lookup:
+            return
+
+        matches = defaultdict(list)
+        for obj in queryset.filter(**{f'{model_field.name}__in': list(lookup)}):
+            matches[getattr(obj, model_field.attname)].append(obj)
+
+        cache = self._objects.setdefault(key, {})
+        for python_value, objects in matches.items():
+            if len(objects) == 1:
+                for value in lookup.get(python_value, []):
+                    cache[value] = objects[0]
+
+    def get(self, queryset, to_field_name, value):
+        """
+        Return the cached object for the given value, or None.
+        """
+        if (key := self._get_key(queryset, to_field_name)) is None:
+            return None
+        return self._objects.get(key, {}).get(value)
+
+    def set(self, queryset, to_field_name, value, obj):
+        """
+        Cache an object resolved for the given value.
+        """
+        if (key := self._get_key(queryset, to_field_name)) is not None:
+            self._objects.setdefault(key, {})[value] = obj
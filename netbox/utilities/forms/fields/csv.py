@@ -56,10 +56,15 @@ class CSVModelChoiceField(forms.ModelChoiceField):
     default_error_messages = {
         'invalid_choice': _('Object not found: %(value)s'),
     }
+    # Set by CSVObjectCache to share resolved objects among the forms of a bulk import
+    object_cache = None
 
     def to_python(self, value):
+        cacheable = self.object_cache is not None and isinstance(value, (str, int))
+        if cacheable and (obj := self.object_cache.get(self.queryset, self.to_field_name, value)) is not None:
+            return obj
         try:
-            return super().to_python(value)
+            obj = super().to_python(value)
         except MultipleObjectsReturned:
             raise forms.ValidationError(
                 _('"{value}" is not a unique value for this field; multiple objects were found').format(value=value)
@@ -68,6 +73,9 @@ class CSVModelChoiceField(forms.ModelChoiceField):
             raise forms.ValidationError(
                 _('"{field_name}" is an invalid accessor field name.').format(field_name=self.to_field_name)
             )
+        if cacheable and obj is not None:
+            self.object_cache.set(self.queryset, self.to_field_name, value, obj)
+        return obj
 
 
 class CSVModelMultipleChoiceField(forms.ModelMultipleChoiceField):
@@ -15,10 +15,12 @@ __all__ = (
     'form_from_model',
     'get_field_value',
     'get_selected_values',
+    'iter_csv_records',
     'parse_alphanumeric_range',
     'parse_numeric_range',
     'restrict_form_fields',
     'parse_csv',
+    'parse_csv_headers',
     'validate_csv',
 )
 
@@ -220,14 +222,23 @@ def parse_csv(reader):
     Parse a csv_reader object into a headers dictionary and a list of records dictionaries. Raise an error
     if the records are formatted incorrectly. Return headers and records as a tuple.
     """
-    records = []
+    headers = parse_csv_headers(next(reader))
+    records = list(iter_csv_records(reader, headers))
+
+    return headers, records
+
+
+def parse_csv_headers(row):
+    """
+    Parse the first row of CSV data into a headers dictionary.
+    """
     headers = {}
 
     # Consume the first line of CSV data as column headers. Create a dictionary mapping each header to an optional
     # "to" field specifying how the related object is being referenced. For example, importing a Device might use a
     # `site.slug` header, to indicate the related site is being referenced by its slug.
 
-    for header in next(reader):
+    for header in row:
         header = header.strip()
         if '.' in header:
             field, to_field = header.split('.', 1)
@@ -243,7 +254,15 @@ def parse_csv(reader):
                 ))
             headers[header] = None
 
-    # Parse CSV rows into a list of dictionaries mapped from the column headers.
+    return headers
+
+
+def iter_csv_records(reader, headers):
+    """
+    Yield a dictionary for each remaining row of a csv_reader object, mapped from the given column headers. Raise an
+    error if a row is formatted incorrectly.
+    """
+    # Parse CSV rows into dictionaries mapped from the column headers.
     for i, row in enumerate(reader, start=1):
         if len(row) != len(headers):
             raise forms.ValidationError(
@@ -252,10 +271,7 @@ def parse_csv(reader):
                 )
             )
         row = [col.strip() for col in row]
-        record = dict(zip(headers.keys(), row))
-        records.append(record)
-
-    return headers, records
+        yield dict(zip(headers.keys(), row))
 
 
 def validate_csv(headers, fields, required_fields):
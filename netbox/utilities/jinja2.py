@@ -1,3 +1,7 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
 from django.apps import apps
 from jinja2 import BaseLoader, TemplateNotFound
 from jinja2.meta import find_referenced_templates
@@ -7,9 +11,17 @@ from netbox.config import get_config
 
 __all__ = (
     'DataFileLoader',
+    'clear_template_cache',
     'render_jinja2',
+    'stream_jinja2',
 )
 
+# Maximum number of compiled templates to retain in the process-local cache
+TEMPLATE_CACHE_SIZE = 256
+
+# Minimum size (in characters) of each chunk of streamed template output
+STREAM_BUFFER_SIZE = 65536
+
 
 class DataFileLoader(BaseLoader):
     """
@@ -45,17 +57,110 @@ class DataFileLoader(BaseLoader):
         self._template_cache.update(templates)
 
 
+class TemplateCache:
+    """
+    A thread-safe LRU cache of Jinja2 environments and compiled templates. Entries are keyed by the content they
+    were built from (template code hash, environment parameters, and DataFile revision), so any change to a
+    template or to its synced DataFile produces a new key; stale entries simply age out.
+    """
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, factory):
+        """
+        Return the cached value for key, calling factory() to build and store it on a miss.
+        """
+        with self._lock:
+            try:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            except KeyError:
+                pass
+
+        value = factory()
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_template_cache = TemplateCache(TEMPLATE_CACHE_SIZE)
+
+
+def _freeze(value):
+    """
+    Convert a (possibly nested) set of environment parameters into a hashable cache key component.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return ('__id__', id(value))
+    return value
+
+
+def _get_data_file_revision(data_file):
+    """
+    Return a key identifying the current revision of a DataFile and of the DataSource it belongs to. The latter
+    ensures that templates included from other files in the same source are refreshed after each sync.
+    """
+    return data_file.pk, data_file.hash, data_file.source_id, data_file.source.last_synced
+
+
+def clear_template_cache():
+    """
+    Discard all cached Jinja2 environments and compiled templates.
+    """
+    _template_cache.clear()
+
+
 #
 # Utility functions
 #
 
-def render_jinja2(template_code, context, environment_params=None, data_file=None):
+def get_jinja2_template(template_code, environment_params=None, data_file=None):
     """
-    Render a Jinja2 template with the provided context. Return the rendered content.
+    Return the compiled Jinja2 template for the given template code.
+
+    Environments and compiled templates are cached per process, keyed by the template code, the environment
+    parameters, and (if applicable) the DataFile revision. A custom loader passed in environment_params bypasses
+    the cache, since its templates may change independently of the template code.
     """
-    environment_params = environment_params or {}
+    environment_params = dict(environment_params or {})
 
-    if 'loader' not in environment_params:
+    if 'loader' in environment_params:
+        environment = SandboxedEnvironment(**environment_params)
+        environment.filters.update(get_config().JINJA2_FILTERS)
+        if data_file:
+            return environment.get_template(data_file.path)
+        return environment.from_string(source=template_code)
+
+    code_hash = hashlib.sha256(template_code.encode('utf-8')).hexdigest()
+    data_file_key = _get_data_file_revision(data_file) if data_file else None
+    environment_key = (
+        'environment',
+        _freeze(environment_params),
+        # The DataFileLoader holds the template source, so DataFile-backed environments are bound to the code
+        (data_file_key, code_hash) if data_file else None,
+    )
+
+    def build_environment():
         if data_file:
             loader = DataFileLoader(data_file.source)
             loader.cache_templates({
@@ -63,13 +168,45 @@ def render_jinja2(template_code, context, environment_params=None, data_file=Non
             })
         else:
             loader = BaseLoader()
-        environment_params['loader'] = loader
+        return SandboxedEnvironment(loader=loader, **environment_params)
 
-    environment = SandboxedEnvironment(**environment_params)
+    environment = _template_cache.get(environment_key, build_environment)
     environment.filters.update(get_config().JINJA2_FILTERS)
 
-    if data_file:
-        template = environment.get_template(data_file.path)
-    else:
-        template = environment.from_string(source=template_code)
+    def build_template():
+        if data_file:
+            return environment.get_template(data_file.path)
+        return environment.from_string(source=template_code)
+
+    return _template_cache.get(('template', environment_key, code_hash), build_template)
+
+
+def render_jinja2(template_code, context, environment_params=None, data_file=None):
+    """
+    Render a Jinja2 template with the provided context. Return the rendered content.
+    """
+    template = get_jinja2_template(template_code, environment_params, data_file)
     return template.render(**context)
+
+
+def stream_jinja2(template_code, context, environment_params=None, data_file=None, buffer_size=STREAM_BUFFER_SIZE):
+    """
+    Render a Jinja2 template with the provided context incrementally. Returns an iterator which yields the rendered
+    content in chunks of at least buffer_size characters (except for the last).
+    """
+    template = get_jinja2_template(template_code, environment_params, data_file)
+
+    def _stream():
+        buffer = []
+        length = 0
+        for chunk in template.generate(**context):
+            buffer.append(chunk)
+            length += len(chunk)
+            if length >= buffer_size:
+                yield ''.join(buffer)
+                buffer = []
+                length = 0
+        if buffer:
+            yield ''.join(buffer)
+
+    return _stream()
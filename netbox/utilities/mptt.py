@@ -1,3 +1,5 @@
+from contextlib import contextmanager
+
 from mptt.managers import TreeManager as TreeManager_
 from mptt.querysets import TreeQuerySet as TreeQuerySet_
 
@@ -7,9 +9,23 @@ from .querysets import RestrictedQuerySet
 __all__ = (
     'TreeManager',
     'TreeQuerySet',
+    'get_tree_ids',
 )
 
 
+def get_tree_ids(node):
+    """
+    Return the IDs of the trees affected by saving the given node: the tree to which it belongs, and the tree to which
+    its parent (if any) belongs.
+    """
+    opts = node._mptt_meta
+    tree_ids = {getattr(node, opts.tree_id_attr)}
+    if parent := getattr(node, opts.parent_attr):
+        tree_ids.add(getattr(parent, opts.tree_id_attr))
+    tree_ids.discard(None)
+    return tree_ids
+
+
 class TreeQuerySet(TreeQuerySet_, RestrictedQuerySet):
     """
     Mate django-mptt's TreeQuerySet with our RestrictedQuerySet for permissions enforcement.
@@ -21,4 +37,59 @@ class TreeManager(Manager.from_queryset(TreeQuerySet), TreeManager_):
     """
     Extend django-mptt's TreeManager to incorporate RestrictedQuerySet().
     """
-    pass
+    def rebuild_trees(self, tree_ids, batch_size=1000):
+        """
+        Rebuild only the trees with the given IDs using their parent links. Unlike partial_rebuild(), this allows for
+        nodes having been moved between the specified trees, or made root nodes, while MPTT updates were disabled.
+        Existing tree IDs are reassigned to the resulting trees. If the number of trees has changed (e.g. because a root
+        node was created or removed), all trees are rebuilt instead, since tree IDs also determine the order of root
+        nodes.
+        """
+        tree_ids = set(tree_ids)
+        if not tree_ids:
+            return
+        self._find_out_rebuild_fields()
+
+        parents = self._get_parents(tree_id__in=tree_ids)
+        children = self._get_children(tree_id__in=tree_ids)
+
+        # Nodes created while MPTT updates were disabled may have been assigned a placeholder tree ID of zero
+        available_tree_ids = sorted(tree_id for tree_id in tree_ids if tree_id > 0)
+
+        # Allocating new tree IDs would place any new roots after all existing trees, regardless of their ordering
+        if len(parents) != len(available_tree_ids):
+            self.rebuild(batch_size=batch_size)
+            return
+
+        nodes_to_update = []
+        for parent, tree_id in zip(parents, available_tree_ids):
+            self._rebuild_helper(
+                node=parent,
+                left=1,
+                tree_id=tree_id,
+                children=children,
+                nodes_to_update=nodes_to_update,
+                level=0
+            )
+        self.bulk_update(nodes_to_update, self._rebuild_fields.values(), batch_size=batch_size)
+
+    rebuild_trees.alters_data = True
+
+    @contextmanager
+    def delay_tree_rebuild(self):
+        """
+        Context manager which disables MPTT updates for the duration of the block, and afterward rebuilds only the
+        affected trees. Yields a set to which the IDs of affected trees must be added (see get_tree_ids()) as each
+        node is saved. If an exception is raised within the block, no rebuild is performed.
+
+        Usage:
+
+            with MyModel.objects.delay_tree_rebuild() as tree_ids:
+                node.parent = new_parent
+                node.save()
+                tree_ids.update(get_tree_ids(node))
+        """
+        tree_ids = set()
+        with self.disable_mptt_updates():
+            yield tree_ids
+        self.rebuild_trees(tree_ids)
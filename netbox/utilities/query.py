@@ -1,4 +1,5 @@
 from django.db.models import Count, OuterRef, Subquery, QuerySet
+from django.db.models.constants import LOOKUP_SEP
 from django.db.models.functions import Coalesce
 
 from utilities.mptt import TreeManager
@@ -6,6 +7,7 @@ from utilities.mptt import TreeManager
 __all__ = (
     'count_related',
     'dict_to_filter_params',
+    'is_valid_prefetch',
     'reapply_model_ordering',
 )
 
@@ -72,3 +74,23 @@ def reapply_model_ordering(queryset: QuerySet) -> QuerySet:
 
     ordering = queryset.model._meta.ordering
     return queryset.order_by(*ordering)
+
+
+def is_valid_prefetch(model, lookup):
+    """
+    Return True if the given lookup (e.g. "interfaces__ip_addresses") can be passed to prefetch_related() for the
+    model, i.e. each step of the lookup names a relationship by its accessor.
+    """
+    for name in lookup.split(LOOKUP_SEP):
+        if model is None:
+            # The model related by the previous step cannot be determined (e.g. a generic foreign key)
+            return True
+        for field in model._meta.get_fields():
+            accessor = field.get_accessor_name() if field.auto_created and not field.concrete else field.name
+            if field.is_relation and accessor == name:
+                model = field.related_model
+                break
+        else:
+            return False
+
+    return True
@@ -1,4 +1,8 @@
-from django.db.models import Prefetch, QuerySet
+from functools import lru_cache
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch, Q, QuerySet
+from django.db.models.constants import LOOKUP_SEP
 
 from users.constants import CONSTRAINT_TOKEN_USER
 from utilities.permissions import get_permission_for_model, permission_is_exempt, qs_filter_from_constraints
@@ -58,13 +62,66 @@ class RestrictedQuerySet(QuerySet):
 
         # Filter the queryset to include only objects with allowed attributes
         else:
+            attrs, multivalued = self._get_permission_filter(user, permission_required)
+            if multivalued:
+                # #8715: Avoid duplicates when JOIN on many-to-many fields without using DISTINCT.
+                # DISTINCT acts globally on the entire request, which may not be desirable.
+                allowed_objects = self.model.objects.filter(attrs)
+                qs = self.filter(pk__in=allowed_objects)
+            else:
+                # Constraints which span only single-valued relationships can be applied directly, avoiding a subquery
+                qs = self.filter(attrs)
+
+        return qs
+
+    def _get_permission_filter(self, user, permission_required):
+        """
+        Return the Q filter compiled from the user's constraints for the given permission, and whether it traverses a
+        multi-valued relationship. Filters are cached on the user instance (alongside its permissions) so that each is
+        compiled only once per request.
+        """
+        if not hasattr(user, '_object_perm_filter_cache'):
+            user._object_perm_filter_cache = {}
+        if permission_required not in user._object_perm_filter_cache:
             tokens = {
                 CONSTRAINT_TOKEN_USER: user,
             }
             attrs = qs_filter_from_constraints(user._object_perm_cache[permission_required], tokens)
-            # #8715: Avoid duplicates when JOIN on many-to-many fields without using DISTINCT.
-            # DISTINCT acts globally on the entire request, which may not be desirable.
-            allowed_objects = self.model.objects.filter(attrs)
-            qs = self.filter(pk__in=allowed_objects)
+            multivalued = any(
+                _traverses_multivalued_relation(self.model, lookup) for lookup in _get_filter_lookups(attrs)
+            )
+            user._object_perm_filter_cache[permission_required] = (attrs, multivalued)
 
-        return qs
+        return user._object_perm_filter_cache[permission_required]
+
+
+def _get_filter_lookups(q):
+    """
+    Yield the field lookups referenced by a Q object.
+    """
+    for child in q.children:
+        if isinstance(child, Q):
+            yield from _get_filter_lookups(child)
+        else:
+            yield child[0]
+
+
+@lru_cache(maxsize=None)
+def _traverses_multivalued_relation(model, lookup):
+    """
+    Return True if the given field lookup traverses a one-to-many or many-to-many relationship (in which case
+    filtering on it may yield duplicate results).
+    """
+    for name in lookup.split(LOOKUP_SEP):
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            # A lookup or transform (e.g. "in" or "isnull")
+            return False
+        if field.many_to_many or field.one_to_many:
+            return True
+        if not field.is_relation or field.related_model is None:
+            return False
+        model = field.related_model
+
+    return False
@@ -3,12 +3,14 @@ from urllib.parse import urlparse
 from django.utils.http import url_has_allowed_host_and_scheme
 from django.utils.translation import gettext_lazy as _
 from netaddr import AddrFormatError, IPAddress
+from rest_framework.fields import BooleanField
 
 from .constants import HTTP_REQUEST_META_SAFE_COPY
 
 __all__ = (
     'NetBoxFakeRequest',
     'copy_safe_request',
+    'get_boolean_param',
     'get_client_ip',
     'safe_for_redirect',
 )
@@ -53,6 +55,14 @@ def copy_safe_request(request):
     })
 
 
+def get_boolean_param(params, name):
+    """
+    Return True if the named query parameter holds a true value, as interpreted by the REST API (e.g. "true", "1",
+    or "yes").
+    """
+    return params.get(name) in BooleanField.TRUE_VALUES
+
+
 def get_client_ip(request, additional_headers=()):
     """
     Return the client (source) IP address of the given request.
@@ -154,6 +154,20 @@ class APIViewTestCases:
             self.assertEqual(len(response.data['results']), self._get_queryset().count())
             self.assertEqual(sorted(response.data['results'][0]), self.brief_fields)
 
+        def test_list_objects_representation(self):
+            """
+            Compare the representation of each object in a list response (which employs the compiled representation
+            path) with that returned for the object individually.
+            """
+            self.add_permissions(f'{self.model._meta.app_label}.view_{self.model._meta.model_name}')
+            response = self.client.get(self._get_list_url(), **self.header)
+            self.assertHttpStatus(response, status.HTTP_200_OK)
+
+            for result in json.loads(response.content)['results']:
+                url = self._get_detail_url(self._get_queryset().get(pk=result['id']))
+                detail = json.loads(self.client.get(url, **self.header).content)
+                self.assertEqual(json.dumps(result), json.dumps(detail))
+
         def test_list_objects_without_permission(self):
             """
             GET a list of objects as an authenticated user without the required permission.
@@ -1,14 +1,18 @@
+import json
+
 from django.test import Client, TestCase, override_settings
 from django.urls import reverse
 from drf_spectacular.drainage import GENERATOR_STATS
 from rest_framework import status
 
 from core.models import ObjectType
+from dcim.api.serializers import SiteSerializer
 from dcim.models import Region, Site
 from extras.choices import CustomFieldTypeChoices
 from extras.models import CustomField
 from ipam.models import VLAN
 from netbox.config import get_config
+from utilities.api import get_prefetches_for_serializer
 from utilities.testing import APITestCase, disable_warnings
 
 
@@ -122,6 +126,26 @@ class WritableNestedSerializerTest(APITestCase):
         self.assertEqual(VLAN.objects.count(), 0)
 
 
+class SerializerFieldsTestCase(TestCase):
+
+    def test_requested_fields(self):
+        serializer = SiteSerializer(fields=['id', 'name', 'region'])
+        self.assertEqual(list(serializer.fields), ['id', 'name', 'region'])
+
+        # Each serializer instance must receive its own copy of the cached fields
+        other_serializer = SiteSerializer(fields=['id', 'name', 'region'])
+        self.assertIsNot(serializer.fields['region'], other_serializer.fields['region'])
+        self.assertIs(other_serializer.fields['region'].parent, other_serializer)
+
+    def test_prefetches_for_serializer(self):
+        prefetches = get_prefetches_for_serializer(SiteSerializer, ['id', 'region', 'tenant'])
+        expected = list(prefetches)
+
+        # Modifying the returned list must not affect subsequent calls
+        prefetches.append('group')
+        self.assertEqual(get_prefetches_for_serializer(SiteSerializer, ['id', 'region', 'tenant']), expected)
+
+
 class APIPaginationTestCase(APITestCase):
     user_permissions = ('dcim.view_site',)
 
@@ -181,11 +205,30 @@ class APIPaginationTestCase(APITestCase):
     def test_max_page_size_disabled(self):
         response = self.client.get(f'{self.url}?limit=0', format='json', **self.header)
 
+        # Unpaginated responses are streamed
         self.assertHttpStatus(response, status.HTTP_200_OK)
-        self.assertEqual(response.data['count'], 100)
-        self.assertIsNone(response.data['next'])
-        self.assertIsNone(response.data['previous'])
-        self.assertEqual(len(response.data['results']), 100)
+        data = json.loads(b''.join(response.streaming_content))
+        self.assertEqual(data['count'], 100)
+        self.assertIsNone(data['next'])
+        self.assertIsNone(data['previous'])
+        self.assertEqual(len(data['results']), 100)
+
+    @override_settings(MAX_PAGE_SIZE=0)
+    def test_ndjson(self):
+        response = self.client.get(f'{self.url}?limit=0', HTTP_ACCEPT='application/x-ndjson', **self.header)
+
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        lines = b''.join(response.streaming_content).splitlines()
+        self.assertEqual(len(lines), 100)
+        self.assertEqual(json.loads(lines[0])['name'], 'Site 1')
+
+    def test_ndjson_paginated(self):
+        response = self.client.get(f'{self.url}?limit=10', HTTP_ACCEPT='application/x-ndjson', **self.header)
+
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(len(b''.join(response.streaming_content).splitlines()), 10)
+        self.assertIn('offset=10', response['Link'])
 
 
 class APIOrderingTestCase(APITestCase):
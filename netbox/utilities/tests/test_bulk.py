@@ -0,0 +1,70 @@
+import uuid
+
+from django.test import TestCase
+
+from core.choices import ObjectChangeActionChoices
+from core.models import ObjectChange
+from dcim.models import Cable, Site
+from utilities.bulk import bulk_delete, bulk_save, supports_bulk_save
+from virtualization.models import Cluster, ClusterType
+
+
+class BulkDeleteTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        sites = [Site(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 6)]
+        Site.objects.bulk_create(sites)
+        ObjectChange.objects.bulk_create([
+            ObjectChange(
+                user_name='user1',
+                request_id=uuid.uuid4(),
+                action=ObjectChangeActionChoices.ACTION_CREATE,
+                changed_object=site,
+                object_repr=str(site)
+            ) for site in sites
+        ])
+
+    def test_bulk_delete_raw(self):
+        progress = []
+        queryset = ObjectChange.objects.exclude(object_repr='Site 5')
+        deleted_count = bulk_delete(queryset, batch_size=3, callback=progress.append)
+
+        self.assertEqual(deleted_count, 4)
+        self.assertEqual(progress, [3, 4])
+        self.assertEqual(list(ObjectChange.objects.values_list('object_repr', flat=True)), ['Site 5'])
+
+    def test_bulk_delete_with_dependents(self):
+        deleted_count = bulk_delete(Site.objects.all(), batch_size=2)
+
+        self.assertEqual(deleted_count, 5)
+        self.assertFalse(Site.objects.exists())
+
+
+class BulkSaveTest(TestCase):
+
+    def test_supports_bulk_save(self):
+        self.assertTrue(supports_bulk_save(Site))
+        # Overrides save()
+        self.assertFalse(supports_bulk_save(Cable))
+        # Has a post_save receiver connected specifically for the model
+        self.assertFalse(supports_bulk_save(Cluster))
+
+    def test_bulk_save(self):
+        sites = [Site(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 4)]
+        Site.objects.bulk_create(sites)
+        for site in sites:
+            site.description = 'New description'
+        bulk_save(Site, sites, update_fields=['description'])
+
+        self.assertEqual(Site.objects.filter(description='New description').count(), 3)
+
+    def test_bulk_save_fallback(self):
+        cluster_type = ClusterType.objects.create(name='Cluster Type 1', slug='cluster-type-1')
+        clusters = [Cluster(name=f'Cluster {i}', type=cluster_type) for i in range(1, 4)]
+        Cluster.objects.bulk_create(clusters)
+        for cluster in clusters:
+            cluster.description = 'New description'
+        bulk_save(Cluster, clusters, update_fields=['description'])
+
+        self.assertEqual(Cluster.objects.filter(description='New description').count(), 3)
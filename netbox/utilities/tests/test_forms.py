@@ -1,9 +1,12 @@
+from io import StringIO
+
 from django import forms
 from django.test import TestCase
 
 from dcim.models import Site
 from netbox.choices import ImportFormatChoices
-from utilities.forms.bulk_import import BulkImportForm
+from utilities.forms.bulk_import import BulkImportForm, CSVObjectCache, iter_import_records
+from utilities.forms.fields import CSVModelChoiceField
 from utilities.forms.forms import BulkRenameForm
 from utilities.forms.utils import get_field_value, expand_alphanumeric_pattern, expand_ipaddress_pattern
 
@@ -376,6 +379,72 @@ class ImportFormTest(TestCase):
             {'a': '4', 'b': '5', 'c': '6'},
         ])
 
+    def test_iter_import_records(self):
+        data = (
+            "id,a,b.slug\n"
+            "1,x,y\n"
+            "\n"
+            "2, z ,w\n"
+        )
+        headers, records = iter_import_records(StringIO(data), ImportFormatChoices.CSV, csv_delimiter=',')
+        self.assertEqual(headers, {'a': None, 'b': 'slug'})
+        self.assertEqual(list(records), [
+            {'id': '1', 'a': 'x', 'b': 'y'},
+            {'id': '2', 'a': 'z', 'b': 'w'},
+        ])
+
+        data = (
+            "---\n"
+            "a: 1\n"
+            "---\n"
+            "- a: 2\n"
+            "- a: 3\n"
+        )
+        headers, records = iter_import_records(StringIO(data), ImportFormatChoices.YAML)
+        self.assertIsNone(headers)
+        self.assertEqual(list(records), [{'a': 1}, {'a': 2}, {'a': 3}])
+
+        with self.assertRaises(forms.ValidationError):
+            iter_import_records(StringIO('[{"a": 1'), ImportFormatChoices.JSON)
+
+
+class CSVObjectCacheTest(TestCase):
+
+    class SiteForm(forms.Form):
+        site = CSVModelChoiceField(queryset=Site.objects.all(), to_field_name='name')
+
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.bulk_create([
+            Site(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 4)
+        ])
+
+    def test_prefetch_related_objects(self):
+        records = [{'site': f'Site {i % 3 + 1}'} for i in range(9)]
+        object_cache = CSVObjectCache(records)
+
+        # All referenced objects should be resolved by a single query
+        with self.assertNumQueries(1):
+            for record in records:
+                form = self.SiteForm(data=record)
+                object_cache.bind(form)
+                self.assertTrue(form.is_valid())
+                self.assertEqual(form.cleaned_data['site'].name, record['site'])
+
+    def test_invalid_value(self):
+        records = [{'site': 'Site 1'}, {'site': 'Site 4'}]
+        object_cache = CSVObjectCache(records)
+
+        form = self.SiteForm(data=records[0])
+        object_cache.bind(form)
+        self.assertTrue(form.is_valid())
+
+        # Values not resolved by the prefetch are validated individually
+        form = self.SiteForm(data=records[1])
+        object_cache.bind(form)
+        self.assertFalse(form.is_valid())
+        self.assertIn('site', form.errors)
+
 
 class BulkRenameFormTest(TestCase):
     def test_no_strip_whitespace(self):
@@ -0,0 +1,90 @@
+import hashlib
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from core.models import DataFile, DataSource
+from utilities.jinja2 import _template_cache, clear_template_cache, render_jinja2, stream_jinja2
+
+
+class RenderJinja2TestCase(TestCase):
+
+    def setUp(self):
+        clear_template_cache()
+
+    def test_render(self):
+        self.assertEqual(render_jinja2('Hello {{ name }}', {'name': 'World'}), 'Hello World')
+
+    def test_compiled_template_reused(self):
+        render_jinja2('{{ foo }}', {'foo': 1})
+        cache_size = len(_template_cache)
+        self.assertEqual(render_jinja2('{{ foo }}', {'foo': 2}), '2')
+        self.assertEqual(len(_template_cache), cache_size)
+
+    def test_template_change(self):
+        self.assertEqual(render_jinja2('A{{ foo }}', {'foo': 1}), 'A1')
+        self.assertEqual(render_jinja2('B{{ foo }}', {'foo': 1}), 'B1')
+
+    def test_environment_params(self):
+        template_code = '{% if True %}\nfoo\n{% endif %}'
+        self.assertEqual(render_jinja2(template_code, {}), '\nfoo\n')
+        self.assertEqual(render_jinja2(template_code, {}, {'trim_blocks': True}), 'foo\n')
+
+    def test_stream(self):
+        template_code = '{% for i in items %}{{ i }},{% endfor %}'
+        context = {'items': range(100)}
+        chunks = list(stream_jinja2(template_code, context, buffer_size=50))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(''.join(chunks), render_jinja2(template_code, context))
+
+
+class DataFileTemplateTestCase(TestCase):
+
+    def setUp(self):
+        clear_template_cache()
+        self.source = DataSource.objects.create(
+            name='Data Source 1',
+            type='local',
+            source_url='file:///var/tmp/source1/',
+            last_synced=timezone.now()
+        )
+        self.template = self.create_data_file('template.j2', 'Hello {% include "name.j2" %}')
+        self.include = self.create_data_file('name.j2', 'World')
+
+    def create_data_file(self, path, content):
+        return DataFile.objects.create(
+            source=self.source,
+            path=path,
+            last_updated=timezone.now(),
+            size=len(content),
+            hash=hashlib.sha256(content.encode()).hexdigest(),
+            data=content.encode()
+        )
+
+    @staticmethod
+    def update_data_file(data_file, content):
+        data_file.data = content.encode()
+        data_file.size = len(content)
+        data_file.hash = hashlib.sha256(content.encode()).hexdigest()
+        data_file.save()
+
+    def render(self):
+        self.template.refresh_from_db()
+        return render_jinja2(self.template.data_as_string, {}, data_file=self.template)
+
+    def test_data_file_changed(self):
+        self.assertEqual(self.render(), 'Hello World')
+
+        self.update_data_file(self.template, 'Goodbye {% include "name.j2" %}')
+        self.assertEqual(self.render(), 'Goodbye World')
+
+    def test_included_data_file_changed(self):
+        self.assertEqual(self.render(), 'Hello World')
+
+        # A change to an included file is reflected once its source has been synced
+        self.update_data_file(self.include, 'NetBox')
+        self.assertEqual(self.render(), 'Hello World')
+        self.source.last_synced = timezone.now() + timedelta(seconds=1)
+        self.source.save()
+        self.assertEqual(self.render(), 'Hello NetBox')
@@ -0,0 +1,95 @@
+from django.test import TestCase
+
+from dcim.models import Region
+from utilities.mptt import get_tree_ids
+
+
+class TreeManagerTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        regions = (
+            Region(name='Region A', slug='region-a'),
+            Region(name='Region B', slug='region-b'),
+            Region(name='Region C', slug='region-c'),
+        )
+        for region in regions:
+            region.save()
+        for i, parent in enumerate(regions[:2], start=1):
+            Region(name=f'{parent.name}{i}', slug=f'{parent.slug}{i}', parent=parent).save()
+
+    def test_delay_tree_rebuild(self):
+        region_a, region_b, region_c = Region.objects.filter(parent__isnull=True).order_by('name')
+        untouched_tree_id = region_c.tree_id
+
+        with Region.objects.delay_tree_rebuild() as tree_ids:
+            # Move a child node to a different tree
+            region_a1 = Region.objects.get(name='Region A1')
+            region_a1.parent = region_b
+            region_a1.save()
+            tree_ids.update(get_tree_ids(region_a1))
+
+            # Create a new root node
+            region_d = Region(name='Region D', slug='region-d')
+            region_d.save()
+            tree_ids.update(get_tree_ids(region_d))
+
+        self.assertEqual(tree_ids, {region_a.tree_id, region_b.tree_id, 0})
+
+        for region in (region_a, region_b, region_c, region_d):
+            region.refresh_from_db()
+        self.assertEqual(region_a.get_descendant_count(), 0)
+        self.assertEqual(region_b.get_descendant_count(), 2)
+        self.assertEqual(
+            list(region_b.get_descendants().values_list('name', flat=True)),
+            ['Region A1', 'Region B2']
+        )
+        self.assertEqual((region_d.lft, region_d.rght, region_d.level), (1, 2, 0))
+
+        self.assertEqual(region_c.tree_id, untouched_tree_id)
+        self.assertEqual(
+            len({region_a.tree_id, region_b.tree_id, region_c.tree_id, region_d.tree_id}),
+            4
+        )
+
+    def test_delay_tree_rebuild_moved_nodes(self):
+        region_a, region_b, region_c = Region.objects.filter(parent__isnull=True).order_by('name')
+
+        with Region.objects.delay_tree_rebuild() as tree_ids:
+            # Swap the children of two trees
+            region_a1 = Region.objects.get(name='Region A1')
+            region_b2 = Region.objects.get(name='Region B2')
+            region_a1.parent = region_b
+            region_a1.save()
+            tree_ids.update(get_tree_ids(region_a1))
+            region_b2.parent = region_a
+            region_b2.save()
+            tree_ids.update(get_tree_ids(region_b2))
+
+        # Affected trees retain their IDs
+        for region in (region_a, region_b, region_c, region_a1, region_b2):
+            region.refresh_from_db()
+        self.assertEqual(region_a.get_descendant_count(), 1)
+        self.assertEqual(region_b.get_descendant_count(), 1)
+        self.assertEqual(region_b2.tree_id, region_a.tree_id)
+        self.assertEqual(region_a1.tree_id, region_b.tree_id)
+        self.assertEqual(
+            list(Region.objects.filter(parent__isnull=True).values_list('name', flat=True)),
+            ['Region A', 'Region B', 'Region C']
+        )
+
+    def test_delay_tree_rebuild_new_root_ordering(self):
+        with Region.objects.delay_tree_rebuild() as tree_ids:
+            # Create a new root node which sorts before all existing roots
+            region = Region(name='Region 0', slug='region-0')
+            region.save()
+            tree_ids.update(get_tree_ids(region))
+
+        self.assertEqual(
+            list(Region.objects.filter(parent__isnull=True).order_by('tree_id').values_list('name', flat=True)),
+            ['Region 0', 'Region A', 'Region B', 'Region C']
+        )
+        self.assertEqual(
+            list(Region.objects.order_by('tree_id', 'lft').values_list('name', flat=True)),
+            ['Region 0', 'Region A', 'Region A1', 'Region B', 'Region B2', 'Region C']
+        )
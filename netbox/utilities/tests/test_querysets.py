@@ -0,0 +1,51 @@
+from django.test import TestCase, override_settings
+
+from core.models import ObjectType
+from dcim.models import Site
+from extras.models import Tag
+from users.models import ObjectPermission, User
+
+
+class RestrictedQuerySetTest(TestCase):
+    """
+    Verify the operation of RestrictedQuerySet.restrict()
+    """
+    @classmethod
+    def setUpTestData(cls):
+        sites = (
+            Site(name='Site 1', slug='site-1'),
+            Site(name='Site 2', slug='site-2'),
+            Site(name='Site 3', slug='site-3'),
+        )
+        Site.objects.bulk_create(sites)
+        tags = (
+            Tag(name='Tag 1', slug='tag-1'),
+            Tag(name='Tag 2', slug='tag-2'),
+        )
+        Tag.objects.bulk_create(tags)
+        sites[0].tags.set(tags)
+        sites[1].tags.set(tags[:1])
+
+    def assign_permission(self, constraints):
+        user = User.objects.create_user(username='testuser')
+        obj_perm = ObjectPermission.objects.create(name='Test permission', constraints=constraints, actions=['view'])
+        obj_perm.users.add(user)
+        obj_perm.object_types.add(ObjectType.objects.get_for_model(Site))
+        return User.objects.get(pk=user.pk)
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=[])
+    def test_restrict_single_valued_constraints(self):
+        user = self.assign_permission({'slug__in': ['site-1', 'site-2']})
+        queryset = Site.objects.restrict(user, 'view')
+
+        # Constraints should be applied directly to the queryset, rather than as a subquery
+        self.assertNotIn('SELECT', str(queryset.query).split('FROM', 1)[1])
+        self.assertEqual(sorted(queryset.values_list('name', flat=True)), ['Site 1', 'Site 2'])
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=[])
+    def test_restrict_multi_valued_constraints(self):
+        user = self.assign_permission({'tags__slug__in': ['tag-1', 'tag-2']})
+        queryset = Site.objects.restrict(user, 'view')
+
+        # Objects matching multiple related tags should not be duplicated
+        self.assertEqual(sorted(queryset.values_list('name', flat=True)), ['Site 1', 'Site 2'])
@@ -1,7 +1,7 @@
 from django.test import TestCase, RequestFactory
 
 from netaddr import IPAddress
-from utilities.request import get_client_ip
+from utilities.request import get_boolean_param, get_client_ip
 
 
 class GetClientIPTests(TestCase):
@@ -26,3 +26,15 @@ class GetClientIPTests(TestCase):
         request = self.factory.get('/', HTTP_X_FORWARDED_FOR='invalid_ip')
         with self.assertRaises(ValueError):
             get_client_ip(request)
+
+
+class GetBooleanParamTests(TestCase):
+
+    def test_get_boolean_param(self):
+        for value in ('true', 'True', '1', 'yes', 'on'):
+            request = RequestFactory().get('/', {'background': value})
+            self.assertTrue(get_boolean_param(request.GET, 'background'), value)
+        for value in ('false', 'False', '0', 'no', ''):
+            request = RequestFactory().get('/', {'background': value})
+            self.assertFalse(get_boolean_param(request.GET, 'background'), value)
+        self.assertFalse(get_boolean_param(RequestFactory().get('/').GET, 'background'))